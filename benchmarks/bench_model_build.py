@@ -0,0 +1,85 @@
+"""Time model construction against planning horizon for both builders.
+
+Usage::
+
+    python benchmarks/bench_model_build.py --players 600 --horizons 3 5 10 15
+
+Each run generates a synthetic league in a temporary directory, so no network
+access or real projections are needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from engine.matrix_model import build_matrix_model  # noqa: E402
+from solve import _build_sasoptpy_model, prepare_model_data  # noqa: E402
+from synthetic_league import generate_league  # noqa: E402
+
+BUILDERS = {
+    'sasoptpy': _build_sasoptpy_model,
+    'matrix': build_matrix_model,
+}
+
+BASE_OPTIONS = {
+    'tm': 0, 'decay_base': 0.98, 'bench_weight': 0.1, 'ft_value': 10, 'ft_increment': 2.5,
+    'wc_day': 0, 'wc_days': [], 'wc_range': [], 'all_star_day': 0, 'all_star_days': [],
+    'all_star_range': [], 'banned_players': [], 'forced_players': [], 'no_sols': 1,
+    'alternative_solution': '1week_buy', 'threshold_value': 0, 'trf_last_gw': 2,
+    'captain_played': False, 'solve_time': 60,
+}
+
+
+@contextmanager
+def _working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def time_build(builder, data, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        builder(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=600)
+    parser.add_argument('--horizons', type=int, nargs='+', default=[3, 5, 10, 15])
+    parser.add_argument('--builders', nargs='+', default=list(BUILDERS), choices=list(BUILDERS))
+    parser.add_argument('--repeats', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    days_per_week = 4
+    n_weeks = -(-max(args.horizons) // days_per_week) + 1
+
+    with tempfile.TemporaryDirectory() as root, _working_directory(root):
+        league = generate_league(root, n_players=args.players, n_weeks=n_weeks, days_per_week=days_per_week)
+        print(f"{'horizon':>8} {'players':>8} " + ' '.join(f'{name:>10}' for name in args.builders))
+        for horizon in args.horizons:
+            options = {**BASE_OPTIONS, 'horizon': horizon}
+            data = prepare_model_data(league.projections, league.squad, league.sell_prices,
+                                      league.gd, league.itb, options)
+            timings = [time_build(BUILDERS[name], data, args.repeats) for name in args.builders]
+            print(f'{horizon:>8} {len(data.players):>8} ' + ' '.join(f'{t:>9.3f}s' for t in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""Time model build, MPS export and solve per backend on synthetic leagues.
+
+Usage::
+
+    python benchmarks/bench_solver.py                         # run, print a table
+    python benchmarks/bench_solver.py --save baseline.json    # record a baseline
+    python benchmarks/bench_solver.py --compare baseline.json # flag slowdowns
+
+Each scenario generates its league in a temporary directory, so no network
+access or real projections are needed. Phase times come from the profile
+``solve_multi_period_NBA`` returns, with the result cache turned off.
+Backends whose executable or Python package is missing are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from bench_model_build import BASE_OPTIONS, _working_directory  # noqa: E402
+from solve import solve_multi_period_NBA  # noqa: E402
+from synthetic_league import generate_league  # noqa: E402
+
+BACKENDS = ('cbc', 'highs', 'highs_inprocess')
+PHASES = ('build', 'export_mps', 'solve', 'parse', 'extract')
+
+# League sizes and option overrides; chips use the generator's "<week>.<day>" codes
+SCENARIOS = {
+    'small': {'players': 150, 'weeks': 2, 'days_per_week': 3, 'options': {'horizon': 4}},
+    'medium': {'players': 300, 'weeks': 3, 'days_per_week': 3, 'options': {'horizon': 6, 'tm': 1}},
+    'chips': {
+        'players': 300, 'weeks': 3, 'days_per_week': 3, 'squad_mode': 'random',
+        'options': {'horizon': 6, 'wc_day': 1.3, 'all_star_day': 2.2},
+    },
+    'large': {'players': 600, 'weeks': 4, 'days_per_week': 3, 'options': {'horizon': 9}},
+}
+DEFAULT_SCENARIOS = ['small', 'medium', 'chips']
+
+
+def available_backends(cbc_path, highs_path):
+    """Backends that can run here, with the options they need."""
+    backends = {}
+    if cbc_path:
+        backends['cbc'] = {'cbc_path': cbc_path}
+    if highs_path:
+        backends['highs'] = {'highs_path': highs_path}
+    if importlib.util.find_spec('highspy') is not None:
+        backends['highs_inprocess'] = {}
+    return backends
+
+
+def run_scenario(name, spec, backend, backend_options, solve_time, seed):
+    """Solve one scenario on one backend and return its phase timings."""
+    with tempfile.TemporaryDirectory() as root, _working_directory(root):
+        league = generate_league(
+            root, n_players=spec['players'], n_weeks=spec['weeks'], days_per_week=spec['days_per_week'],
+            seed=seed, squad_mode=spec.get('squad_mode', 'cheapest'),
+        )
+        options = {
+            **BASE_OPTIONS, **spec['options'], **backend_options, 'solver': backend,
+            'solve_time': solve_time, 'cache': False, 'solver_output': False, 'write_outputs': False,
+        }
+        start = time.perf_counter()
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            solution = solve_multi_period_NBA(league.projections, league.squad, league.sell_prices,
+                                              league.gd, league.itb, options)
+        wall = time.perf_counter() - start
+
+    profile = solution['profile']
+    seconds = {phase['name']: phase['seconds'] for phase in profile['phases']}
+    return {
+        'scenario': name,
+        'backend': backend,
+        **{phase: round(seconds.get(phase, 0.0), 4) for phase in PHASES},
+        'wall': round(wall, 4),
+        'objective': solution['results'][0]['objective'],
+        **profile['model'],
+    }
+
+
+def compare(rows, baseline, tolerance):
+    """Rows whose wall time grew more than ``tolerance`` over the baseline."""
+    previous = {(row['scenario'], row['backend']): row for row in baseline['rows']}
+    slower = []
+    for row in rows:
+        before = previous.get((row['scenario'], row['backend']))
+        if before is None:
+            continue
+        row['baseline_wall'] = before['wall']
+        row['ratio'] = round(row['wall'] / before['wall'], 3) if before['wall'] else None
+        if row['ratio'] is not None and row['ratio'] > 1 + tolerance:
+            slower.append(row)
+    return slower
+
+
+def print_table(rows):
+    columns = ['scenario', 'backend', 'rows', 'columns', *PHASES, 'wall', 'objective']
+    if any('ratio' in row for row in rows):
+        columns += ['baseline_wall', 'ratio']
+    print(' '.join(f'{c:>15}' for c in columns))
+    for row in rows:
+        print(' '.join(f'{str(row.get(c, "")):>15}' for c in columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenarios', nargs='+', default=DEFAULT_SCENARIOS, choices=list(SCENARIOS))
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument('--cbc-path', default=shutil.which('cbc'))
+    parser.add_argument('--highs-path', default=shutil.which('highs'))
+    parser.add_argument('--solve-time', type=int, default=120)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', help='write the results as a baseline JSON file')
+    parser.add_argument('--compare', help='baseline JSON file to compare wall times against')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed wall-time growth over the baseline before a run counts as slower')
+    args = parser.parse_args(argv)
+
+    backends = available_backends(args.cbc_path, args.highs_path)
+    rows = []
+    for name in args.scenarios:
+        for backend in args.backends:
+            if backend not in backends:
+                print(f'Skipping {backend}: not available')
+                continue
+            rows.append(run_scenario(name, SCENARIOS[name], backend, backends[backend], args.solve_time, args.seed))
+
+    slower = []
+    if args.compare:
+        with open(args.compare) as f:
+            slower = compare(rows, json.load(f), args.tolerance)
+    print_table(rows)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'seed': args.seed,
+                'rows': rows,
+            }, f, indent=2)
+    if slower:
+        print(f"\n{len(slower)} run(s) slower than the baseline by more than {args.tolerance:.0%}:")
+        for row in slower:
+            print(f"  {row['scenario']}/{row['backend']}: {row['baseline_wall']}s -> {row['wall']}s")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
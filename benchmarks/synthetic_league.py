@@ -0,0 +1,112 @@
+"""Synthetic league generator for offline solver benchmarks.
+
+Writes the reference CSVs ``solve_multi_period_NBA`` reads (``teams.csv``,
+``fixture_info.csv``, ``players.csv``) into ``<root>/data`` and returns a
+projections frame plus a legal initial squad, so the solver can be timed
+without network access.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(slots=True)
+class SyntheticLeague:
+    """Projections and squad state of a generated league."""
+
+    projections: pd.DataFrame
+    squad: list[str]
+    sell_prices: list[float]
+    gd: float
+    itb: float
+
+
+SQUAD_MODES = ('cheapest', 'random')
+
+
+def generate_league(root, n_players=600, n_teams=30, n_weeks=4, days_per_week=4, seed=0,
+                    squad_mode='cheapest', itb=5.0):
+    """Generate a league and write its reference data under ``root/data``.
+
+    ``squad_mode`` picks the initial squad: the cheapest legal one, or a random
+    legal one (which usually leaves more profitable transfers to find).
+    """
+    if squad_mode not in SQUAD_MODES:
+        raise ValueError(f"squad_mode must be one of {SQUAD_MODES}.")
+    if days_per_week > 9:
+        raise ValueError("days_per_week must be at most 9 so gameday codes stay unique.")
+    rng = np.random.default_rng(seed)
+    data_dir = os.path.join(root, 'data')
+    os.makedirs(data_dir, exist_ok=True)
+
+    codes = [f'T{i:02d}' for i in range(n_teams)]
+    pd.DataFrame({
+        'Id': range(1, n_teams + 1),
+        'Team': [f'Team {i}' for i in range(n_teams)],
+        'Code': codes,
+    }).to_csv(os.path.join(data_dir, 'teams.csv'), index=False)
+
+    fixture_rows = []
+    for w in range(1, n_weeks + 1):
+        for d in range(1, days_per_week + 1):
+            fixture_rows.append({
+                'id': len(fixture_rows) + 1,
+                'name': f'Gameweek {w} - Day {d}',
+                'deadline': '2025-01-01T00:00:00Z',
+                'code': f'{w}.{d}',
+                'week': w,
+            })
+    pd.DataFrame(fixture_rows).to_csv(os.path.join(data_dir, 'fixture_info.csv'), index=False)
+    n_days = len(fixture_rows)
+
+    team = rng.integers(0, n_teams, n_players)
+    price = np.round(rng.uniform(4.0, 20.0, n_players), 1)
+    position = np.where(rng.random(n_players) < 0.5, 'FRONT', 'BACK')
+    players = pd.DataFrame({
+        'id': range(1, n_players + 1),
+        'name': [f'Player {i}' for i in range(n_players)],
+        'web name': [f'P{i}' for i in range(n_players)],
+        'team': np.array(codes)[team],
+        'price': price,
+        'position': position,
+    })
+    players.to_csv(os.path.join(data_dir, 'players.csv'), index=False)
+
+    plays = rng.random((n_teams, n_days)) < 0.5
+    quality = rng.uniform(2.0, 3.2, (n_players, 1))
+    points = (price[:, None] * quality + rng.normal(0, 2, (n_players, n_days))).clip(0) * plays[team]
+
+    projections = players[['id', 'name', 'team', 'price', 'position']].copy()
+    projections['G'] = plays[team].sum(axis=1)
+    day_columns = pd.DataFrame(np.round(points, 1), columns=[str(d + 1) for d in range(n_days)])
+    projections = pd.concat([projections, day_columns], axis=1)
+
+    if squad_mode == 'cheapest':
+        order = players.sort_values('price')
+    else:
+        order = players.sample(frac=1.0, random_state=seed)
+    squad = _legal_squad(order)
+    sell_prices = players.set_index('name').loc[squad, 'price'].tolist()
+    return SyntheticLeague(projections=projections, squad=squad, sell_prices=sell_prices, gd=1.1, itb=itb)
+
+
+def _legal_squad(players):
+    """First five FRONT and five BACK players in ``players`` order, at most two per team."""
+    squad = []
+    per_team = {}
+    for position in ('FRONT', 'BACK'):
+        picked = 0
+        for row in players[players['position'] == position].itertuples():
+            if per_team.get(row.team, 0) >= 2:
+                continue
+            squad.append(row.name)
+            per_team[row.team] = per_team.get(row.team, 0) + 1
+            picked += 1
+            if picked == 5:
+                break
+    return squad
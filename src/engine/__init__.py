@@ -0,0 +1,17 @@
+"""Model-building and solver backends used by ``solve.py``."""
+
+from .highs_backend import solve_highs_inprocess
+from .matrix_model import MatrixModel, build_matrix_model
+from .model_data import ModelData, ModelHandles
+from .model_index import ModelIndex
+from .reference_data import ReferenceData
+
+__all__ = [
+    "MatrixModel",
+    "ModelData",
+    "ModelHandles",
+    "ModelIndex",
+    "ReferenceData",
+    "build_matrix_model",
+    "solve_highs_inprocess",
+]
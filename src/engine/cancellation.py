@@ -0,0 +1,112 @@
+"""Cooperative cancellation of a running solve."""
+
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import threading
+import time
+
+# Seconds a solver gets to write its incumbent after being interrupted
+STOP_GRACE = 5.0
+
+
+class SolveCancelled(Exception):
+    """Raised when a solve is cancelled before any plan was found."""
+
+
+class CancellationToken:
+    """Thread-safe flag the caller sets to stop a running solve.
+
+    ``solve_multi_period_NBA`` checks it between iterations, and the solver
+    backends watch it while a search runs: subprocesses are interrupted and
+    the in-process HiGHS search is stopped through its interrupt callback.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        self._event.set()
+
+
+def is_cancelled(token):
+    return token is not None and token.cancelled
+
+
+def _signal_group(process, sig):
+    try:
+        if os.name == 'posix':
+            os.killpg(process.pid, sig)
+        elif sig == signal.SIGINT:
+            process.terminate()
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+def stop_process_trees(processes, grace=STOP_GRACE):
+    """Interrupt solvers started in their own sessions, killing them after ``grace`` seconds.
+
+    CBC writes its incumbent when interrupted; anything still running once
+    the grace period is over is killed with its whole process group.
+    """
+    running = [process for process in processes if process.poll() is None]
+    for process in running:
+        _signal_group(process, signal.SIGINT)
+    deadline = time.time() + grace
+    for process in running:
+        try:
+            process.wait(timeout=max(deadline - time.time(), 0))
+        except subprocess.TimeoutExpired:
+            _signal_group(process, signal.SIGKILL if os.name == 'posix' else signal.SIGTERM)
+            process.wait()
+
+
+def stop_process_tree(process, grace=STOP_GRACE):
+    """Single-process form of :func:`stop_process_trees`."""
+    stop_process_trees([process], grace)
+
+
+def has_fresh_file(path, since):
+    """True when ``path`` exists and was written at or after ``since`` (a ``time.time()``)."""
+    return os.path.exists(path) and os.path.getmtime(path) >= since
+
+
+def write_last_improving_solution(improving_path, solution_path):
+    """Turn the last complete block of a HiGHS ``mip_improving_solution_file`` into a solution file.
+
+    HiGHS appends ``Objective``/``# Columns n`` blocks to that file as the
+    search improves, so it still holds the incumbent when the executable is
+    killed before writing its solution file. Returns False when there is none.
+    """
+    if not os.path.exists(improving_path):
+        return False
+    with open(improving_path, 'r') as f:
+        lines = f.read().splitlines()
+
+    best = None
+    i = 0
+    while i + 1 < len(lines):
+        if lines[i].startswith('Objective') and lines[i + 1].startswith('# Columns'):
+            n = int(lines[i + 1].split()[2])
+            block = lines[i:i + 2 + n]
+            if len(block) == n + 2:
+                best = block
+            i += 2 + n
+        else:
+            i += 1
+    if best is None:
+        return False
+
+    with open(solution_path, 'w') as f:
+        f.write('Model status\nInterrupted by user\n\n# Primal solution values\nFeasible\n')
+        f.write('\n'.join(best))
+        f.write('\n# Rows 0\n')
+    return True
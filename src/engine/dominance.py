@@ -0,0 +1,106 @@
+"""Exact removal of dominated players before the model is built.
+
+Player ``p`` dominates ``q`` when both play the same position, ``p`` costs no
+more and projects at least as many points on every gameday of the horizon.
+Swapping ``q`` for ``p`` in any plan keeps it feasible and never lowers its
+objective, provided ``p`` is not already in the squad and its team has room.
+
+Two rules drop ``q``, each leaving a valid swap in every plan that buys it:
+
+* Teammates. A dominator on ``q``'s own team never changes a team count.
+  Buy it instead of ``q`` on the day ``q`` is bought; if the plan buys it
+  later while still holding ``q``, buy ``q`` on that day instead and the two
+  plans match from then on, with the same transfers and bank. Only a
+  dominator already in the squad on the buying day is unusable, and the
+  team limit leaves room for ``TEAM_LIMIT - 1`` teammates of ``q`` there,
+  so ``TEAM_LIMIT`` dominating teammates are enough on any horizon.
+* Other teams. A dominator on another team is also unusable whenever the
+  squad fills its team to the limit. On its first gameday a squad can hold
+  at most ``POSITION_SIZE - 1`` other players of ``q``'s position and fill
+  at most ``(SQUAD_SIZE - 1) // TEAM_LIMIT`` teams to the limit, and each
+  later gameday can fill the teams of up to ``SQUAD_SIZE - 1`` players
+  bought that day. ``q`` is dropped when its dominators cover more distinct
+  teams than that over the horizon; past a couple of gamedays that is
+  more than a league has, and only the teammate rule prunes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from engine.model_data import POSITION_SIZE, SQUAD_SIZE, TEAM_LIMIT, ModelData
+
+
+def blocking_capacity(gamedays: int = 1) -> int:
+    """Most dominating teams the squads of ``gamedays`` consecutive gamedays can make unusable for a swap."""
+    same_position = POSITION_SIZE - 1
+    first_day = same_position + (SQUAD_SIZE - 1 - same_position) // TEAM_LIMIT
+    return first_day + (SQUAD_SIZE - 1) * (gamedays - 1)
+
+
+@dataclass(slots=True)
+class DominanceResult:
+    """Players that survive the filter and the per-position shrink."""
+
+    keep: list[int]
+    by_position: dict[str, dict]
+
+    @property
+    def pruned(self) -> int:
+        return sum(stats['before'] - stats['after'] for stats in self.by_position.values())
+
+
+def _dominance_matrix(points: np.ndarray, prices: np.ndarray) -> np.ndarray:
+    """``out[i, j]`` is True when player ``i`` dominates player ``j``.
+
+    Players with identical prices and projections are ordered by position in
+    the input, so dominance stays a strict order and ties never remove both.
+    """
+    n = len(prices)
+    at_least = (points[:, None, :] >= points[None, :, :]).all(axis=2) & (prices[:, None] <= prices[None, :])
+    identical = at_least & at_least.T
+    earlier = np.arange(n)[:, None] < np.arange(n)[None, :]
+    return at_least & (~identical | earlier)
+
+
+def dominance_filter(data: ModelData, keep) -> DominanceResult:
+    """Drop players of ``data`` that enough same-position players dominate.
+
+    ``keep`` lists players that are never dropped (squad, banned and forced
+    players). Banned players are never used as dominators.
+    """
+    keep = set(keep) | set(data.initial_squad)
+    banned = set(data.banned_players_indices)
+    day_columns = [str(d) for d in data.gamedays]
+    capacity = blocking_capacity(len(data.gamedays))
+
+    survivors = []
+    by_position = {}
+    for position, members in data.index.players_by_position.items():
+        frame = data.all_data.loc[members]
+        dominators = _dominance_matrix(
+            frame[day_columns].to_numpy(dtype=float), frame['price'].to_numpy(dtype=float)
+        )
+        dominators[[p in banned for p in members], :] = False
+
+        team_codes, team_of_member = np.unique(frame['team'].to_numpy(), return_inverse=True)
+        on_team = np.zeros((len(members), len(team_codes)), dtype=bool)
+        on_team[np.arange(len(members)), team_of_member] = True
+        dominating_teams = (dominators.T.astype(np.int64) @ on_team > 0).sum(axis=1)
+        same_team = team_of_member[:, None] == team_of_member[None, :]
+        dominating_teammates = (dominators & same_team).sum(axis=0)
+
+        kept = [
+            p for p, teams, teammates in zip(members, dominating_teams, dominating_teammates)
+            if (teams <= capacity and teammates < TEAM_LIMIT) or p in keep
+        ]
+        survivors += kept
+        by_position[position] = {
+            'before': len(members),
+            'after': len(kept),
+            'ratio': round(len(kept) / len(members), 3) if members else 1.0,
+        }
+
+    return DominanceResult(keep=survivors, by_position=by_position)
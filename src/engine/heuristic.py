@@ -0,0 +1,442 @@
+"""Greedy and local-search planner that needs no MIP solver.
+
+The plan is built in two steps from NumPy arrays of projections, prices,
+positions and teams:
+
+1. Construction. On the first gameday, banned players are sold, forced ones
+   bought and the squad is repaired to five per position and at most
+   ``TEAM_LIMIT`` per team. Open slots are then filled greedily by projected
+   value, keeping enough money back to fill the remaining ones.
+2. Local search. Week by week, single sell/buy swaps are scored by the change
+   in the decayed lineup and bench points over the rest of the horizon,
+   minus the free-transfer value. The best swap is made while it pays and
+   the week still has free transfers.
+
+``plan_from_squads`` replaces the second step with moves toward given
+squads, such as those of an earlier plan.
+
+Chips are never played, so a plan is always feasible without them. The plan
+is returned as a full column vector of the matrix model, with the transfer
+counters, penalised transfers and bank balances the rows imply, so it can be
+read like a solver result or passed to a solver as a MIP start.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from engine.model_data import POSITION_SIZE, SQUAD_SIZE, TEAM_LIMIT, ModelData, ModelHandles
+
+LINEUP_SIZE = 5
+MIN_PER_POSITION = 2
+FREE_TRANSFERS = 2
+# Incoming players scored per outgoing player and week
+SWAP_CANDIDATES = 12
+# Feasibility tolerance when the finished plan is checked against the model rows
+TOLERANCE = 1e-6
+
+
+@dataclass(slots=True)
+class HeuristicPlan:
+    """A plan as (players, gamedays) indicators plus the bank balance of every ``all_gd`` entry."""
+
+    squad: np.ndarray
+    lineup: np.ndarray
+    captain: np.ndarray
+    transfer_in: np.ndarray
+    transfer_out: np.ndarray
+    in_the_bank: np.ndarray
+
+
+class _League:
+    """Per-player arrays of one solve, in ``ModelData.players`` order."""
+
+    def __init__(self, data: ModelData):
+        frame = data.all_data.loc[data.players]
+        gamedays = np.asarray(data.gamedays)
+        decay = np.power(data.decay_base, gamedays - data.next_gd)
+        self.points = frame[[str(d) for d in data.gamedays]].to_numpy(dtype=float)
+        self.price = frame['price'].to_numpy(dtype=float)
+        self.sell_price = frame['sell_price'].to_numpy(dtype=float)
+        type_pos = {t: i for i, t in enumerate(data.element_types)}
+        self.position = np.array([type_pos[t] for t in data.index.position_of_player], dtype=np.int64)
+        self.team = np.asarray(data.index.team_of_player)
+        self.n_types = len(data.element_types)
+        # Decayed objective weights: every squad player earns the bench share,
+        # lineup players the rest
+        self.squad_weight = decay * data.bench_weight * self.points
+        self.lineup_weight = decay * (1 - data.bench_weight) * self.points
+        self.ft_cost = np.array([data.ft_value_dict[d] for d in data.gamedays], dtype=float)
+        self.week = data.index.week_array
+
+        pos = {p: i for i, p in enumerate(data.players)}
+        self.initial = [pos[p] for p in data.initial_squad]
+        self.banned = {pos[p] for p in data.banned_players_indices}
+        forced = list(data.forced_players_indices) + list(data.forced_players_days_indices)
+        self.forced = {pos[p] for p in forced}
+
+    def value(self, first=0) -> np.ndarray:
+        """Best case value of each player from gameday index ``first`` on."""
+        return (self.squad_weight[:, first:] + self.lineup_weight[:, first:]).sum(axis=1)
+
+
+def lineup_points(points: np.ndarray, position: np.ndarray, n_types: int) -> np.ndarray:
+    """Points of the best lineup of each squad and gameday.
+
+    ``points`` is shaped (..., squad, gamedays) and ``position`` gives the
+    type of each squad slot. The best lineup takes the top two of every type
+    and fills the remaining places with the best third-ranked players.
+    """
+    total = np.zeros(points.shape[:-2] + points.shape[-1:])
+    thirds = []
+    for t in range(n_types):
+        ranked = -np.sort(-points[..., position == t, :], axis=-2)
+        total += ranked[..., :MIN_PER_POSITION, :].sum(axis=-2)
+        if ranked.shape[-2] > MIN_PER_POSITION:
+            thirds.append(ranked[..., MIN_PER_POSITION, :])
+    extra = LINEUP_SIZE - MIN_PER_POSITION * n_types
+    if extra > 0 and thirds:
+        total += -np.sort(-np.stack(thirds), axis=0)[:extra].sum(axis=0)
+    return total
+
+
+class _Builder:
+    """Mutable state of the plan while transfers are chosen gameday by gameday."""
+
+    def __init__(self, league: _League, data: ModelData):
+        self.league = league
+        self.data = data
+        self.members = set(league.initial)
+        self.sold_initial = set()
+        self.itb = data.itb
+        self.moves = []  # (gameday index, player out or None, player in or None)
+
+    def sell_value(self, i) -> float:
+        # Initial players are sold at their sell price, the rest at the buy price
+        if i in self.league.initial and i not in self.sold_initial:
+            return self.league.sell_price[i]
+        return self.league.price[i]
+
+    def sell(self, i, j):
+        self.itb += self.sell_value(i)
+        self.members.remove(i)
+        if i in self.league.initial:
+            self.sold_initial.add(i)
+        self.moves.append((j, i, None))
+
+    def buy(self, i, j):
+        self.itb -= self.league.price[i]
+        self.members.add(i)
+        self.moves.append((j, None, i))
+
+    def counts(self, values) -> dict:
+        counts = {}
+        for i in self.members:
+            counts[values[i]] = counts.get(values[i], 0) + 1
+        return counts
+
+    def can_buy(self, i) -> bool:
+        """Not owned, not banned and not an initial player sold earlier.
+
+        Re-buying a sold initial player is left to the MIP: the model only
+        allows a second sale when the first one happened on the first gameday.
+        """
+        return i not in self.members and i not in self.league.banned and i not in self.sold_initial
+
+    # --- Construction ----------------------------------------------------
+    def construct(self):
+        league = self.league
+        value = league.value()
+        for i in sorted(self.members & league.banned):
+            self.sell(i, 0)
+        for i in sorted(league.forced - self.members):
+            self.buy(i, 0)
+
+        # Sell the least valuable unforced players of over-full positions and teams
+        while True:
+            positions, teams = self.counts(league.position), self.counts(league.team)
+            over = [
+                i for i in self.members - league.forced
+                if positions[league.position[i]] > POSITION_SIZE or teams[league.team[i]] > TEAM_LIMIT
+            ]
+            if not over:
+                break
+            self.sell(min(over, key=lambda i: value[i]), 0)
+
+        while len(self.members) < SQUAD_SIZE:
+            self.buy(self._best_affordable(value), 0)
+        if self.itb < -TOLERANCE:
+            raise RuntimeError("The heuristic could not fit the forced players into the budget.")
+
+    def _best_affordable(self, value) -> int:
+        """Most valuable legal buy that leaves money to fill every other open slot."""
+        league = self.league
+        positions, teams = self.counts(league.position), self.counts(league.team)
+        need = {t: POSITION_SIZE - positions.get(t, 0) for t in range(league.n_types)}
+        buyable = np.array([self.can_buy(i) for i in range(len(value))], dtype=bool)
+        best, best_value = None, -np.inf
+        for t, open_slots in need.items():
+            if open_slots <= 0:
+                continue
+            # Cheapest way to fill the other open slots once one of type t is bought
+            reserve = 0.0
+            for u, slots in need.items():
+                slots -= u == t
+                if slots > 0:
+                    reserve += np.sort(league.price[buyable & (league.position == u)])[:slots].sum()
+            candidates = np.flatnonzero(
+                buyable & (league.position == t) & (league.price + reserve <= self.itb + TOLERANCE)
+            )
+            for i in candidates:
+                if teams.get(league.team[i], 0) < TEAM_LIMIT and value[i] > best_value:
+                    best, best_value = i, value[i]
+        if best is None:
+            raise RuntimeError("The heuristic could not complete a squad within the budget.")
+        return int(best)
+
+    # --- Local search ----------------------------------------------------
+    def improve(self):
+        data, league = self.data, self.league
+        used = {w: 0 for w in data.gameweeks}
+        used[data.gameweeks[0]] = sum(1 for _, out, _ in self.moves if out is not None)
+        single_week = data.gameweeks[-1] == data.gameweeks[0]
+        start = 0
+        for w in data.gameweeks:
+            days = np.flatnonzero(league.week == w)
+            if not days.size:
+                continue
+            free = FREE_TRANSFERS - (data.tm if w == data.gameweek_start else 0) - used[w]
+            if w == data.gameweeks[-1]:
+                free = min(free, data.trf_last_gw - (data.tm if single_week else 0) - used[w])
+            start = max(start, int(days[0]))
+            while free > 0:
+                swap = self._best_swap(start, int(days[-1]))
+                if swap is None:
+                    break
+                j, out, new = swap
+                self.sell(out, j)
+                self.buy(new, j)
+                start = j
+                free -= 1
+
+    def _best_swap(self, first, last):
+        """Best (gameday index, out, in) swap on gamedays ``first..last``, or None if none pays."""
+        league = self.league
+        members = np.array(sorted(self.members), dtype=np.int64)
+        position = league.position[members]
+        squad_weight = league.squad_weight[:, first:]
+        lineup_weight = league.lineup_weight[:, first:]
+        value = league.value(first)
+        teams = self.counts(league.team)
+        buyable = np.array([self.can_buy(i) for i in range(len(value))], dtype=bool)
+
+        pairs = []
+        for k, out in enumerate(members):
+            if out in league.forced:
+                continue
+            budget = self.itb + self.sell_value(out)
+            candidates = np.flatnonzero(
+                buyable & (league.position == league.position[out]) & (league.price <= budget + TOLERANCE)
+            )
+            candidates = [
+                i for i in candidates
+                if teams.get(league.team[i], 0) - (league.team[i] == league.team[out]) < TEAM_LIMIT
+            ]
+            candidates = sorted(candidates, key=lambda i: -value[i])[:SWAP_CANDIDATES]
+            pairs += [(k, i) for i in candidates]
+        if not pairs:
+            return None
+
+        squads = np.repeat(members[None, :], len(pairs) + 1, axis=0)
+        for row, (k, i) in enumerate(pairs, start=1):
+            squads[row, k] = i
+        day_values = squad_weight[squads].sum(axis=1) + lineup_points(lineup_weight[squads], position, league.n_types)
+        gain = day_values[1:] - day_values[0]
+        # Swapping on gameday j changes the squad from j to the end of the horizon
+        gain_from = np.cumsum(gain[:, ::-1], axis=1)[:, ::-1][:, :last - first + 1]
+        gain_from = gain_from - league.ft_cost[first:last + 1]
+        row, offset = np.unravel_index(np.argmax(gain_from), gain_from.shape)
+        if gain_from[row, offset] <= TOLERANCE:
+            return None
+        k, new = pairs[row]
+        return first + int(offset), int(members[k]), int(new)
+
+    # --- Following a given plan ------------------------------------------
+    def follow(self, targets):
+        """Move toward the squad ``targets[j]`` on each gameday index ``j`` (None keeps the squad).
+
+        Sales and buys are paired within a position, least valuable sale with
+        most valuable buy, and a pair is skipped when it breaks a team limit,
+        the budget or the last-gameweek transfer cap.
+        """
+        data, league = self.data, self.league
+        value = league.value()
+        last_week = data.gameweeks[-1]
+        cap = data.trf_last_gw - (data.tm if last_week == data.gameweeks[0] else 0)
+        used_last = sum(1 for j, out, _ in self.moves if out is not None and league.week[j] == last_week)
+        for j, target in enumerate(targets):
+            if target is None:
+                continue
+            for t in range(league.n_types):
+                sells = sorted((i for i in self.members - target - league.forced if league.position[i] == t),
+                               key=lambda i: value[i])
+                buys = sorted((i for i in target - self.members if league.position[i] == t and self.can_buy(i)),
+                              key=lambda i: -value[i])
+                for out, new in zip(sells, buys):
+                    if league.week[j] == last_week and used_last >= cap:
+                        break
+                    teams = self.counts(league.team)
+                    over_team = teams.get(league.team[new], 0) - (league.team[new] == league.team[out]) >= TEAM_LIMIT
+                    if over_team or self.itb + self.sell_value(out) - league.price[new] < -TOLERANCE:
+                        continue
+                    self.sell(out, j)
+                    self.buy(new, j)
+                    used_last += league.week[j] == last_week
+
+    # --- Result ----------------------------------------------------------
+    def plan(self) -> HeuristicPlan:
+        data, league = self.data, self.league
+        n, horizon = len(data.players), len(data.gamedays)
+        squad = np.zeros((n, horizon))
+        transfer_in = np.zeros((n, horizon))
+        transfer_out = np.zeros((n, horizon))
+        in_the_bank = np.full(horizon + 1, float(data.itb))
+        owned = np.zeros(n, dtype=bool)
+        owned[league.initial] = True
+        moves = sorted(self.moves, key=lambda move: move[0])
+        sold_initial = set()
+        m = 0
+        for j in range(horizon):
+            in_the_bank[j + 1] = in_the_bank[j]
+            while m < len(moves) and moves[m][0] == j:
+                _, out, new = moves[m]
+                if out is not None:
+                    owned[out] = False
+                    transfer_out[out, j] = 1
+                    first_sale = out in league.initial and out not in sold_initial
+                    in_the_bank[j + 1] += league.sell_price[out] if first_sale else league.price[out]
+                    if out in league.initial:
+                        sold_initial.add(out)
+                if new is not None:
+                    owned[new] = True
+                    transfer_in[new, j] = 1
+                    in_the_bank[j + 1] -= league.price[new]
+                m += 1
+            squad[owned, j] = 1
+
+        lineup = self._lineups(squad)
+        return HeuristicPlan(
+            squad=squad,
+            lineup=lineup,
+            captain=self._captains(lineup),
+            transfer_in=transfer_in,
+            transfer_out=transfer_out,
+            in_the_bank=in_the_bank,
+        )
+
+    def _lineups(self, squad) -> np.ndarray:
+        league = self.league
+        lineup = np.zeros_like(squad)
+        for j in range(squad.shape[1]):
+            members = np.flatnonzero(squad[:, j] > 0.5)
+            order = members[np.argsort(-league.points[members, j], kind='stable')]
+            chosen, spare = [], []
+            for t in range(league.n_types):
+                ranked = order[league.position[order] == t]
+                chosen += list(ranked[:MIN_PER_POSITION])
+                spare += list(ranked[MIN_PER_POSITION:MIN_PER_POSITION + 1])
+            spare.sort(key=lambda i: -league.points[i, j])
+            chosen += spare[:LINEUP_SIZE - len(chosen)]
+            lineup[chosen, j] = 1
+        return lineup
+
+    def _captains(self, lineup) -> np.ndarray:
+        """One captain per gameweek on the best lineup player and gameday.
+
+        The first gameweek gets exactly one unless the captain was already
+        played; later ones only when the pick earns points.
+        """
+        data, league = self.data, self.league
+        captain = np.zeros_like(lineup)
+        scores = np.where(lineup > 0.5, league.lineup_weight + league.squad_weight, -np.inf)
+        for w in data.gameweeks:
+            days = np.flatnonzero(league.week == w)
+            if not days.size:
+                continue
+            first_week = w == data.gameweek_start
+            if first_week and data.captain_played:
+                continue
+            i, k = np.unravel_index(np.argmax(scores[:, days]), (scores.shape[0], days.size))
+            if first_week or scores[i, days[k]] > 0:
+                captain[i, days[k]] = 1
+        return captain
+
+
+def plan_heuristic(data: ModelData) -> HeuristicPlan:
+    """Build a feasible plan for ``data`` by greedy construction and swap search."""
+    builder = _Builder(_League(data), data)
+    builder.construct()
+    builder.improve()
+    return builder.plan()
+
+
+def plan_from_squads(data: ModelData, targets) -> HeuristicPlan:
+    """Feasible plan that follows the squads ``targets`` as closely as the rules allow.
+
+    ``targets`` holds a set of ``ModelData.players`` positions per gameday,
+    or None to keep the previous squad. Lineups and captains are re-picked.
+    """
+    builder = _Builder(_League(data), data)
+    builder.construct()
+    builder.follow(targets)
+    return builder.plan()
+
+
+def solution_vector(h: ModelHandles, data: ModelData, plan: HeuristicPlan) -> np.ndarray:
+    """Column values of the matrix model in ``h`` that realise ``plan``.
+
+    Transfer counters follow the model rows: transfers beyond the two free
+    ones of a gameweek become penalised transfers.
+    """
+    model = h.model
+    values = np.zeros(model.num_cols)
+    pos = {p: i for i, p in enumerate(data.players)}
+    initial = np.array([pos[p] for p in data.initial_squad], dtype=np.int64)
+
+    squad_cols = h.squad.cols()
+    values[squad_cols[initial, 0]] = 1
+    values[squad_cols[:, 1:]] = plan.squad
+    values[h.lineup.cols()] = plan.lineup
+    day_pos = {d: j for j, d in enumerate(data.gamedays)}
+    values[h.captain.cols()] = plan.captain[:, [day_pos[d] for d in h.captain.index[1]]]
+    values[h.transfer_in.cols()] = plan.transfer_in
+    regular = plan.transfer_out.copy()
+    regular[initial] = 0
+    values[h.transfer_out_regular.cols()] = regular
+    values[h.transfer_out_first.cols()] = plan.transfer_out[initial]
+    values[h.in_the_bank.cols()] = plan.in_the_bank
+
+    week = data.index.week_array
+    transfers = plan.transfer_out.sum(axis=0)
+    same_week_before = np.tril(week[:, None] == week[None, :])
+    running = same_week_before @ transfers + np.where(week == data.gameweek_start, data.tm, 0)
+    aux = np.concatenate([[max(0, data.tm - FREE_TRANSFERS)], np.maximum(0, running - FREE_TRANSFERS)])
+    carries = np.array([d not in data.first_days_of_week for d in data.gamedays])
+    penalized = aux[1:] - np.where(carries, aux[:-1], 0)
+    values[h.number_of_transfers_day.cols()] = transfers
+    values[model.block('rtc').cols()] = running
+    values[model.block('aux').cols()] = aux
+    values[h.penalized_transfers.cols()] = penalized
+    return values
+
+
+def solve_heuristic(h: ModelHandles, data: ModelData) -> np.ndarray:
+    """Plan heuristically, load the plan as the model's solution and return its column values."""
+    values = solution_vector(h, data, plan_heuristic(data))
+    violation = h.model.max_violation(values)
+    if violation > TOLERANCE:
+        raise RuntimeError(f"The heuristic plan violates the model by {violation:g}.")
+    h.model.set_solution(values)
+    return values
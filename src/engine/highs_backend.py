@@ -0,0 +1,203 @@
+"""In-process HiGHS backend through the highspy API.
+
+Passes a :class:`~engine.matrix_model.MatrixModel` straight to HiGHS and
+reads the primal solution back as an array aligned with the model columns,
+so no MPS or solution file is written and no variable is looked up by name.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from engine.matrix_model import MatrixModel
+from engine.progress import progress_from_highs
+
+ROWWISE = 2
+MINIMIZE = 1
+# Seconds between progress events from the MIP interrupt callback
+PROGRESS_INTERVAL = 1.0
+
+
+def _import_highspy():
+    try:
+        import highspy
+    except ImportError as exc:
+        raise ImportError(
+            "solver 'highs_inprocess' needs the highspy package. Install it with 'pip install highspy'."
+        ) from exc
+    return highspy
+
+
+def create_highs(options):
+    """Create a Highs instance configured from the solver options."""
+    highspy = _import_highspy()
+    highs = highspy.Highs()
+    highs.setOptionValue('output_flag', bool(options.get('solver_output', True)))
+    highs.setOptionValue('parallel', 'on')
+    highs.setOptionValue('time_limit', float(options.get('solve_time', 20 * 60)))
+    highs.setOptionValue('mip_rel_gap', float(options.get('gap', 0)))
+    highs.setOptionValue('random_seed', int(options.get('random_seed', 0)))
+    highs.setOptionValue('presolve', options.get('presolve', 'on'))
+    return highs
+
+
+def pass_model(highs, model: MatrixModel):
+    """Load the model's arrays into ``highs`` as a row-wise sparse LP/MIP."""
+    matrix = model.matrix
+    highs.passModel(
+        model.num_cols,
+        model.num_rows,
+        int(matrix.nnz),
+        ROWWISE,
+        MINIMIZE,
+        0.0,
+        model.objective,
+        model.col_lower,
+        model.col_upper,
+        model.row_lower,
+        model.row_upper,
+        matrix.indptr.astype(np.int32),
+        matrix.indices.astype(np.int32),
+        matrix.data,
+        model.integrality.astype(np.int32),
+    )
+
+
+def read_primal(highs, model: MatrixModel):
+    """Copy the incumbent into ``model.solution``; returns False when there is none."""
+    solution = highs.getSolution()
+    if not solution.value_valid:
+        status = highs.modelStatusToString(highs.getModelStatus())
+        print(f"HiGHS returned no solution (status: {status})")
+        model.set_solution(np.zeros(model.num_cols))
+        return False
+    model.set_solution(model.rounded(np.asarray(solution.col_value, dtype=float)))
+    return True
+
+
+def solve_highs_inprocess(model: MatrixModel, options):
+    """Solve ``model`` with HiGHS in this process and load the solution onto it.
+
+    Returns the Highs instance so callers can read statistics or re-solve.
+    """
+    highs = create_highs(options)
+    pass_model(highs, model)
+    highs.run()
+    read_primal(highs, model)
+    return highs
+
+
+def append_rows(highs, model: MatrixModel, first_row):
+    """Append rows ``first_row:`` of ``model`` to an already loaded Highs instance."""
+    if first_row >= model.num_rows:
+        return
+    block = model.matrix[first_row:]
+    highs.addRows(
+        block.shape[0],
+        model.row_lower[first_row:],
+        model.row_upper[first_row:],
+        int(block.nnz),
+        block.indptr.astype(np.int32),
+        block.indices.astype(np.int32),
+        block.data,
+    )
+
+
+def _is_feasible(model: MatrixModel, values, tol=1e-6):
+    integer = model.integrality
+    if np.any(np.abs(values[integer] - np.round(values[integer])) > tol):
+        # Solutions of relaxed (rolling-horizon) runs can be fractional
+        return False
+    activity = model.matrix @ values
+    return bool(np.all(activity >= model.row_lower - tol) and np.all(activity <= model.row_upper + tol))
+
+
+class IncrementalHighs:
+    """One Highs instance kept alive across re-solves of a growing model.
+
+    The first :meth:`solve` passes the whole model. Later calls append only the
+    rows added since (the alternative-solution cutoffs) and start HiGHS from
+    the best solution seen so far that the new rows still allow, so the model
+    is not reloaded and the search does not start cold.
+
+    Every improving solution HiGHS finds is kept in :attr:`pool` as a
+    candidate start for the later solves.
+    """
+
+    def __init__(self, options, progress_callback=None, cancel_token=None):
+        self.options = options
+        self.progress_callback = progress_callback
+        self.cancel_token = cancel_token
+        self.highs = None
+        self.pool = []
+        self._loaded_rows = 0
+        self._last_report = float('-inf')
+
+    def load(self, model: MatrixModel):
+        """Pass the whole model on first use; afterwards append only the rows added since."""
+        if self.highs is None:
+            self.highs = create_highs(self.options)
+            self.highs.setOptionValue('mip_improving_solution_save', True)
+            if self.progress_callback is not None:
+                self.highs.cbMipInterrupt.subscribe(self._report_periodic_progress)
+                self.highs.cbMipImprovingSolution.subscribe(self._report_progress)
+            if self.cancel_token is not None:
+                self.highs.cbMipInterrupt.subscribe(self._check_cancelled)
+            pass_model(self.highs, model)
+        else:
+            append_rows(self.highs, model, self._loaded_rows)
+        self._loaded_rows = model.num_rows
+
+    def run(self, model: MatrixModel):
+        """Run HiGHS on the loaded model and read the solution onto ``model``.
+
+        Returns False when HiGHS found no solution.
+        """
+        self._last_report = float('-inf')
+        self.highs.run()
+        if self.progress_callback is not None:
+            self.progress_callback(progress_from_highs(self.highs.getInfo(), elapsed=self.highs.getRunTime()))
+        self.pool.extend(
+            (saved.objective, np.asarray(saved.col_value, dtype=float))
+            for saved in self.highs.getSavedMipSolutions()
+        )
+        return read_primal(self.highs, model)
+
+    def solve(self, model: MatrixModel, start=None):
+        """Solve the model's current rows; returns False when HiGHS found no solution.
+
+        ``start`` holds column values to start from; once the pool holds a
+        solution the model still allows, solves start from the best of those.
+        """
+        warm = self.highs is not None
+        self.load(model)
+        if warm:
+            best = self._best_in_pool(model)
+            if best is not None:
+                start = self.pool[best][1]
+            elif start is not None and not _is_feasible(model, start):
+                start = None
+        if start is not None:
+            self.highs.setSolution(model.num_cols, np.arange(model.num_cols, dtype=np.int32), start)
+        return self.run(model)
+
+    def _check_cancelled(self, event):
+        # Stopping through the callback keeps the incumbent, unlike killing the thread
+        if self.cancel_token.cancelled:
+            event.interrupt()
+
+    def _report_progress(self, event):
+        progress = progress_from_highs(event.data_out)
+        self._last_report = progress.elapsed
+        self.progress_callback(progress)
+
+    def _report_periodic_progress(self, event):
+        # The interrupt callback fires many times a second
+        if event.data_out.running_time - self._last_report >= PROGRESS_INTERVAL:
+            self._report_progress(event)
+
+    def _best_in_pool(self, model: MatrixModel):
+        for i in sorted(range(len(self.pool)), key=lambda i: self.pool[i][0]):
+            if _is_feasible(model, self.pool[i][1]):
+                return i
+        return None
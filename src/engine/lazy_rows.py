@@ -0,0 +1,127 @@
+"""Lazy row families for the in-process HiGHS backend.
+
+``multi_sell_2`` adds a row per initial player and gameday, each summing
+over the horizon, and the team limits add a row per team and gameday, yet
+few of them bind at the optimum: an initial player is rarely sold twice and
+most teams never have three candidates worth owning. With ``lazy_rows`` the
+families are taken out of the model before the first solve and a row is
+added back only once a solution violates it, re-solving until none does.
+The optimum is that of the full model.
+
+HiGHS has no lazy-constraint callback, so violated rows are appended between
+re-solves on the same :class:`~engine.highs_backend.IncrementalHighs`, which
+keeps the model loaded and starts from its pool of earlier solutions. Rows
+are first separated against the LP relaxation, and every row of a player or
+team goes in once one of them is violated, to keep the MIP re-solves few.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from engine.cancellation import is_cancelled
+from engine.highs_backend import IncrementalHighs
+from engine.matrix_model import MatrixModel
+
+LAZY_FAMILIES = ('multi_sell_2', 'team_limit', 'team_limit_as')
+# Row activity beyond the bounds by more than this counts as a violation
+TOLERANCE = 1e-6
+
+
+class LazyRows:
+    """Row families held back from a :class:`MatrixModel` until a solution violates them."""
+
+    def __init__(self, model: MatrixModel, families=LAZY_FAMILIES):
+        self.model = model
+        self.families = model.take_rows(families)
+        self.added = {name: np.zeros(len(family.lower), dtype=bool) for name, family in self.families.items()}
+        # Rows sharing their first key (the player or team) are added together
+        self.owner = {
+            name: np.unique([key[0] for key in family.keys], return_inverse=True)[1] if family.keys else
+            np.arange(len(family.lower))
+            for name, family in self.families.items()
+        }
+        self.solves = 0
+
+    def add_violated(self, solutions=None) -> int:
+        """Add the held-back rows any of ``solutions`` violates; returns how many.
+
+        ``solutions`` defaults to the model's current solution.
+        """
+        values = np.column_stack([self.model.solution] if solutions is None else list(solutions))
+        count = 0
+        for name, family in self.families.items():
+            activity = family.matrix @ values
+            violated = ((activity > family.upper[:, None] + TOLERANCE)
+                        | (activity < family.lower[:, None] - TOLERANCE)).any(axis=1)
+            owner = self.owner[name]
+            rows = np.flatnonzero(np.isin(owner, owner[violated]) & ~self.added[name])
+            if rows.size:
+                self.model.add_row_subset(family, rows)
+                self.added[name][rows] = True
+                count += rows.size
+        return count
+
+    def separate_lp(self, incremental_highs: IncrementalHighs) -> int:
+        """Add rows the LP relaxation violates, re-solving the LP until it violates none.
+
+        LP solves are cheap next to the MIP, and the rows a relaxed plan
+        breaks are mostly the ones the MIP would break too.
+        """
+        incremental_highs.load(self.model)
+        highs = incremental_highs.highs
+        all_cols = np.arange(self.model.num_cols, dtype=np.int32)
+        integer = self.model.integrality
+        count = 0
+        highs.changeColsIntegrality(self.model.num_cols, all_cols, np.zeros(self.model.num_cols, dtype=np.uint8))
+        try:
+            while True:
+                highs.run()
+                solution = highs.getSolution()
+                if not solution.value_valid:
+                    break
+                added = self.add_violated([np.asarray(solution.col_value, dtype=float)])
+                if not added:
+                    break
+                count += added
+                incremental_highs.load(self.model)
+        finally:
+            highs.changeColsIntegrality(self.model.num_cols, all_cols, integer.astype(np.uint8))
+        return count
+
+    def solve(self, incremental_highs: IncrementalHighs, start=None, cancel_token=None) -> bool:
+        """Solve on ``incremental_highs`` until the solution violates no held-back row.
+
+        Returns False when HiGHS found no solution, and when the solve is
+        cancelled with a solution that still violates a held-back row.
+        """
+        if not self.solves:
+            self.separate_lp(incremental_highs)
+        while True:
+            solved = incremental_highs.solve(self.model, start)
+            self.solves += 1
+            if not solved:
+                return False
+            added = self.add_violated([self.model.solution, *(values for _, values in incremental_highs.pool)])
+            if not added:
+                return True
+            if is_cancelled(cancel_token):
+                return False
+            print(f"Added {added} violated lazy rows; re-solving")
+
+    def report(self) -> dict:
+        """Rows of each family, how many had to be added, and the solves it took."""
+        return {
+            'solves': self.solves,
+            'families': {
+                name: {'rows': len(family.lower), 'added': int(self.added[name].sum())}
+                for name, family in self.families.items()
+            },
+        }
+
+    def summary(self) -> str:
+        """One line with the rows added of each family."""
+        families = ', '.join(
+            f"{name} {counts['added']}/{counts['rows']}" for name, counts in self.report()['families'].items()
+        )
+        return f"Lazy rows added: {families} over {self.solves} solves"
@@ -0,0 +1,786 @@
+"""Vectorised sparse-matrix builder for the multi-period NBA model.
+
+The sasoptpy formulation in ``solve.py`` creates one Python expression per
+(player, gameday) pair.  This module builds the same variables, rows and
+objective directly as NumPy index arrays, so build time grows linearly with
+players x horizon, and keeps the result as a SciPy sparse matrix that can be
+written to MPS or handed to a solver API.
+"""
+
+from __future__ import annotations
+
+import gzip
+
+import numpy as np
+import scipy.sparse as sp
+
+from engine.model_data import ModelData, ModelHandles
+from engine.solution_reader import ColumnOrder, read_solution_values
+
+BINARY = 'binary'
+INTEGER = 'integer'
+CONTINUOUS = 'continuous'
+
+INF = np.inf
+
+
+class LinearExpression:
+    """Sparse linear expression over model columns, evaluated on the current solution."""
+
+    __slots__ = ('model', 'cols', 'coefs', 'constant')
+
+    def __init__(self, model, cols, coefs, constant=0.0):
+        self.model = model
+        self.cols = np.asarray(cols, dtype=np.int64)
+        self.coefs = np.asarray(coefs, dtype=float)
+        self.constant = float(constant)
+
+    def get_value(self):
+        return self.constant + float(self.coefs @ self.model.solution[self.cols])
+
+    def __add__(self, other):
+        if isinstance(other, LinearExpression):
+            return LinearExpression(
+                self.model,
+                np.concatenate([self.cols, other.cols]),
+                np.concatenate([self.coefs, other.coefs]),
+                self.constant + other.constant,
+            )
+        return LinearExpression(self.model, self.cols, self.coefs, self.constant + other)
+
+    __radd__ = __add__
+
+    def __le__(self, rhs):
+        return LinearConstraint(self, -INF, rhs)
+
+    def __ge__(self, rhs):
+        return LinearConstraint(self, rhs, INF)
+
+
+class LinearConstraint:
+    """``lower <= expression <= upper`` waiting to be added to a model."""
+
+    __slots__ = ('expr', 'lower', 'upper')
+
+    def __init__(self, expr, lower, upper):
+        self.expr = expr
+        self.lower = lower
+        self.upper = upper
+
+
+def expr_sum(terms):
+    """Sum LinearExpressions; the matrix counterpart of ``so.expr_sum``."""
+    total = None
+    for term in terms:
+        total = term if total is None else total + term
+    if total is None:
+        return _EmptyExpression()
+    return total
+
+
+class _EmptyExpression:
+    """Value of a sum over no terms, which sasoptpy treats as zero."""
+
+    def get_value(self):
+        return 0.0
+
+
+class RowFamily:
+    """Rows of one family taken out of a model, kept as a CSR block with their bounds."""
+
+    __slots__ = ('name', 'matrix', 'lower', 'upper', 'keys')
+
+    def __init__(self, name, matrix, lower, upper, keys):
+        self.name = name
+        self.matrix = matrix
+        self.lower = lower
+        self.upper = upper
+        self.keys = keys
+
+
+class VariableBlock:
+    """A block of model columns indexed by one or two index sets."""
+
+    def __init__(self, model, name, start, index_sets, vartype):
+        self.model = model
+        self.name = name
+        self.start = start
+        self.index = [list(s) for s in index_sets]
+        self.shape = tuple(len(s) for s in self.index)
+        self.size = int(np.prod(self.shape)) if self.shape else 0
+        self.vartype = vartype
+        self._pos = [{k: i for i, k in enumerate(s)} for s in self.index]
+
+    def cols(self):
+        """Column ids of the whole block, shaped like the index sets."""
+        return self.start + np.arange(self.size, dtype=np.int64).reshape(self.shape)
+
+    def col(self, key):
+        if len(self.shape) == 1:
+            return self.start + self._pos[0][key]
+        p, d = key
+        return self.start + self._pos[0][p] * self.shape[1] + self._pos[1][d]
+
+    def values(self, periods=None):
+        """Current solution values shaped like the index sets.
+
+        ``periods`` limits the last index to those keys, in that order;
+        periods the block has no columns for read as zero.
+        """
+        values = self.model.solution[self.cols()]
+        if periods is None:
+            return values
+        last = self._pos[-1]
+        picked = np.zeros(self.shape[:-1] + (len(periods),))
+        present = [i for i, d in enumerate(periods) if d in last]
+        picked[..., present] = values[..., [last[periods[i]] for i in present]]
+        return picked
+
+    def names(self):
+        if len(self.shape) == 1:
+            return [f'{self.name}[{k}]' for k in self.index[0]]
+        return [f'{self.name}[{p},{d}]' for p in self.index[0] for d in self.index[1]]
+
+    def __getitem__(self, key):
+        return LinearExpression(self.model, [self.col(key)], [1.0])
+
+
+class MatrixModel:
+    """Column bounds, sparse rows and an objective vector for one MIP."""
+
+    def __init__(self, name):
+        self.name = name
+        self.blocks = []
+        self.num_cols = 0
+        self._lb = []
+        self._ub = []
+        self._integrality = []
+        self._objective = []
+
+        self.num_rows = 0
+        self._row_entries = []
+        self._row_lower = []
+        self._row_upper = []
+        self._row_groups = []
+        self._matrix = None
+        self._column_order = None
+        self.solution = np.zeros(0)
+
+    # --- Columns ---------------------------------------------------------
+    def add_variables(self, *index_sets, name, vartype, lb=0.0, ub=None):
+        block = VariableBlock(self, name, self.num_cols, index_sets, vartype)
+        if ub is None:
+            ub = 1.0 if vartype == BINARY else INF
+        self._lb.append(np.full(block.size, lb, dtype=float))
+        self._ub.append(np.full(block.size, ub, dtype=float))
+        self._integrality.append(np.full(block.size, vartype != CONTINUOUS))
+        self._objective.append(np.zeros(block.size))
+        self.blocks.append(block)
+        self.num_cols += block.size
+        self.solution = np.zeros(self.num_cols)
+        return block
+
+    @property
+    def col_lower(self):
+        return np.concatenate(self._lb)
+
+    @property
+    def col_upper(self):
+        return np.concatenate(self._ub)
+
+    @property
+    def integrality(self):
+        return np.concatenate(self._integrality)
+
+    @property
+    def objective(self):
+        return np.concatenate(self._objective)
+
+    def set_objective(self, cols, coefs):
+        """Set the (minimisation) objective from column ids and coefficients."""
+        obj = np.zeros(self.num_cols)
+        np.add.at(obj, np.asarray(cols, dtype=np.int64).ravel(), np.asarray(coefs, dtype=float).ravel())
+        self._objective = [obj]
+
+    def block(self, name):
+        """The variable block called ``name``."""
+        for block in self.blocks:
+            if block.name == name:
+                return block
+        raise KeyError(name)
+
+    def column_periods(self):
+        """Last index of every column: the gameday, for every block the model builder adds."""
+        return np.concatenate([
+            np.broadcast_to(np.asarray(block.index[-1]), block.shape).ravel() for block in self.blocks if block.size
+        ])
+
+    def column_names(self):
+        names = []
+        for block in self.blocks:
+            names.extend(block.names())
+        return names
+
+    # --- Rows ------------------------------------------------------------
+    def add_rows(self, name, n, entries, lower=-INF, upper=INF, keys=None):
+        """Add ``n`` rows built from ``(local_row, col, coef)`` triplet arrays.
+
+        ``keys`` is an optional list of per-row index tuples used only for
+        row names; rows without keys are named after the family.
+        """
+        offset = self.num_rows
+        for rows, cols, coefs in entries:
+            cols = np.asarray(cols, dtype=np.int64)
+            rows = np.asarray(rows, dtype=np.int64)
+            coefs = np.asarray(coefs, dtype=float)
+            if rows.size != cols.size:
+                rows = np.broadcast_to(rows, cols.shape)
+            if coefs.size != cols.size:
+                coefs = np.broadcast_to(coefs, cols.shape)
+            self._row_entries.append((rows.ravel() + offset, cols.ravel(), coefs.ravel()))
+        self._row_lower.append(np.broadcast_to(np.asarray(lower, dtype=float), (n,)).copy())
+        self._row_upper.append(np.broadcast_to(np.asarray(upper, dtype=float), (n,)).copy())
+        self._row_groups.append((name, n, keys))
+        self.num_rows += n
+        self._matrix = None
+        return range(offset, offset + n)
+
+    def add_constraint(self, constraint, name):
+        expr = constraint.expr
+        self.add_rows(
+            name, 1,
+            [(np.zeros(len(expr.cols)), expr.cols, expr.coefs)],
+            lower=constraint.lower - expr.constant,
+            upper=constraint.upper - expr.constant,
+        )
+
+    def take_rows(self, names):
+        """Remove the row families in ``names``; returns them as ``{name: RowFamily}``.
+
+        :meth:`add_row_subset` puts rows of a family back, appended after the
+        rows already in the model.
+        """
+        matrix, lower, upper = self.matrix, self.row_lower, self.row_upper
+        keep = np.ones(self.num_rows, dtype=bool)
+        taken = {}
+        groups = []
+        offset = 0
+        for name, n, keys in self._row_groups:
+            if name in names:
+                rows = slice(offset, offset + n)
+                taken[name] = RowFamily(name, matrix[rows], lower[rows], upper[rows], keys)
+                keep[rows] = False
+            else:
+                groups.append((name, n, keys))
+            offset += n
+        kept = matrix[keep].tocoo()
+        self._row_entries = [(kept.row.astype(np.int64), kept.col.astype(np.int64), kept.data)]
+        self._row_lower = [lower[keep]]
+        self._row_upper = [upper[keep]]
+        self._row_groups = groups
+        self.num_rows = int(keep.sum())
+        self._matrix = None
+        return taken
+
+    def add_row_subset(self, family, rows):
+        """Append rows ``rows`` (positions within the family) of a :class:`RowFamily`."""
+        rows = np.asarray(rows, dtype=np.int64)
+        block = family.matrix[rows].tocoo()
+        keys = None if family.keys is None else [family.keys[i] for i in rows]
+        return self.add_rows(family.name, len(rows), [(block.row, block.col, block.data)],
+                             lower=family.lower[rows], upper=family.upper[rows], keys=keys)
+
+    def row_range(self, name):
+        """Rows of the first family called ``name``."""
+        offset = 0
+        for group, n, _ in self._row_groups:
+            if group == name:
+                return range(offset, offset + n)
+            offset += n
+        raise KeyError(name)
+
+    def set_row_bounds(self, name, lower, upper):
+        """Replace the bounds of the rows of family ``name``; the matrix is kept."""
+        rows = self.row_range(name)
+        row_lower, row_upper = self.row_lower, self.row_upper
+        row_lower[rows.start:rows.stop] = lower
+        row_upper[rows.start:rows.stop] = upper
+        self._row_lower = [row_lower]
+        self._row_upper = [row_upper]
+
+    def snapshot(self):
+        """State of the rows, for :meth:`restore` to drop every row change made since."""
+        return (list(self._row_entries), self.row_lower, self.row_upper, list(self._row_groups),
+                self.num_rows, self.matrix)
+
+    def restore(self, snapshot):
+        entries, lower, upper, groups, num_rows, matrix = snapshot
+        self._row_entries = list(entries)
+        self._row_lower = [lower.copy()]
+        self._row_upper = [upper.copy()]
+        self._row_groups = list(groups)
+        self.num_rows = num_rows
+        self._matrix = matrix
+        self.solution = np.zeros(self.num_cols)
+
+    @property
+    def row_lower(self):
+        return np.concatenate(self._row_lower) if self._row_lower else np.zeros(0)
+
+    @property
+    def row_upper(self):
+        return np.concatenate(self._row_upper) if self._row_upper else np.zeros(0)
+
+    @property
+    def matrix(self):
+        """Constraint matrix as CSR, rebuilt only after rows change."""
+        if self._matrix is None:
+            if self._row_entries:
+                rows = np.concatenate([e[0] for e in self._row_entries])
+                cols = np.concatenate([e[1] for e in self._row_entries])
+                vals = np.concatenate([e[2] for e in self._row_entries])
+            else:
+                rows = cols = np.zeros(0, dtype=np.int64)
+                vals = np.zeros(0)
+            self._matrix = sp.csr_matrix((vals, (rows, cols)), shape=(self.num_rows, self.num_cols))
+            self._matrix.sum_duplicates()
+        return self._matrix
+
+    def row_names(self):
+        names = []
+        for name, n, keys in self._row_groups:
+            if keys is None:
+                names.extend([name] if n == 1 else [f'{name}[{i}]' for i in range(n)])
+            else:
+                names.extend(f"{name}[{','.join(map(str, k))}]" for k in keys)
+        return names
+
+    # --- Export / solution ----------------------------------------------
+    def export_mps(self, path, objective_name='tdxp'):
+        """Write the model as free-format MPS, in the layout sasoptpy produces.
+
+        Lines are streamed to the file, gzip-compressed when ``path`` ends in ``.gz``.
+        """
+        if str(path).endswith('.gz'):
+            # Fast compression: the file is read once, so size matters less than write time
+            f = gzip.open(path, 'wt', compresslevel=1)
+        else:
+            f = open(path, 'w')
+        with f:
+            for line in self._mps_lines(objective_name):
+                f.write(line)
+                f.write('\n')
+
+    def _mps_lines(self, objective_name):
+        col_names = self.column_names()
+        row_names = self.row_names()
+        lower, upper = self.row_lower, self.row_upper
+        integrality = self.integrality
+        col_lb, col_ub = self.col_lower, self.col_upper
+        is_binary = integrality & (col_lb == 0) & (col_ub == 1)
+
+        csc = sp.vstack([sp.csr_matrix(self.objective), self.matrix]).tocsc()
+        csc.eliminate_zeros()
+        all_rows = [objective_name] + row_names
+
+        yield f'NAME {self.name}'
+        yield 'ROWS'
+        yield f' N {objective_name}'
+        for i, rname in enumerate(row_names):
+            lo, up = lower[i], upper[i]
+            if lo == up or (np.isfinite(lo) and np.isfinite(up)):
+                kind = 'E'
+            elif np.isfinite(up):
+                kind = 'L'
+            else:
+                kind = 'G'
+            yield f' {kind} {rname}'
+
+        yield 'COLUMNS'
+        in_marker = False
+        marker = 0
+        for j, cname in enumerate(col_names):
+            integer = bool(integrality[j]) and not is_binary[j]
+            if integer != in_marker:
+                yield f"    MARK{marker:04d} 'MARKER' '{'INTORG' if integer else 'INTEND'}'"
+                marker += 1
+                in_marker = integer
+            start, end = csc.indptr[j], csc.indptr[j + 1]
+            if start == end:
+                yield f'    {cname} {objective_name} 0.0'
+            for k in range(start, end):
+                yield f'    {cname} {all_rows[csc.indices[k]]} {float(csc.data[k])!r}'
+        if in_marker:
+            yield f"    MARK{marker:04d} 'MARKER' 'INTEND'"
+
+        yield 'RHS'
+        ranges = []
+        for i, rname in enumerate(row_names):
+            lo, up = lower[i], upper[i]
+            rhs = lo if np.isfinite(lo) else up
+            if rhs != 0:
+                yield f'    RHS {rname} {float(rhs)!r}'
+            if lo != up and np.isfinite(lo) and np.isfinite(up):
+                ranges.append(f'    rng {rname} {float(up - lo)!r}')
+        yield 'RANGES'
+        yield from ranges
+
+        yield 'BOUNDS'
+        for j, cname in enumerate(col_names):
+            if is_binary[j]:
+                yield f' BV BND {cname} 1.0'
+                continue
+            lb, ub = col_lb[j], col_ub[j]
+            if integrality[j] and lb == 0 and ub == INF:
+                yield f' PL BND {cname}'
+                continue
+            if lb != 0:
+                yield f' LO BND {cname} {float(lb)!r}' if np.isfinite(lb) else f' MI BND {cname}'
+            if ub != INF:
+                yield f' UP BND {cname} {float(ub)!r}'
+        yield 'ENDATA'
+
+    def set_solution(self, values):
+        self.solution = np.asarray(values, dtype=float)
+
+    def read_solution(self, location_solution, solver):
+        """Load a CBC or HiGHS text solution file (optionally gzipped) into ``self.solution``."""
+        if self._column_order is None or len(self._column_order) != self.num_cols:
+            self._column_order = ColumnOrder.of(self)
+        self.solution = read_solution_values(location_solution, solver, self._column_order)
+
+    def rounded(self, values):
+        """Round integer columns to whole numbers and continuous ones to 3 dp."""
+        return np.where(self.integrality, np.round(values), np.round(values, 3))
+
+    def get_objective_value(self):
+        return float(self.objective @ self.solution)
+
+    def max_violation(self, values):
+        """Largest bound, row or integrality violation of the column values ``values``."""
+        values = np.asarray(values, dtype=float)
+        activity = self.matrix @ values
+        return float(max(
+            np.max(self.col_lower - values, initial=0.0),
+            np.max(values - self.col_upper, initial=0.0),
+            np.max(self.row_lower - activity, initial=0.0),
+            np.max(activity - self.row_upper, initial=0.0),
+            np.max(np.abs(values - np.round(values))[self.integrality], initial=0.0),
+        ))
+
+
+def build_matrix_model(data: ModelData, name='problem_name') -> ModelHandles:
+    """Build the multi-period model as sparse arrays.
+
+    Mirrors the sasoptpy formulation in ``solve.py`` row family by row
+    family, so both builders give the same optimum.
+    """
+    players = data.players
+    gamedays = data.gamedays
+    initial_squad = data.initial_squad
+    n_players = len(players)
+    horizon = len(gamedays)
+    n_initial = len(initial_squad)
+    all_data = data.all_data
+    # Chip and captain columns only exist on the gamedays they can be used
+    wc_days = data.wc_allowed_days()
+    as_days = data.all_star_allowed_days()
+    captain_days = data.captain_days()
+
+    model = MatrixModel(name)
+    squad = model.add_variables(players, data.all_gd, name='squad', vartype=BINARY)
+    squad_all_star = model.add_variables(players, as_days, name='squad_all_star', vartype=BINARY)
+    lineup = model.add_variables(players, gamedays, name='lineup', vartype=BINARY)
+    captain = model.add_variables(players, captain_days, name='captain', vartype=BINARY)
+    transfer_in = model.add_variables(players, gamedays, name='transfer_in', vartype=BINARY)
+    transfer_out_first = model.add_variables(initial_squad, gamedays, name='transfer_out_first', vartype=BINARY)
+    transfer_out_regular = model.add_variables(players, gamedays, name='transfer_out_regular', vartype=BINARY)
+    in_the_bank = model.add_variables(data.all_gd, name='itb', vartype=CONTINUOUS, lb=0)
+    number_of_transfers_day = model.add_variables(gamedays, name='nt', vartype=CONTINUOUS, lb=0)
+    running_transfer_count = model.add_variables(gamedays, name='rtc', vartype=CONTINUOUS, lb=0)
+    penalized_transfers = model.add_variables(gamedays, name='pt', vartype=INTEGER, lb=0)
+    auxillary = model.add_variables(data.all_gd, name='aux', vartype=INTEGER, lb=0)
+    use_wc = model.add_variables(wc_days, name='use_wc', vartype=BINARY)
+    use_all_star = model.add_variables(as_days, name='use_all_star', vartype=BINARY)
+
+    # Column id arrays, shaped (players, gamedays) unless noted
+    S_all = squad.cols()
+    S0, S = S_all[:, 0], S_all[:, 1:]
+    SA = squad_all_star.cols()              # (players, All-Star days)
+    L = lineup.cols()
+    C = captain.cols()                      # (players, captain days)
+    TI = transfer_in.cols()
+    TOF = transfer_out_first.cols()         # (initial squad, gamedays)
+    TOR = transfer_out_regular.cols()
+    ITB = in_the_bank.cols()                # (all_gd,)
+    NT = number_of_transfers_day.cols()
+    RTC = running_transfer_count.cols()
+    PT = penalized_transfers.cols()
+    AUX = auxillary.cols()                  # (all_gd,)
+    WC = use_wc.cols()                      # (wildcard days,)
+    AS = use_all_star.cols()                # (All-Star days,)
+
+    # Parameters as arrays
+    player_pos = {p: i for i, p in enumerate(players)}
+    init_pos = np.array([player_pos[p] for p in initial_squad], dtype=np.int64)
+    is_initial = np.zeros(n_players, dtype=bool)
+    is_initial[init_pos] = True
+    position = data.index.position_of_player
+    team_pos = {t: i for i, t in enumerate(data.teams)}
+    team_idx = np.array([team_pos.get(t, -1) for t in data.index.team_of_player], dtype=np.int64)
+    week = data.index.week_array
+    buy_price = all_data.loc[players, 'price'].to_numpy(dtype=float)
+    sell_price = all_data.loc[players, 'sell_price'].to_numpy(dtype=float)
+
+    # Horizon positions of the days the chip and captain blocks cover
+    day_pos = {d: j for j, d in enumerate(gamedays)}
+    as_idx = np.array([day_pos[d] for d in as_days], dtype=np.int64)
+    wc_idx = np.array([day_pos[d] for d in wc_days], dtype=np.int64)
+    cap_idx = np.array([day_pos[d] for d in captain_days], dtype=np.int64)
+    n_as, n_cap = len(as_days), len(captain_days)
+
+    day_rows = np.broadcast_to(np.arange(horizon), (n_players, horizon))
+    grid_rows = np.arange(n_players * horizon).reshape(n_players, horizon)
+    pd_keys = [(p, d) for p in players for d in gamedays]
+    d_keys = [(d,) for d in gamedays]
+    as_day_rows = np.broadcast_to(np.arange(n_as), (n_players, n_as))
+    as_rows = np.arange(n_players * n_as).reshape(n_players, n_as)
+    as_grid = np.broadcast_to(AS, (n_players, n_as))
+    as_keys = [(p, d) for p in players for d in as_days]
+    cap_rows = np.arange(n_players * n_cap).reshape(n_players, n_cap)
+
+    def typed_rows(cols, values):
+        """Rows per (type, gameday) summing ``cols`` over players of that type."""
+        n_days = cols.shape[1]
+        rows = np.broadcast_to(np.arange(n_days), cols.shape)
+        entries = []
+        for ti, t in enumerate(data.element_types):
+            mask = position == t
+            entries.append((ti * n_days + rows[mask], cols[mask], values))
+        return entries
+
+    def team_rows(cols):
+        n_days = cols.shape[1]
+        rows = np.broadcast_to(np.arange(n_days), cols.shape)
+        mask = team_idx >= 0
+        return [(team_idx[mask, None] * n_days + rows[mask], cols[mask], 1.0)]
+
+    type_keys = [(t, d) for t in data.element_types for d in gamedays]
+    team_keys = [(t, d) for t in data.teams for d in gamedays]
+    n_types = len(data.element_types) * horizon
+    n_teams = len(data.teams) * horizon
+
+    # ===== CONSTRAINTS =====
+
+    # Initial conditions
+    model.add_rows('initial_squad_players', n_initial, [(np.arange(n_initial), S0[init_pos], 1.0)],
+                   lower=1, upper=1, keys=[(p,) for p in initial_squad])
+    others = np.flatnonzero(~is_initial)
+    model.add_rows('initial_squad_others', len(others), [(np.arange(len(others)), S0[others], 1.0)],
+                   lower=0, upper=0, keys=[(players[i],) for i in others])
+    model.add_rows('initial_itb', 1, [([0], [ITB[0]], 1.0)], lower=data.itb, upper=data.itb)
+    if not data.captain_played:
+        first_week_cap = C[:, week[cap_idx] == data.gameweek_start]
+        model.add_rows('initial_captain', 1, [(np.zeros(first_week_cap.size), first_week_cap, 1.0)],
+                       lower=1, upper=1)
+    initial_aux_value = max(0, data.tm - 2)
+    model.add_rows('initial_aux', 1, [([0], [AUX[0]], 1.0)], lower=initial_aux_value, upper=initial_aux_value)
+
+    # Squad and lineup
+    model.add_rows('squad_count', horizon, [(day_rows, S, 1.0)], lower=10, upper=10, keys=d_keys)
+    model.add_rows('squad_as_count', n_as, [(as_day_rows, SA, 1.0), (np.arange(n_as), AS, -10.0)],
+                   lower=0, upper=0, keys=[(d,) for d in as_days])
+    model.add_rows('lineup_count', horizon, [(day_rows, L, 1.0)], lower=5, upper=5, keys=d_keys)
+    model.add_rows('lineup_squad_rel', n_players * horizon,
+                   [(grid_rows, L, 1.0), (grid_rows, S, -1.0), (grid_rows[:, as_idx], as_grid, -1.0)],
+                   upper=0, keys=pd_keys)
+    model.add_rows('lineup_squad_as_rel', n_players * n_as,
+                   [(as_rows, L[:, as_idx], 1.0), (as_rows, SA, -1.0), (as_rows, as_grid, 1.0)],
+                   upper=1, keys=as_keys)
+    model.add_rows('valid_formation', n_types, typed_rows(L, 1.0), lower=2, upper=3, keys=type_keys)
+    model.add_rows('valid_squad', n_types, typed_rows(S, 1.0), lower=5, upper=5, keys=type_keys)
+    type_as = [(ti * n_as + np.arange(n_as), AS, -5.0) for ti in range(len(data.element_types))]
+    model.add_rows('valid_squad_as', len(data.element_types) * n_as, typed_rows(SA, 1.0) + type_as,
+                   lower=0, upper=0, keys=[(t, d) for t in data.element_types for d in as_days])
+    model.add_rows('team_limit', n_teams, team_rows(S), upper=2, keys=team_keys)
+    team_as = [(ti * n_as + np.arange(n_as), AS, -2.0) for ti in range(len(data.teams))]
+    model.add_rows('team_limit_as', len(data.teams) * n_as, team_rows(SA) + team_as, upper=0,
+                   keys=[(t, d) for t in data.teams for d in as_days])
+
+    # Captain
+    model.add_rows('captain_count_gd', n_cap, [(np.broadcast_to(np.arange(n_cap), C.shape), C, 1.0)], upper=1,
+                   keys=[(d,) for d in captain_days])
+    captain_weeks = [w for w in data.gameweeks if (week[cap_idx] == w).any()]
+    week_entries = []
+    for wi, w in enumerate(captain_weeks):
+        cols = C[:, week[cap_idx] == w]
+        week_entries.append((np.full(cols.size, wi), cols, 1.0))
+    model.add_rows('captain_count_gw', len(captain_weeks), week_entries, upper=1,
+                   keys=[(w,) for w in captain_weeks])
+    model.add_rows('captain_lineup_rel', n_players * n_cap, [(cap_rows, C, 1.0), (cap_rows, L[:, cap_idx], -1.0)],
+                   upper=0, keys=[(p, d) for p in players for d in captain_days])
+
+    # Transfers
+    model.add_rows('squad_transfer_rel', n_players * horizon, [
+        (grid_rows, S, 1.0), (grid_rows, S_all[:, :-1], -1.0), (grid_rows, TI, -1.0),
+        (grid_rows, TOR, 1.0), (grid_rows[init_pos], TOF, 1.0),
+    ], lower=0, upper=0, keys=pd_keys)
+    model.add_rows('day_transfer_rel', horizon, [
+        (np.arange(horizon), NT, 1.0), (day_rows, TOR, -1.0),
+        (day_rows[:n_initial], TOF, -1.0), (wc_idx, WC, 10.0),
+    ], lower=0, keys=d_keys)
+    same_week_before = np.tril(week[:, None] == week[None, :])
+    rows, cols = np.nonzero(same_week_before)
+    running_rhs = np.where(week == data.gameweek_start, data.tm, 0).astype(float)
+    model.add_rows('running_transfer_rel', horizon, [(np.arange(horizon), RTC, 1.0), (rows, NT[cols], -1.0)],
+                   lower=running_rhs, upper=running_rhs, keys=d_keys)
+    model.add_rows('aux_transfer_rel', horizon, [(np.arange(horizon), AUX[1:], 1.0), (np.arange(horizon), RTC, -1.0)],
+                   lower=-2, keys=d_keys)
+    carries = np.array([d not in data.first_days_of_week for d in gamedays])
+    model.add_rows('aux_transfer_rel2', horizon, [
+        (np.arange(horizon), PT, 1.0), (np.arange(horizon), AUX[1:], -1.0),
+        (np.flatnonzero(carries), AUX[:-1][carries], 1.0),
+    ], lower=0, keys=d_keys)
+    model.add_rows('penalized_transfers_rel', horizon, [(np.arange(horizon), PT, 1.0), (np.arange(horizon), NT, -1.0)],
+                   upper=0, keys=d_keys)
+    model.add_rows('cont_budget', horizon, [
+        (np.arange(horizon), ITB[1:], 1.0), (np.arange(horizon), ITB[:-1], -1.0),
+        (day_rows[:n_initial], TOF, -np.broadcast_to(sell_price[init_pos, None], TOF.shape)),
+        (day_rows, TOR, -np.broadcast_to(buy_price[:, None], TOR.shape)),
+        (day_rows, TI, np.broadcast_to(buy_price[:, None], TI.shape)),
+    ], lower=0, upper=0, keys=d_keys)
+    init_rows = np.arange(n_initial * horizon).reshape(n_initial, horizon)
+    init_keys = [(p, d) for p in initial_squad for d in gamedays]
+    model.add_rows('multi_sell_1', n_initial * horizon, [(init_rows, TOF, 1.0), (init_rows, TOR[init_pos], 1.0)],
+                   upper=1, keys=init_keys)
+    dbar_idx, d_idx = np.nonzero(np.tril(np.ones((horizon, horizon), dtype=bool)))
+    later_dbar, later_d = np.nonzero(np.triu(np.ones((horizon, horizon), dtype=bool)))
+    base = (np.arange(n_initial) * horizon)[:, None]
+    model.add_rows('multi_sell_2', n_initial * horizon, [
+        (base + dbar_idx, TOF[:, d_idx], float(data.horizon)),
+        (base + later_dbar, TOR[init_pos][:, later_d], -1.0),
+    ], lower=0, keys=init_keys)
+    model.add_rows('multi_sell_3', n_initial, [(np.broadcast_to(np.arange(n_initial)[:, None], TOF.shape), TOF, 1.0)],
+                   upper=1, keys=[(p,) for p in initial_squad])
+    last_week = week == data.gameweeks[-1]
+    last_week_rhs = data.trf_last_gw - (data.tm if data.gameweeks[-1] == data.gameweeks[0] else 0)
+    model.add_rows('transfers_last_gw', 1, [(np.zeros(last_week.sum()), NT[last_week], 1.0)], upper=last_week_rhs)
+    model.add_rows('no_transfer_on_as', n_players * n_as, [(as_rows, TI[:, as_idx], 1.0), (as_rows, as_grid, 1.0)],
+                   upper=1, keys=as_keys)
+
+    # Banned/Forced players
+    def fix_squad(name, indices, value):
+        idx = np.array([player_pos[p] for p in indices], dtype=np.int64)
+        n = len(idx) * horizon
+        model.add_rows(name, n, [(np.arange(n), S[idx].ravel(), 1.0)], lower=value, upper=value,
+                       keys=[(p, d) for p in indices for d in gamedays])
+
+    fix_squad('banned_players', data.banned_players_indices, 0)
+    fix_squad('forced_players', data.forced_players_indices, 1)
+    for p, forced_days in data.forced_players_days_indices.items():
+        for d in forced_days:
+            model.add_rows(f'forced_player_{p}_{d}', 1, [([0], [squad.col((p, d))], 1.0)], lower=1, upper=1)
+
+    # Chips: at most one use when several days are allowed, one chip or captain per gameday
+    for chip_name, block in (('wc_limit', WC), ('as_limit', AS)):
+        if block.size > 1:
+            model.add_rows(chip_name, 1, [(np.zeros(block.size), block, 1.0)], upper=1)
+
+    model.add_rows('all_star_logic', n_players * n_as, [(as_rows, SA, 1.0), (as_rows, as_grid, -1.0)],
+                   upper=0, keys=as_keys)
+    chip_days = [d for d in gamedays if d in set(wc_days) | set(as_days)]
+    chip_row = {d: r for r, d in enumerate(chip_days)}
+    chip_cap = [k for k, d in enumerate(captain_days) if d in chip_row]
+    model.add_rows('one_chip_per_gd', len(chip_days), [
+        (np.broadcast_to([chip_row[captain_days[k]] for k in chip_cap], (n_players, len(chip_cap))), C[:, chip_cap], 1.0),
+        ([chip_row[d] for d in wc_days], WC, 1.0), ([chip_row[d] for d in as_days], AS, 1.0),
+    ], upper=1, keys=[(d,) for d in chip_days])
+
+    # ===== EXPRESSIONS READ BACK BY THE SOLVE LOOP =====
+    init_lookup = {p: i for i, p in enumerate(initial_squad)}
+    transfer_out = {}
+    for i, p in enumerate(players):
+        for j, d in enumerate(gamedays):
+            if p in init_lookup:
+                transfer_out[p, d] = LinearExpression(model, [TOR[i, j], TOF[init_lookup[p], j]], [1.0, 1.0])
+            else:
+                transfer_out[p, d] = LinearExpression(model, [TOR[i, j]], [1.0])
+
+    transfer_count = {
+        w: LinearExpression(model, NT[week == w], np.ones(int((week == w).sum())))
+        for w in data.gameweeks
+    }
+    transfer_count[data.gameweeks[0]] = transfer_count[data.gameweeks[0]] + data.tm
+
+    h = ModelHandles(
+        model=model,
+        expr_sum=expr_sum,
+        squad=squad,
+        squad_all_star=squad_all_star,
+        lineup=lineup,
+        captain=captain,
+        transfer_in=transfer_in,
+        transfer_out_first=transfer_out_first,
+        transfer_out_regular=transfer_out_regular,
+        transfer_out=transfer_out,
+        in_the_bank=in_the_bank,
+        number_of_transfers_day=number_of_transfers_day,
+        penalized_transfers=penalized_transfers,
+        use_wc=use_wc,
+        use_all_star=use_all_star,
+        gd_xp={},
+        gw_xp={},
+        transfer_count=transfer_count,
+    )
+    update_coefficients(h, data)
+    return h
+
+
+def update_coefficients(h: ModelHandles, data: ModelData) -> None:
+    """Set the parts of a matrix model that change between solves on the same structure.
+
+    These are the objective and the ``gd_xp``/``gw_xp`` expressions, which
+    follow the projections, decay, bench weight and FT value, and the
+    ``initial_itb`` right-hand side. Everything else depends only on the
+    inputs hashed by ``engine.model_template.structure_key``.
+    """
+    model = h.model
+    gamedays = data.gamedays
+    week = data.index.week_array
+    points = data.all_data.loc[data.players, [str(d) for d in gamedays]].to_numpy(dtype=float)
+    ft_value = np.array([data.ft_value_dict[d] for d in gamedays], dtype=float)
+    decay = np.array([pow(data.decay_base, d - data.next_gd) for d in gamedays], dtype=float)
+    day_pos = {d: j for j, d in enumerate(gamedays)}
+    captain_days = h.captain.index[1]
+    cap_idx = np.array([day_pos[d] for d in captain_days], dtype=np.int64)
+    S = h.squad.cols()[:, 1:]
+    L = h.lineup.cols()
+    C = h.captain.cols()
+    NT = h.number_of_transfers_day.cols()
+    PT = h.penalized_transfers.cols()
+
+    # Minimise minus the decayed objective of solve.py: lineup and captain
+    # points, bench points at bench_weight, FT value and the hit penalty.
+    bench_weight = data.bench_weight
+    model.set_objective(
+        np.concatenate([L.ravel(), C.ravel(), S.ravel(), NT, PT]),
+        np.concatenate([
+            (-decay * points * (1 - bench_weight)).ravel(),
+            (-decay[cap_idx] * points[:, cap_idx]).ravel(),
+            (-decay * bench_weight * points).ravel(),
+            ft_value,
+            100 - ft_value,
+        ]),
+    )
+    model.set_row_bounds('initial_itb', data.itb, data.itb)
+
+    captain_col = {d: k for k, d in enumerate(captain_days)}
+    h.gd_xp = {}
+    for j, d in enumerate(gamedays):
+        captained = C[:, captain_col[d]] if d in captain_col else np.zeros(0, dtype=np.int64)
+        h.gd_xp[d] = LinearExpression(
+            model,
+            np.concatenate([L[:, j], captained, [PT[j]]]),
+            np.concatenate([points[:, j], points[:, j][:captained.size], [-100.0]]),
+        )
+    h.gw_xp = {w: expr_sum(h.gd_xp[d] for j, d in enumerate(gamedays) if week[j] == w) for w in data.gameweeks}
@@ -0,0 +1,78 @@
+"""Starting solutions handed to the MIP solvers.
+
+An initial plan is either ``'heuristic'``, a picks DataFrame such as the
+``picks`` of an earlier solve, or the path of a saved picks CSV like
+``output/optimal_plan_decay.csv``. Its squads are replayed from today's
+squad within the transfer, team and budget rules, and the result is turned
+into a value for every column of the matrix model. The values are written
+in the solution-file formats CBC (``mips``) and the HiGHS executable
+(``--read_solution_file``) read, or passed to an in-process Highs directly.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from engine.heuristic import TOLERANCE, plan_from_squads, plan_heuristic, solution_vector
+from engine.model_data import ModelData, ModelHandles
+
+
+def squads_from_picks(picks: pd.DataFrame, data: ModelData, gameday_codes: dict) -> list:
+    """Squad of each gameday in ``picks`` as player positions; None where the plan has no rows.
+
+    Players sold on a gameday are listed next to the squad in picks, so rows
+    with ``transfer_out`` set are left out. Players no longer in the pool are
+    dropped.
+    """
+    names = data.all_data.loc[data.players, 'name'].to_numpy()
+    position_of = {name: i for i, name in enumerate(names)}
+    owned = picks[picks['transfer_out'] == 0] if 'transfer_out' in picks else picks
+    by_code = {
+        round(float(code), 1): {position_of[name] for name in rows['name'] if name in position_of}
+        for code, rows in owned.groupby('gameday')
+    }
+    return [by_code.get(round(float(gameday_codes[d]), 1)) for d in data.gamedays]
+
+
+def start_values(h: ModelHandles, data: ModelData, initial_plan, gameday_codes: dict) -> np.ndarray | None:
+    """Column values of the matrix model in ``h`` for ``initial_plan``, or None when unusable."""
+    if isinstance(initial_plan, str) and initial_plan == 'heuristic':
+        plan = plan_heuristic(data)
+    else:
+        picks = pd.read_csv(initial_plan) if isinstance(initial_plan, str) else initial_plan
+        plan = plan_from_squads(data, squads_from_picks(picks, data, gameday_codes))
+    values = solution_vector(h, data, plan)
+    violation = h.model.max_violation(values)
+    if violation > TOLERANCE:
+        print(f"Ignoring the MIP start: it violates the model by {violation:g}.")
+        return None
+    return values
+
+
+def write_cbc_start(path, model, values) -> None:
+    """Write ``values`` as a CBC solution file, which ``mips`` reads as a starting solution."""
+    objective = model.objective
+    with open(path, 'w') as f:
+        f.write(f"Optimal - objective value {float(objective @ values)!r}\n")
+        for j, name in enumerate(model.column_names()):
+            f.write(f"{j:>7} {name} {float(values[j])!r} {float(objective[j])!r}\n")
+
+
+def write_highs_start(path, model, values) -> None:
+    """Write ``values`` as a HiGHS solution file for ``--read_solution_file``.
+
+    HiGHS matches columns and rows by name and needs both sections, so the
+    row activities are written too.
+    """
+    activity = model.matrix @ values
+    with open(path, 'w') as f:
+        f.write("Model status\nOptimal\n\n# Primal solution values\nFeasible\n")
+        f.write(f"Objective {float(model.objective @ values)!r}\n")
+        f.write(f"# Columns {model.num_cols}\n")
+        for name, value in zip(model.column_names(), values):
+            f.write(f"{name} {float(value)!r}\n")
+        f.write(f"# Rows {model.num_rows}\n")
+        for name, value in zip(model.row_names(), activity):
+            f.write(f"{name} {float(value)!r}\n")
+        f.write("\n# Dual solution values\nNone\n")
@@ -0,0 +1,145 @@
+"""Prepared sets and parameters shared by the model builders."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable
+
+import pandas as pd
+
+from engine.model_index import ModelIndex
+
+# Squad rules the model builders encode as rows, for code that reasons about them directly
+SQUAD_SIZE = 10
+POSITION_SIZE = 5
+TEAM_LIMIT = 2
+
+
+@dataclass(slots=True)
+class ModelData:
+    """Everything a model builder needs once players have been filtered.
+
+    ``solve_multi_period_NBA`` resolves options, gameday codes and player
+    indices into this structure so the sasoptpy and matrix builders read the
+    same inputs and emit the same model.
+    """
+
+    all_data: pd.DataFrame
+    gameday_data: pd.DataFrame
+    players: list[int]
+    initial_squad: list[int]
+    element_types: list[str]
+    teams: list[str]
+    next_gd: int
+    gamedays: list[int]
+    all_gd: list[int]
+    gameweeks: list[int]
+    gameweek_start: int
+    first_days_of_week: set[int]
+    ft_value_dict: dict[int, float]
+    index: ModelIndex
+
+    horizon: int
+    tm: int
+    itb: float
+    captain_played: bool
+    decay_base: float
+    bench_weight: float
+    trf_last_gw: int
+
+    banned_players_indices: list[int] = field(default_factory=list)
+    forced_players_indices: list[int] = field(default_factory=list)
+    forced_players_days_indices: dict[int, list[int]] = field(default_factory=dict)
+
+    # Chip windows, already converted from gameday codes to gameday ids
+    wc_day: float = 0
+    wc_gameday: list[int] = field(default_factory=list)
+    wc_days: list[float] = field(default_factory=list)
+    wc_gamedays: list[int] = field(default_factory=list)
+    wc_range: range | list = field(default_factory=list)
+    all_star_day: float = 0
+    all_star_gameday: list[int] = field(default_factory=list)
+    all_star_days: list[float] = field(default_factory=list)
+    all_star_gamedays: list[int] = field(default_factory=list)
+    all_star_range: range | list = field(default_factory=list)
+    all_star_range_ids: list[int] = field(default_factory=list)
+
+    # How each player-reduction step shrank the pool, keyed by step name
+    reductions: dict[str, dict] = field(default_factory=dict)
+
+    def week_of(self, d: int) -> int:
+        """Return the gameweek a gameday id belongs to."""
+        return self.index.week_of_day[d]
+
+    def wc_allowed_days(self) -> list[int]:
+        """Gamedays of the horizon on which the wildcard may be played."""
+        if self.wc_day > 0:
+            allowed = self.wc_gameday[:1]
+        elif self.wc_days:
+            allowed = self.wc_gamedays
+        else:
+            allowed = self.wc_range
+        return [d for d in self.gamedays if d in allowed]
+
+    def all_star_allowed_days(self) -> list[int]:
+        """Gamedays of the horizon on which the All-Star chip may be played."""
+        if self.all_star_day > 0:
+            allowed = self.all_star_gameday[:1]
+        elif self.all_star_days:
+            allowed = self.all_star_gamedays
+        else:
+            allowed = self.all_star_range_ids if self.all_star_range else []
+        return [d for d in self.gamedays if d in allowed]
+
+    def captain_days(self) -> list[int]:
+        """Gamedays on which a captain may be picked: all but the first gameweek's once it is played."""
+        return [
+            d for d in self.gamedays
+            if not (self.captain_played and self.week_of(d) == self.gameweek_start)
+        ]
+
+    def restricted_to(self, players) -> "ModelData":
+        """Copy of this data with the player set limited to ``players``."""
+        keep = set(players)
+        players = [p for p in self.players if p in keep]
+        all_data = self.all_data.loc[players]
+        return replace(
+            self,
+            all_data=all_data,
+            players=players,
+            index=ModelIndex.build(all_data, players, self.gameday_data, self.gamedays, self.gameweeks),
+            banned_players_indices=[p for p in self.banned_players_indices if p in keep],
+            forced_players_indices=[p for p in self.forced_players_indices if p in keep],
+            forced_players_days_indices={
+                p: days for p, days in self.forced_players_days_indices.items() if p in keep
+            },
+            reductions=dict(self.reductions),
+        )
+
+
+@dataclass(slots=True)
+class ModelHandles:
+    """Variables and derived expressions the solve loop reads back.
+
+    Every entry supports ``[key].get_value()`` (or ``.get_value()`` for the
+    scalar expressions), whichever builder produced the model.
+    """
+
+    model: Any
+    expr_sum: Callable
+    squad: Any
+    squad_all_star: Any
+    lineup: Any
+    captain: Any
+    transfer_in: Any
+    transfer_out_first: Any
+    transfer_out_regular: Any
+    transfer_out: Any
+    in_the_bank: Any
+    number_of_transfers_day: Any
+    penalized_transfers: Any
+    use_wc: Any
+    use_all_star: Any
+    gd_xp: dict
+    gw_xp: dict
+    transfer_count: dict
@@ -0,0 +1,58 @@
+"""Membership indexes built once per solve for constraint generation."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(slots=True)
+class ModelIndex:
+    """Position, team and week memberships of the filtered players and gamedays.
+
+    Constraint families read these instead of scanning every player with
+    ``all_data.loc[p, ...]`` or every gameday with ``gameday_data.loc[d - 1, 'week']``.
+    """
+
+    players_by_position: dict[str, list[int]]
+    players_by_team: dict[str, list[int]]
+    days_by_week: dict[int, list[int]]
+    week_of_day: dict[int, int]
+    first_days_of_week: set[int]
+    position_of_player: np.ndarray
+    team_of_player: np.ndarray
+    week_array: np.ndarray
+
+    @classmethod
+    def build(cls, all_data: pd.DataFrame, players: list[int], gameday_data: pd.DataFrame,
+              gamedays: list[int], gameweeks: list[int]) -> "ModelIndex":
+        positions = all_data.loc[players, 'position'].to_numpy()
+        teams = all_data.loc[players, 'team'].to_numpy()
+        players_arr = np.asarray(players)
+
+        players_by_position = {
+            str(pos): players_arr[positions == pos].tolist() for pos in pd.unique(positions)
+        }
+        players_by_team = {
+            str(team): players_arr[teams == team].tolist() for team in pd.unique(teams)
+        }
+
+        week_by_id = dict(zip(gameday_data['id'].astype(int), gameday_data['week'].astype(int)))
+        week_of_day = {d: week_by_id[d] for d in gamedays}
+        days_by_week = {w: [] for w in gameweeks}
+        for d in gamedays:
+            days_by_week.setdefault(week_of_day[d], []).append(d)
+        first_days_of_week = {min(days) for days in days_by_week.values() if days}
+
+        return cls(
+            players_by_position=players_by_position,
+            players_by_team=players_by_team,
+            days_by_week=days_by_week,
+            week_of_day=week_of_day,
+            first_days_of_week=first_days_of_week,
+            position_of_player=positions,
+            team_of_player=teams,
+            week_array=np.array([week_of_day[d] for d in gamedays], dtype=np.int64),
+        )
@@ -0,0 +1,113 @@
+"""Matrix models kept between solves and updated in place.
+
+Re-solving after an xMins edit, or with a new bank balance, changes only
+the objective and the ``initial_itb`` right-hand side; the candidates,
+squad, horizon, prices and chip options fix everything else. A solve whose
+:func:`structure_key` matches a stored model takes that model, rolls back
+the rows the previous solve appended (alternative cutoffs, lazy rows) and
+only resets its coefficients, instead of building a new one.
+
+Reuse therefore only covers repeated solves of the same squad at the same
+prices: the squad and prices are built into the model's rows, so a
+transfer or a price change builds a new model. There is no process-wide
+store; a caller that solves repeatedly keeps a :class:`ModelTemplates` and
+passes it to each solve.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from engine.matrix_model import build_matrix_model, update_coefficients
+from engine.model_data import ModelData, ModelHandles
+
+# Stored models beyond this are dropped, least recently used first
+DEFAULT_MAX_MODELS = 4
+
+
+def structure_key(data: ModelData) -> str:
+    """Hash of every input that decides the variables, rows and matrix of the model.
+
+    This includes the initial squad and the buy and sell prices, so only
+    solves of the same squad at the same prices share a key.
+    """
+    prices = data.all_data.loc[data.players, ['price', 'sell_price']].to_numpy(dtype=float)
+    state = {
+        'players': data.players,
+        'initial_squad': data.initial_squad,
+        'positions': list(data.index.position_of_player),
+        'player_teams': list(data.index.team_of_player),
+        'element_types': data.element_types,
+        'teams': data.teams,
+        'gamedays': data.gamedays,
+        'all_gd': data.all_gd,
+        'weeks': data.index.week_array.tolist(),
+        'first_days_of_week': sorted(data.first_days_of_week),
+        'gameweek_start': data.gameweek_start,
+        'horizon': data.horizon,
+        'tm': data.tm,
+        'trf_last_gw': data.trf_last_gw,
+        'captain_played': data.captain_played,
+        'captain_days': data.captain_days(),
+        'wc_days': data.wc_allowed_days(),
+        'all_star_days': data.all_star_allowed_days(),
+        'banned': data.banned_players_indices,
+        'forced': data.forced_players_indices,
+        'forced_days': sorted(data.forced_players_days_indices.items()),
+    }
+    digest = hashlib.sha256(json.dumps(state, default=str).encode())
+    digest.update(prices.tobytes())
+    return digest.hexdigest()
+
+
+@dataclass(slots=True)
+class ModelTemplate:
+    """A built model, the key of its structure and its rows as first built."""
+
+    key: str
+    handles: ModelHandles
+    rows: tuple
+
+
+class ModelTemplates:
+    """Thread-safe store of built matrix models, keyed on :func:`structure_key`.
+
+    A model is taken out of the store for the length of a solve, so two
+    solves running at once never share one.
+    """
+
+    def __init__(self, max_models=DEFAULT_MAX_MODELS):
+        self.max_models = max_models
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, data: ModelData) -> tuple[ModelTemplate, bool]:
+        """Model for ``data`` and whether it was reused; hand it back with :meth:`put` when done."""
+        key = structure_key(data)
+        with self._lock:
+            template = self._templates.pop(key, None)
+        if template is None:
+            h = build_matrix_model(data)
+            return ModelTemplate(key, h, h.model.snapshot()), False
+        template.handles.model.restore(template.rows)
+        update_coefficients(template.handles, data)
+        return template, True
+
+    def put(self, template: ModelTemplate) -> None:
+        """Store ``template`` for later solves, dropping the oldest beyond ``max_models``."""
+        with self._lock:
+            self._templates[template.key] = template
+            while len(self._templates) > self.max_models:
+                self._templates.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+    def __len__(self):
+        return len(self._templates)
+
@@ -0,0 +1,251 @@
+"""Race several CBC/HiGHS configurations on the same exported model.
+
+Each configuration runs as its own process on the MPS file ``solve.py``
+already wrote. The first one to finish with a proven solution wins and the
+others are killed; if every run stops on the time limit, the best incumbent
+among them is used.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import time
+from dataclasses import dataclass
+
+from engine.cancellation import is_cancelled, stop_process_trees, write_last_improving_solution
+from engine.progress import LogProgressParser
+from engine.solution_reader import open_text
+
+DEFAULT_PORTFOLIO = [
+    {'solver': 'highs', 'random_seed': 0},
+    {'solver': 'highs', 'random_seed': 1},
+    {'solver': 'highs', 'random_seed': 2, 'presolve': 'off'},
+    {'solver': 'cbc', 'random_seed': 0},
+]
+
+# Statuses written to the solution file when the solver proved its target gap
+PROVEN_STATUSES = ('optimal',)
+
+
+@dataclass(slots=True)
+class PortfolioRun:
+    """One solver configuration of the portfolio and its process."""
+
+    name: str
+    solver: str
+    command: list[str]
+    solution_path: str
+    log_path: str
+    improving_path: str = ''
+    process: subprocess.Popen | None = None
+    status: str = ''
+    objective: float | None = None
+    elapsed: float = 0.0
+    parser: LogProgressParser | None = None
+    log_offset: int = 0
+
+
+def _highs_run(config, options, location_problem, prefix, start=None):
+    options_file = f'{prefix}_opt.txt'
+    with open(options_file, 'w') as f:
+        f.write(f"mip_rel_gap = {options.get('gap', 0)}\n")
+        f.write(f"mip_improving_solution_file = {prefix}_improving.txt\n")
+        f.write(f"log_file = {prefix}_HiGHS.log\n")
+    seed = config.get('random_seed', 0)
+    presolve = config.get('presolve', options.get('presolve', 'on'))
+    command = [
+        options.get('highs_path'), '--parallel', 'on', '--options_file', options_file,
+        '--random_seed', str(seed), '--presolve', presolve,
+        '--model_file', location_problem, '--time_limit', str(options.get('solve_time', 20 * 60)),
+        '--solution_file', f'{prefix}_sp.txt',
+    ]
+    if start:
+        command += ['--read_solution_file', start]
+    name = f'highs seed {seed}' + ('' if presolve == 'on' else f' presolve {presolve}')
+    return PortfolioRun(name=name, solver='highs', command=command, solution_path=f'{prefix}_sp.txt',
+                        log_path=f'{prefix}.log', improving_path=f'{prefix}_improving.txt')
+
+
+def _cbc_run(config, options, location_problem, prefix, start=None):
+    seed = config.get('random_seed', 0)
+    command = [
+        options.get('cbc_path'), location_problem, 'randomCbcSeed', str(seed),
+        'ratio', str(options.get('gap', 0)), 'sec', str(options.get('solve_time', 300)),
+        'cost', 'column', 'solve', 'solu', f'{prefix}_sp.txt',
+    ]
+    if start:
+        command[2:2] = ['mips', start]
+    return PortfolioRun(name=f'cbc seed {seed}', solver='cbc', command=command,
+                        solution_path=f'{prefix}_sp.txt', log_path=f'{prefix}.log')
+
+
+def build_portfolio(options, location_problem, path_prefix, starts=None):
+    """Turn the ``portfolio`` option into runs writing files that start with ``path_prefix``.
+
+    ``starts`` maps 'cbc' and 'highs' to starting solution files in that solver's format.
+    Runs of a solver whose ``cbc_path`` or ``highs_path`` option is not set are
+    left out; a portfolio with no runs left raises ``ValueError``.
+    """
+    starts = starts or {}
+    runs = []
+    skipped = set()
+    for i, config in enumerate(options.get('portfolio') or DEFAULT_PORTFOLIO):
+        prefix = f'{path_prefix}_p{i}'
+        solver = config.get('solver')
+        if solver not in ('cbc', 'highs'):
+            raise ValueError(f"Unknown portfolio solver '{solver}'. Use 'cbc' or 'highs'.")
+        if not options.get(f'{solver}_path'):
+            skipped.add(solver)
+        elif solver == 'highs':
+            runs.append(_highs_run(config, options, location_problem, prefix, starts.get('highs')))
+        else:
+            runs.append(_cbc_run(config, options, location_problem, prefix, starts.get('cbc')))
+    for solver in sorted(skipped):
+        print(f"Portfolio: {solver}_path is not set; leaving out the {solver} runs.")
+    if not runs:
+        raise ValueError("No portfolio run has a solver executable. Set cbc_path or highs_path.")
+    return runs
+
+
+def read_solution_status(path, solver):
+    """Return ``(status, objective)`` from the header of a solution file.
+
+    The objective is None unless the file holds a feasible solution: CBC's
+    "Optimal" or one of its "Stopped on ..." statuses with an integer
+    solution, or a HiGHS file whose primal solution is "Feasible".
+    """
+    status, objective = '', None
+    if not os.path.exists(path):
+        return status, objective
+    with open_text(path) as f:
+        if solver == 'cbc':
+            # e.g. "Optimal - objective value -384.91" or "Stopped on time - objective value ..."
+            header = f.readline()
+            status = header.split(' - ')[0].strip().lower()
+            feasible = status == 'optimal' or (
+                status.startswith('stopped on') and 'no integer solution' not in header.lower()
+            )
+            if feasible and 'objective value' in header:
+                objective = float(header.rsplit(' ', 1)[1])
+        else:
+            feasible = False
+            lines = iter(f)
+            for line in lines:
+                if line.startswith('Model status'):
+                    status = next(lines, '').strip().lower()
+                elif line.startswith('# Primal solution values'):
+                    feasible = next(lines, '').strip().lower() == 'feasible'
+                elif line.startswith('Objective') and feasible:
+                    objective = float(line.split()[1])
+                elif line.startswith('# Columns'):
+                    break
+    return status, objective
+
+
+def _finished(run):
+    """True once the run has exited, or HiGHS has printed its solving report.
+
+    The HiGHS executable can linger after writing its solution, so the report
+    line is treated as completion (the single-solver path kills it the same way).
+    """
+    if run.process.poll() is not None:
+        return True
+    if run.solver != 'highs':
+        return False
+    with open(run.log_path, 'r', errors='replace') as f:
+        if 'Solving report' not in f.read():
+            return False
+    # Give it the same two seconds as the single-solver path to write the solution
+    try:
+        run.process.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        pass
+    return True
+
+
+def _kill(run):
+    if run.process is None or run.process.poll() is not None:
+        return
+    try:
+        if os.name == 'posix':
+            os.killpg(run.process.pid, signal.SIGKILL)
+        else:
+            run.process.kill()
+    except ProcessLookupError:
+        pass
+    run.process.wait()
+
+
+def _report_progress(run, progress_callback):
+    """Feed lines appended to the run's log since the last poll to its parser."""
+    with open(run.log_path, 'rb') as f:
+        f.seek(run.log_offset)
+        data = f.read()
+    # Leave a partly written last line for the next poll
+    complete = data[:data.rfind(b'\n') + 1]
+    run.log_offset += len(complete)
+    for line in complete.decode(errors='replace').splitlines():
+        event = run.parser.feed(line)
+        if event is not None:
+            progress_callback(event)
+
+
+def _stop_cancelled(runs):
+    """Interrupt every run and collect the incumbents they leave behind."""
+    stop_process_trees([run.process for run in runs])
+    for run in runs:
+        if run.improving_path and not os.path.exists(run.solution_path):
+            write_last_improving_solution(run.improving_path, run.solution_path)
+        run.status, run.objective = read_solution_status(run.solution_path, run.solver)
+
+
+def race(runs, progress_callback=None, cancel_token=None, poll_interval=0.2):
+    """Start every run, wait for a winner and kill the rest.
+
+    ``progress_callback`` receives the progress events of every run, tagged
+    with the run's name. Cancelling ``cancel_token`` interrupts all runs and
+    keeps the best incumbent among them. Returns the winning
+    :class:`PortfolioRun`, or None when no run produced a solution.
+    """
+    t0 = time.time()
+    for run in runs:
+        run.parser = LogProgressParser(run.solver, name=run.name)
+        with open(run.log_path, 'w') as log:
+            run.process = subprocess.Popen(
+                run.command, stdout=log, stderr=subprocess.STDOUT, start_new_session=os.name == 'posix'
+            )
+    print(f"Portfolio: racing {', '.join(run.name for run in runs)}")
+
+    winner = None
+    try:
+        pending = list(runs)
+        while pending:
+            if is_cancelled(cancel_token):
+                _stop_cancelled(pending)
+                break
+            if progress_callback is not None:
+                for run in pending:
+                    _report_progress(run, progress_callback)
+            for run in [r for r in pending if _finished(r)]:
+                pending.remove(run)
+                run.elapsed = time.time() - t0
+                run.status, run.objective = read_solution_status(run.solution_path, run.solver)
+                print(f"Portfolio: {run.name} finished in {round(run.elapsed, 1)}s ({run.status or 'no solution'})")
+                if run.status in PROVEN_STATUSES:
+                    winner = run
+                    break
+            if winner is not None:
+                break
+            time.sleep(poll_interval)
+    finally:
+        for run in runs:
+            _kill(run)
+
+    if winner is None:
+        finished = [run for run in runs if run.objective is not None]
+        winner = min(finished, key=lambda run: run.objective, default=None)
+    if winner is not None:
+        print(f"Portfolio: using {winner.name}")
+    return winner
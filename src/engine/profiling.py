@@ -0,0 +1,131 @@
+"""Per-phase wall time, memory and model size of a solve.
+
+``solve_multi_period_NBA`` marks where each phase starts (reading data,
+filtering, building, writing the MPS, solving, parsing, extracting results),
+and the profile is returned with the results. Phases that repeat across
+alternative plans accumulate.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+
+from engine.matrix_model import MatrixModel
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb() -> float | None:
+    """High-water mark of this process's resident memory, or None where unavailable.
+
+    This is the peak over the life of the process, not of any one phase.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def current_rss_mb() -> float | None:
+    """Resident memory of this process right now, or None where unavailable (only Linux reports it)."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return round(pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024), 1)
+
+
+def model_size(model) -> dict:
+    """Rows, columns and nonzeros of a matrix or sasoptpy model."""
+    if isinstance(model, MatrixModel):
+        return {'rows': model.num_rows, 'columns': model.num_cols, 'nonzeros': int(model.matrix.nnz)}
+    constraints = model.get_constraints()
+    nonzeros = sum(len(c._linCoef) - ('CONST' in c._linCoef) for c in constraints)
+    return {'rows': len(constraints), 'columns': len(model.get_variables()), 'nonzeros': nonzeros}
+
+
+@dataclass(slots=True)
+class PhaseRecord:
+    """Totals for one named phase.
+
+    ``rss_start_mb`` is the resident memory when the phase last started.
+    ``peak_growth_mb`` is the most any one call of the phase raised the
+    process memory high-water mark; a phase that stays below an earlier
+    peak shows 0. ``objects`` is the number of gc-tracked objects when the
+    phase last ended, if the profiler counts them.
+    """
+
+    name: str
+    seconds: float = 0.0
+    calls: int = 0
+    rss_start_mb: float | None = None
+    peak_growth_mb: float | None = None
+    objects: int | None = None
+
+
+class PhaseProfiler:
+    """Lap timer over the phases of a solve.
+
+    ``count_objects`` also counts gc-tracked objects at the end of each
+    phase. That walks every object in the process, so it is off by default.
+    """
+
+    def __init__(self, count_objects: bool = False):
+        self.count_objects = count_objects
+        self.phases: dict[str, PhaseRecord] = {}
+        self.model: dict = {}
+        self._current = None
+        self._started = 0.0
+        self._peak_at_start = None
+
+    def start(self, name: str) -> None:
+        """End the running phase, if any, and start ``name``."""
+        self.stop()
+        self._current = self.phases.setdefault(name, PhaseRecord(name))
+        self._current.rss_start_mb = current_rss_mb()
+        self._peak_at_start = peak_rss_mb()
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        """End the running phase."""
+        if self._current is None:
+            return
+        record = self._current
+        record.seconds += time.perf_counter() - self._started
+        record.calls += 1
+        peak = peak_rss_mb()
+        if peak is not None and self._peak_at_start is not None:
+            growth = round(peak - self._peak_at_start, 1)
+            record.peak_growth_mb = max(growth, record.peak_growth_mb or 0.0)
+        if self.count_objects:
+            record.objects = len(gc.get_objects())
+        self._current = None
+
+    def record_model(self, model) -> None:
+        self.model = model_size(model)
+
+    def as_dict(self) -> dict:
+        self.stop()
+        phases = [
+            {**asdict(record), 'seconds': round(record.seconds, 4)} for record in self.phases.values()
+        ]
+        return {
+            'phases': phases,
+            'total_seconds': round(sum(record.seconds for record in self.phases.values()), 4),
+            'model': dict(self.model),
+        }
+
+    def write_jsonl(self, path: str, **context) -> None:
+        """Append this profile as one JSON line, with ``context`` fields first."""
+        with open(path, 'a') as f:
+            f.write(json.dumps({'timestamp': time.time(), **context, **self.as_dict()}) + '\n')
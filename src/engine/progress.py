@@ -0,0 +1,109 @@
+"""Typed progress events parsed from CBC and HiGHS solver output."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, replace
+
+# CBC reports "no incumbent yet" as an objective of 1e+50
+CBC_NO_SOLUTION = 1e49
+
+_HIGHS_NODE_LINE = re.compile(
+    r'^\s*[A-Za-z]?\s+(?P<nodes>\d+)\s+\d+\s+\d+\s+[\d.]+%\s+'
+    r'(?P<bound>\S+)\s+(?P<incumbent>\S+)\s+(?P<gap>\S+)'
+    r'(?:\s+\S+){4}\s+(?P<elapsed>[\d.]+)s\s*$'
+)
+_CBC_STATUS_LINE = re.compile(
+    r'Cbc0010I After (?P<nodes>\d+) nodes, \d+ on tree, (?P<incumbent>\S+) best solution, '
+    r'best possible (?P<bound>\S+) \((?P<elapsed>[\d.]+) seconds\)'
+)
+_CBC_SOLUTION_LINE = re.compile(
+    r'Cbc00(?:04|12)I Integer solution of (?P<incumbent>\S+) found.*?'
+    r'(?P<nodes>\d+) nodes \((?P<elapsed>[\d.]+) seconds\)'
+)
+
+
+@dataclass(slots=True)
+class SolverProgress:
+    """One snapshot of a running MIP search.
+
+    Objectives are in the solver's sense (the model minimises negative
+    expected points). ``gap`` is relative, so 0.05 means 5%. Fields the
+    solver has not reported yet are None.
+    """
+
+    solver: str
+    elapsed: float | None = None
+    nodes: int | None = None
+    incumbent: float | None = None
+    best_bound: float | None = None
+    gap: float | None = None
+
+
+def relative_gap(incumbent, best_bound):
+    """HiGHS-style relative gap ``|incumbent - bound| / |incumbent|``, or None."""
+    if incumbent is None or best_bound is None:
+        return None
+    return abs(incumbent - best_bound) / max(abs(incumbent), 1e-9)
+
+
+def _to_float(text):
+    try:
+        value = float(text.rstrip('%'))
+    except ValueError:
+        return None
+    return None if value in (float('inf'), float('-inf')) else value
+
+
+class LogProgressParser:
+    """Turn CBC or HiGHS log lines into :class:`SolverProgress` events.
+
+    CBC spreads the state over several message types, so the parser keeps
+    the latest value of each field and every event carries all of them.
+    """
+
+    def __init__(self, solver, name=None):
+        if solver not in ('cbc', 'highs'):
+            raise ValueError(f"No progress parser for solver '{solver}'. Use 'cbc' or 'highs'.")
+        self.solver = solver
+        self.state = SolverProgress(solver=name or solver)
+
+    def feed(self, line):
+        """Parse one log line; returns an event when it carried progress, else None."""
+        if self.solver == 'highs':
+            match = _HIGHS_NODE_LINE.match(line)
+            if match is None:
+                return None
+            self.state.best_bound = _to_float(match['bound'])
+            self.state.incumbent = _to_float(match['incumbent'])
+            gap = _to_float(match['gap'])
+            self.state.gap = None if gap is None else gap / 100
+        else:
+            match = _CBC_STATUS_LINE.search(line) or _CBC_SOLUTION_LINE.search(line)
+            if match is None:
+                return None
+            incumbent = _to_float(match['incumbent'])
+            self.state.incumbent = None if incumbent is None or incumbent >= CBC_NO_SOLUTION else incumbent
+            if 'bound' in match.groupdict():
+                self.state.best_bound = _to_float(match['bound'])
+            self.state.gap = relative_gap(self.state.incumbent, self.state.best_bound)
+        self.state.nodes = int(match['nodes'])
+        self.state.elapsed = float(match['elapsed'])
+        return replace(self.state)
+
+
+def progress_from_highs(data, name='highs', elapsed=None):
+    """Build an event from a highspy callback's ``data_out`` or a ``HighsInfo``.
+
+    ``HighsInfo`` has no running time, so pass ``elapsed`` with it.
+    """
+    incumbent = _to_float(str(data.objective_function_value))
+    best_bound = _to_float(str(data.mip_dual_bound))
+    return SolverProgress(
+        solver=name,
+        elapsed=float(data.running_time if elapsed is None else elapsed),
+        nodes=int(data.mip_node_count),
+        incumbent=incumbent,
+        best_bound=best_bound,
+        gap=relative_gap(incumbent, best_bound),
+    )
@@ -0,0 +1,93 @@
+"""Reduced-cost player pruning from the LP relaxation.
+
+A binary that is 0 in the LP optimum with reduced cost ``rc`` can only turn
+on at an objective of at least ``z_LP + rc``. When that exceeds the objective
+of a known plan, no better plan uses it. A player outside the initial squad
+can only join the squad through ``transfer_in`` or ``squad_all_star``; once
+all of those columns are ruled out, the player can be dropped without
+changing the optimum.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from engine.highs_backend import create_highs, pass_model, read_primal
+from engine.matrix_model import build_matrix_model
+from engine.model_data import ModelData
+
+# Reduced costs below this are treated as zero
+RC_TOLERANCE = 1e-6
+
+
+@dataclass(slots=True)
+class PruningResult:
+    """Players that survive pruning, and the bounds the decision was made with."""
+
+    keep: list[int]
+    lp_bound: float
+    incumbent: float
+    pruned: int
+
+
+def _solve_lp(model, options):
+    highs = create_highs({**options, 'solver_output': False})
+    pass_model(highs, model)
+    highs.changeColsIntegrality(
+        model.num_cols, np.arange(model.num_cols, dtype=np.int32), np.zeros(model.num_cols, dtype=np.uint8)
+    )
+    highs.run()
+    solution = highs.getSolution()
+    if not solution.dual_valid:
+        return None, None, None
+    return (
+        highs.getInfo().objective_function_value,
+        np.asarray(solution.col_value, dtype=float),
+        np.asarray(solution.col_dual, dtype=float),
+    )
+
+
+def _solve_incumbent(data: ModelData, candidates, options):
+    """Objective of a quick MIP over ``candidates``, or None without a solution."""
+    h = build_matrix_model(data.restricted_to(candidates))
+    highs = create_highs({**options, 'solver_output': False, 'solve_time': options.get('prune_time', 30)})
+    pass_model(highs, h.model)
+    highs.run()
+    if not read_primal(highs, h.model):
+        return None
+    return h.model.get_objective_value()
+
+
+def reduced_cost_prune(data: ModelData, candidates, keep, options):
+    """Drop players of ``data`` that cannot be in a plan better than the best plan over ``candidates``.
+
+    ``candidates`` is a cheap shortlist (the threshold filter) whose quick MIP
+    gives the incumbent; ``keep`` lists players that must never be pruned.
+    Returns None when either the LP or the incumbent could not be solved.
+    """
+    incumbent = _solve_incumbent(data, candidates, options)
+    if incumbent is None:
+        return None
+
+    h = build_matrix_model(data)
+    lp_bound, values, reduced_costs = _solve_lp(h.model, options)
+    if lp_bound is None:
+        return None
+
+    slack = incumbent - lp_bound + RC_TOLERANCE
+    can_enter = np.zeros(len(data.players), dtype=bool)
+    # All-Star squad columns only exist on days the chip may be played
+    for block in (h.transfer_in.cols(), h.squad_all_star.cols()):
+        open_cols = (values[block] > RC_TOLERANCE) | (reduced_costs[block] <= slack)
+        can_enter |= open_cols.any(axis=1)
+
+    keep = set(keep) | set(data.initial_squad)
+    survivors = [p for p, entered in zip(data.players, can_enter) if entered or p in keep]
+    return PruningResult(
+        keep=survivors,
+        lp_bound=lp_bound,
+        incumbent=incumbent,
+        pruned=len(data.players) - len(survivors),
+    )
@@ -0,0 +1,32 @@
+"""League reference tables shared by every solve."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+import pandas as pd
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceData:
+    """Teams, the gameday table and live prices, read once and reused.
+
+    ``solve_multi_period_NBA`` reads these from ``data/`` on every call unless
+    one is passed in, so batch and scenario runs should load it up front.
+    The solver never modifies the frames.
+    """
+
+    teams: pd.DataFrame
+    gameday_data: pd.DataFrame
+    live_prices: pd.DataFrame
+
+    @classmethod
+    def load(cls, root: str = 'data') -> "ReferenceData":
+        """Read ``teams.csv``, ``fixture_info.csv`` and ``players.csv`` from ``root``."""
+        players = pd.read_csv(os.path.join(root, 'players.csv'))
+        return cls(
+            teams=pd.read_csv(os.path.join(root, 'teams.csv')),
+            gameday_data=pd.read_csv(os.path.join(root, 'fixture_info.csv')),
+            live_prices=players[['name', 'price']],
+        )
@@ -0,0 +1,134 @@
+"""On-disk cache of finished solves, keyed on a hash of the model inputs.
+
+Re-running a solve with the same projections, squad state, reference data
+and options returns the stored ``results`` instead of solving again. The key
+is taken from those inputs as passed in, before the player filters and
+pruning run, so a hit skips them as well as the solve. Entries are pickles
+named by the SHA-256 of the inputs, so a change to any of them is a miss and
+stale entries simply age out.
+
+Caching is off unless the ``cache`` option is set. Solves given a warm
+start are never cached: the start can change which plan a time-limited
+solve returns, and a start file can change on disk under the same name.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from engine.reference_data import ReferenceData
+
+# Bump when the layout of cached results changes
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = 'cache/solves'
+DEFAULT_MAX_MB = 256
+DEFAULT_MAX_AGE_DAYS = 30
+
+# Options that change how a solve runs or is reported, but not its plans
+_IGNORED_OPTIONS = {
+    'cbc_path', 'highs_path', 'solver_output', 'team_id', 'cache', 'cache_dir',
+    'cache_max_mb', 'cache_max_age_days', 'reuse_model', 'profile_log', 'profile_objects',
+    'write_outputs', 'keep_artifacts', 'workspace_dir', 'mps_compression', 'artifacts_max_mb',
+}
+
+
+def _hash_frame(digest, frame: pd.DataFrame) -> None:
+    digest.update(json.dumps([str(c) for c in frame.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+
+
+def cache_key(all_data, squad, sell_prices, gd, itb, options: dict, reference_data: ReferenceData) -> str:
+    """Hash of everything that decides the plans of a solve, as passed to ``solve_multi_period_NBA``."""
+    digest = hashlib.sha256(f'v{CACHE_VERSION}'.encode())
+    for frame in (all_data, reference_data.teams, reference_data.gameday_data, reference_data.live_prices):
+        _hash_frame(digest, frame)
+
+    state = {
+        'squad': list(squad),
+        'sell_prices': [round(float(price), 4) for price in sell_prices],
+        'gd': float(gd),
+        'itb': round(float(itb), 4),
+        'options': {k: v for k, v in options.items() if k not in _IGNORED_OPTIONS},
+    }
+    digest.update(json.dumps(state, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Directory of pickled solve results with size and age limits."""
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_mb=DEFAULT_MAX_MB, max_age_days=DEFAULT_MAX_AGE_DAYS):
+        self.root = Path(root)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.max_age = max_age_days * 86400
+
+    @classmethod
+    def from_options(cls, options: dict) -> "ResultCache | None":
+        """Cache configured by ``options``, or None when caching is turned off."""
+        if not options.get('cache', False):
+            return None
+        return cls(
+            options.get('cache_dir', DEFAULT_CACHE_DIR),
+            options.get('cache_max_mb', DEFAULT_MAX_MB),
+            options.get('cache_max_age_days', DEFAULT_MAX_AGE_DAYS),
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.root / f'{key}.pkl'
+
+    def get(self, key: str):
+        """Stored result for ``key``, or None on a miss or an unreadable entry."""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                return None
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        # Hits refresh the entry so eviction drops the least recently used first
+        os.utime(path)
+        return value
+
+    def put(self, key: str, value) -> None:
+        """Store ``value`` under ``key`` and evict entries over the limits."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete expired entries, then the oldest ones until under the size cap."""
+        now = time.time()
+        entries = []
+        for path in self.root.glob('*.pkl'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
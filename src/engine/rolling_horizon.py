@@ -0,0 +1,105 @@
+"""Rolling-horizon relax-and-fix over the in-process HiGHS backend.
+
+Long horizons are solved as a sequence of overlapping windows on the full
+model: gamedays inside the window keep their integer variables, later
+gamedays are relaxed to the LP, and once a window is solved the integer
+decisions of its first ``step`` gamedays are fixed before rolling forward.
+All constraints and the objective (decay, FT value, chips) stay those of
+the full model, so the last window leaves a plan for the whole horizon.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from engine.highs_backend import IncrementalHighs
+from engine.matrix_model import MatrixModel
+
+CONTINUOUS = 0
+INTEGER = 1
+
+
+@dataclass(slots=True)
+class WindowTiming:
+    """Gamedays and solve time of one rolling-horizon window."""
+
+    window: int
+    first_gameday: int
+    last_gameday: int
+    fixed_through: int | None
+    seconds: float
+    solved: bool
+
+
+class RollingHorizon:
+    """Solve a :class:`MatrixModel` window by window on an :class:`IncrementalHighs`.
+
+    ``window`` and ``step`` count gamedays; ``step`` defaults to half the window.
+    """
+
+    def __init__(self, incremental_highs: IncrementalHighs, gamedays, window, step=None):
+        if window < 1:
+            raise ValueError("rolling_window must be at least 1 gameday.")
+        step = step or max(window // 2, 1)
+        if not 1 <= step <= window:
+            raise ValueError("rolling_step must be between 1 and rolling_window.")
+        self.incremental_highs = incremental_highs
+        self.gamedays = list(gamedays)
+        self.window = window
+        self.step = step
+
+    def solve(self, model: MatrixModel):
+        """Solve every window; returns ``(solved, timings)``.
+
+        ``solved`` is False when a window had no solution, in which case the
+        model's solution is not a complete plan.
+        """
+        inc = self.incremental_highs
+        inc.load(model)
+        highs = inc.highs
+        all_cols = np.arange(model.num_cols, dtype=np.int32)
+        lower, upper = model.col_lower, model.col_upper
+        integer = model.integrality
+        # Gameday position of every column; columns before the horizon go with the first window
+        position = np.searchsorted(self.gamedays, model.column_periods())
+
+        timings = []
+        start = 0
+        solved = True
+        try:
+            while True:
+                end = start + self.window
+                final = end >= len(self.gamedays)
+                in_tail = position >= end
+                highs.changeColsIntegrality(
+                    model.num_cols, all_cols, np.where(integer & ~in_tail, INTEGER, CONTINUOUS).astype(np.uint8)
+                )
+
+                t0 = time.time()
+                solved = inc.run(model)
+                last = min(end, len(self.gamedays)) - 1
+                fixed_through = None if final else self.gamedays[start + self.step - 1]
+                timings.append(WindowTiming(
+                    window=len(timings) + 1,
+                    first_gameday=self.gamedays[start],
+                    last_gameday=self.gamedays[last],
+                    fixed_through=fixed_through,
+                    seconds=time.time() - t0,
+                    solved=solved,
+                ))
+                print(f"Window {len(timings)}: gamedays {self.gamedays[start]}-{self.gamedays[last]} "
+                      f"in {round(timings[-1].seconds, 1)}s")
+                if final or not solved:
+                    break
+
+                start += self.step
+                fix = np.flatnonzero(integer & (position < start))
+                values = model.solution[fix]
+                highs.changeColsBounds(len(fix), fix.astype(np.int32), values, values)
+        finally:
+            highs.changeColsIntegrality(model.num_cols, all_cols, integer.astype(np.uint8))
+            highs.changeColsBounds(model.num_cols, all_cols, lower, upper)
+        return solved, timings
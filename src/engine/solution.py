@@ -0,0 +1,182 @@
+"""Dense read-back of a solved plan and the tables and summaries built from it.
+
+The solution is read once into NumPy arrays shaped (players, gamedays) or
+(gamedays,); ``picks``, the action summary and ``chips_used`` are then
+derived with array operations instead of a ``get_value()`` call per player,
+gameday and variable. A sasoptpy model read from a solution file is filled
+from the value vector ``read_solution_values`` returned, with one name
+lookup per variable family.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.matrix_model import VariableBlock
+from engine.model_data import ModelData, ModelHandles
+from engine.solution_reader import ColumnOrder
+
+PICK_COLUMNS = ['gameday', 'name', 'pos', 'team', 'price', 'xP', 'lineup', 'captain', 'transfer_in', 'transfer_out']
+
+
+def _value(var, key) -> float:
+    # Chip and captain handles are dicts over the gamedays they exist on
+    if isinstance(var, dict) and key not in var:
+        return 0.0
+    return var[key].get_value()
+
+
+def _take(var, keys, solution) -> np.ndarray:
+    """Values of ``var[key]`` for each key from a ``(ColumnOrder, values)`` pair; absent keys are zero."""
+    order, values = solution
+    names = [None if isinstance(var, dict) and key not in var else var[key].get_name() for key in keys]
+    positions = order.index.get_indexer(names)
+    return np.where(positions >= 0, values[positions], 0.0)
+
+
+def _grid(var, rows, gamedays, solution=None) -> np.ndarray:
+    if isinstance(var, VariableBlock):
+        return var.values(gamedays)
+    if solution is not None:
+        return _take(var, [(p, d) for p in rows for d in gamedays], solution).reshape(len(rows), len(gamedays))
+    return np.array([[_value(var, (p, d)) for d in gamedays] for p in rows], dtype=float).reshape(
+        len(rows), len(gamedays)
+    )
+
+
+def _line(var, gamedays, solution=None) -> np.ndarray:
+    if isinstance(var, VariableBlock):
+        return var.values(gamedays)
+    if solution is not None:
+        return _take(var, gamedays, solution)
+    return np.array([_value(var, d) for d in gamedays], dtype=float)
+
+
+@dataclass(slots=True)
+class PlanArrays:
+    """Solution values of one plan; player arrays follow ``ModelData.players``."""
+
+    squad: np.ndarray
+    squad_all_star: np.ndarray
+    lineup: np.ndarray
+    captain: np.ndarray
+    transfer_in: np.ndarray
+    transfer_out: np.ndarray
+    use_wc: np.ndarray
+    use_all_star: np.ndarray
+    in_the_bank: np.ndarray
+    penalized_transfers: np.ndarray
+    gd_xp: np.ndarray
+    gw_xp: np.ndarray
+    transfer_count: np.ndarray
+
+    @classmethod
+    def read(cls, h: ModelHandles, data: ModelData, column_order: ColumnOrder | None = None,
+             values: np.ndarray | None = None) -> "PlanArrays":
+        """Read the plan from ``h``.
+
+        ``values`` is what ``read_solution_values`` returned for a sasoptpy
+        model's ``column_order``; without it each variable is asked for its
+        value in turn.
+        """
+        players, days = data.players, data.gamedays
+        solution = None if values is None else (column_order, values)
+        transfer_out = _grid(h.transfer_out_regular, players, days, solution)
+        if data.initial_squad:
+            rows = {p: i for i, p in enumerate(players)}
+            first = _grid(h.transfer_out_first, data.initial_squad, days, solution)
+            transfer_out[[rows[p] for p in data.initial_squad]] += first
+        return cls(
+            squad=_grid(h.squad, players, days, solution),
+            squad_all_star=_grid(h.squad_all_star, players, days, solution),
+            lineup=_grid(h.lineup, players, days, solution),
+            captain=_grid(h.captain, players, days, solution),
+            transfer_in=_grid(h.transfer_in, players, days, solution),
+            transfer_out=transfer_out,
+            use_wc=_line(h.use_wc, days, solution),
+            use_all_star=_line(h.use_all_star, days, solution),
+            in_the_bank=_line(h.in_the_bank, days, solution),
+            penalized_transfers=_line(h.penalized_transfers, days, solution),
+            gd_xp=np.array([h.gd_xp[d].get_value() for d in days], dtype=float),
+            gw_xp=np.array([h.gw_xp[w].get_value() for w in data.gameweeks], dtype=float),
+            transfer_count=np.array([h.transfer_count[w].get_value() for w in data.gameweeks], dtype=float),
+        )
+
+    def total_xp(self) -> float:
+        return float(sum(self.gw_xp.tolist()))
+
+    def in_squad(self) -> np.ndarray:
+        """Players owned each gameday: the All-Star squad on chip days, else squad plus sales."""
+        all_star = self.use_all_star > 0.5
+        return np.where(all_star, self.squad_all_star > 0.5, self.squad + self.transfer_out > 0.5)
+
+
+def picks_frame(plan: PlanArrays, data: ModelData, gameday_codes: dict) -> pd.DataFrame:
+    """Squad of every gameday, sorted by gameday, price and projection."""
+    day_idx, player_idx = np.nonzero(plan.in_squad().T)
+    frame = data.all_data.loc[data.players]
+    points = frame[[str(d) for d in data.gamedays]].to_numpy(dtype=float)
+
+    def flag(values):
+        return (values[player_idx, day_idx] > 0.5).astype(int)
+
+    picks = pd.DataFrame({
+        'gameday': [gameday_codes[data.gamedays[j]] for j in day_idx],
+        'name': frame['name'].to_numpy()[player_idx],
+        'pos': frame['position'].to_numpy()[player_idx],
+        'team': frame['team'].to_numpy()[player_idx],
+        'price': frame['price'].to_numpy()[player_idx],
+        'xP': np.round(points[player_idx, day_idx], 2),
+        'lineup': flag(plan.lineup),
+        'captain': flag(plan.captain),
+        'transfer_in': flag(plan.transfer_in),
+        'transfer_out': flag(plan.transfer_out),
+    }, columns=PICK_COLUMNS)
+    return picks.sort_values(by=['gameday', 'price', 'xP'], ascending=[True, False, False])
+
+
+def action_summary(plan: PlanArrays, data: ModelData, gameday_codes: dict) -> tuple[str, dict]:
+    """Text of each gameday's chips, xPTS, ITB and moves, plus the chips played by gameday code."""
+    names = data.all_data.loc[data.players, 'name'].to_numpy()
+    moves = [
+        ('Buy {p} - {name}', plan.transfer_in > 0.5),
+        ('Sell {p} - {name}', plan.transfer_out > 0.5),
+        ('Captain - {name}', plan.captain > 0.5),
+        ('All-Star - {name}', plan.squad_all_star > 0.5),
+    ]
+    active = np.zeros_like(plan.transfer_in, dtype=bool)
+    for _, flags in moves:
+        active |= flags
+
+    lines = []
+    chips_used = {}
+    for j, d in enumerate(data.gamedays):
+        code = gameday_codes[d]
+        lines.append(f"** GD {code}:")
+        if plan.use_wc[j] > 0.5:
+            lines.append("CHIP: WILDCARD")
+            chips_used[code] = " - WILDCARD"
+        if plan.use_all_star[j] > 0.5:
+            lines.append("CHIP: ALL STAR")
+            chips_used[code] = " - ALL STAR"
+        lines.append(f"xPTS: {round(float(plan.gd_xp[j]), 1)}, ITB: {float(plan.in_the_bank[j])}")
+        for i in np.flatnonzero(active[:, j]):
+            p = data.players[i]
+            lines += [template.format(p=p, name=names[i]) for template, flags in moves if flags[i, j]]
+    return ''.join(f'{line}\n' for line in lines), chips_used
+
+
+def weekly_summary(plan: PlanArrays, data: ModelData, objective: float) -> str:
+    """xP, transfer count and penalised transfers of each gameweek, then the totals."""
+    text = ""
+    day_weeks = np.array([data.week_of(d) for d in data.gamedays])
+    for k, w in enumerate(data.gameweeks):
+        pen_tfs = float(plan.penalized_transfers[day_weeks == w].sum())
+        text += f"GW{w} - xP: {round(float(plan.gw_xp[k]), 0)}, "
+        text += f"TC: {float(plan.transfer_count[k])}, PT: {pen_tfs}\n"
+    text += f"Objective: {objective}\n"
+    text += f"Total xPoints: {round(plan.total_xp(), 0)}\n"
+    return text
@@ -0,0 +1,86 @@
+"""Per-run scratch directory for solver model, option and solution files.
+
+Each solve gets its own directory, on tmpfs when the machine has one, so
+concurrent runs never share file names and the MPS round trip stays in
+memory. The directory is removed when the solve ends. With
+``keep_artifacts`` it is moved to ``solution_files/`` instead, where the
+oldest kept runs are deleted once their total size passes
+``artifacts_max_mb``.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+TMPFS_DIR = '/dev/shm'
+ARTIFACTS_DIR = 'solution_files'
+DEFAULT_ARTIFACTS_MAX_MB = 500
+
+
+def _scratch_root(options) -> str | None:
+    """Directory new workspaces are created in; None means the system temp dir."""
+    if options.get('workspace_dir'):
+        return options['workspace_dir']
+    if os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK):
+        return TMPFS_DIR
+    return None
+
+
+def _directory_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
+
+
+def prune_artifacts(root=ARTIFACTS_DIR, max_mb=DEFAULT_ARTIFACTS_MAX_MB) -> None:
+    """Delete the oldest kept runs under ``root`` until they fit in ``max_mb``."""
+    root = Path(root)
+    if not root.is_dir():
+        return
+    runs = sorted((p for p in root.iterdir() if p.is_dir()), key=lambda p: p.stat().st_mtime)
+    sizes = {run: _directory_size(run) for run in runs}
+    total = sum(sizes.values())
+    for run in runs:
+        if total <= max_mb * 1024 * 1024:
+            break
+        shutil.rmtree(run, ignore_errors=True)
+        total -= sizes[run]
+
+
+class SolverWorkspace:
+    """Scratch directory of one solve; use as a context manager."""
+
+    def __init__(self, name: str, options: dict):
+        self.name = name
+        self.keep = bool(options.get('keep_artifacts', False))
+        self.max_mb = options.get('artifacts_max_mb', DEFAULT_ARTIFACTS_MAX_MB)
+        self.compress = bool(options.get('mps_compression', False))
+        root = _scratch_root(options)
+        if root:
+            os.makedirs(root, exist_ok=True)
+        self.root = Path(tempfile.mkdtemp(prefix=f'{name}_', dir=root))
+
+    def path(self, filename: str) -> str:
+        return str(self.root / filename)
+
+    @property
+    def problem_path(self) -> str:
+        """Where the model is written, gzip-compressed when ``mps_compression`` is set."""
+        return self.path(f'{self.name}.mps.gz' if self.compress else f'{self.name}.mps')
+
+    def close(self) -> None:
+        if not self.root.exists():
+            return
+        if self.keep:
+            os.makedirs(ARTIFACTS_DIR, exist_ok=True)
+            shutil.move(str(self.root), os.path.join(ARTIFACTS_DIR, self.root.name))
+            prune_artifacts(ARTIFACTS_DIR, self.max_mb)
+        else:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    def __enter__(self) -> "SolverWorkspace":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,50 @@
+"""Expected minutes to projected points, shared by the xMins editor and scenarios.
+
+A player's projection on a gameday is their per-36 rate times their expected
+minutes over 36. When minutes are spread from a per-game ``MIN`` over the
+days a team plays, games on consecutive dates are decayed: the first game
+of each back-to-back by ``b2b_decay[0]`` and the second by ``b2b_decay[1]``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_B2B_DECAY = (0.975, 0.95)
+
+
+def back_to_back_pairs(fixture_info: pd.DataFrame, gameday_columns) -> list[tuple[int, int]]:
+    """Positions of consecutive gameday columns whose deadlines fall on consecutive dates.
+
+    ``gameday_columns`` are gameday ids, as in the columns of ``xmins.csv``;
+    ``fixture_info`` maps them to deadlines.
+    """
+    deadlines = pd.to_datetime(fixture_info['deadline'], errors='coerce')
+    deadline_by_id = dict(zip(fixture_info['id'].astype(int), deadlines))
+    pairs = []
+    for idx in range(len(gameday_columns) - 1):
+        current_date = deadline_by_id.get(int(float(gameday_columns[idx])))
+        next_date = deadline_by_id.get(int(float(gameday_columns[idx + 1])))
+        if current_date is None or next_date is None or pd.isna(current_date) or pd.isna(next_date):
+            continue
+        if (next_date - current_date).days == 1:
+            pairs.append((idx, idx + 1))
+    return pairs
+
+
+def decay_back_to_backs(minutes: np.ndarray, pairs, b2b_decay=DEFAULT_B2B_DECAY) -> np.ndarray:
+    """Copy of ``minutes`` (one row, or one row per player) decayed on the back-to-backs both days are played."""
+    decayed = np.array(minutes, dtype=float)
+    if len(b2b_decay) < 2:
+        return decayed
+    for left, right in pairs:
+        both = (decayed[..., left] != 0) & (decayed[..., right] != 0)
+        decayed[..., left] = np.where(both, decayed[..., left] * float(b2b_decay[0]), decayed[..., left])
+        decayed[..., right] = np.where(both, decayed[..., right] * float(b2b_decay[1]), decayed[..., right])
+    return decayed
+
+
+def points_from_minutes(rates36: np.ndarray, minutes: np.ndarray) -> np.ndarray:
+    """Projected points of per-36 ``rates36`` over ``minutes``, unrounded."""
+    return np.asarray(rates36, dtype=float) * np.asarray(minutes, dtype=float) / 36.0
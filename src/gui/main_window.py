@@ -26,6 +26,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from engine.model_template import ModelTemplates
 from gui.components import Badge, Tag
 from gui.models.solver_options import SolverOptions
 from gui.utils.constants import (
@@ -66,6 +67,8 @@ class MainWindow(QMainWindow):
         self.opts = SolverOptions.from_json("solver_settings.json")
 
         self._solver_worker = None
+        # Models of earlier solves, updated in place when the squad and prices are unchanged
+        self._model_templates = ModelTemplates()
         self._data_worker = None
         self._retrieve_worker = None
         self._results_window = None
@@ -689,16 +692,31 @@ class MainWindow(QMainWindow):
             gd=self.gd_spin.value(),
             itb=self.itb_spin.value(),
             options=options,
+            model_templates=self._model_templates if options.get("reuse_model", True) else None,
         )
         self._solver_worker.finished.connect(self._on_solver_finished)
         self._solver_worker.error.connect(self._on_solver_error)
+        self._solver_worker.progress.connect(self._on_solver_progress)
+        self._solver_worker.cancelled.connect(self._on_solver_cancelled)
         self._solver_worker.start()
 
+    def _on_solver_progress(self, event):
+        if event.gap is None:
+            return
+        self.status_text.setText(f"Solving · gap {event.gap:.2%}")
+        nodes = f", {event.nodes} nodes" if event.nodes is not None else ""
+        self.status_bar.showMessage(f"Solving with {event.solver}{nodes}, gap {event.gap:.2%}")
+
     def _on_solver_finished(self, result):
         self._restore_run_ui()
-        self.status_bar.showMessage("Solve complete", 5000)
-        self._set_status_dot(SUCCESS)
-        self.status_text.setText("Solved")
+        if self._solver_worker.cancel_token.cancelled:
+            self.status_bar.showMessage("Solve cancelled, showing the best plan found", 5000)
+            self._set_status_dot(WARNING)
+            self.status_text.setText("Cancelled")
+        else:
+            self.status_bar.showMessage("Solve complete", 5000)
+            self._set_status_dot(SUCCESS)
+            self.status_text.setText("Solved")
 
         from gui.results_window import ResultsWindow
         options = self._collect_options()
@@ -716,16 +734,26 @@ class MainWindow(QMainWindow):
 
     def _on_cancel_solver(self):
         if self._solver_worker and self._solver_worker.isRunning():
-            self._solver_worker.terminate()
-            self._solver_worker.wait(3000)
+            # The worker stops the solver and then emits finished or cancelled
+            self._solver_worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status_text.setText("Cancelling")
+            self.status_bar.showMessage("Stopping solver...")
+            return
+        self._on_solver_cancelled()
+
+    def _on_solver_cancelled(self):
         self._restore_run_ui()
         self.status_bar.showMessage("Solve cancelled", 5000)
+        self._set_status_dot(WARNING)
+        self.status_text.setText("Cancelled")
         self._refresh_summary()
 
     def _restore_run_ui(self):
         self._timer.stop()
         self.progress_bar.hide()
         self.cancel_btn.hide()
+        self.cancel_btn.setEnabled(True)
         self.elapsed_label.hide()
         self.run_btn.show()
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
@@ -16,6 +17,9 @@ class SolverOptions:
 
     # Main options
     horizon: int = 5
+    rolling_window: int = 0
+    rolling_step: Optional[int] = None
+    lazy_rows: bool = False
     tm: int = 0
     solve_time: int = 300
     preseason: bool = False
@@ -41,6 +45,9 @@ class SolverOptions:
     ft_value: float = 10
     ft_increment: float = 2.5
     threshold_value: float = 2.8
+    player_filter: str = "threshold"
+    dominance_filter: bool = False
+    prune_time: float = 30
     no_sols: int = 1
     alternative_solution: str = "1week_buy"
 
@@ -52,6 +59,20 @@ class SolverOptions:
 
     # Solver paths (from settings file, not editable in GUI)
     solver: str = "cbc"
+    model_builder: str = "sasoptpy"
+    portfolio: List[dict] = field(default_factory=list)
+    mip_start: Optional[str] = None
+    reuse_model: bool = True
+    cache: bool = False
+    cache_max_mb: float = 256
+    cache_max_age_days: float = 30
+    profile_log: Optional[str] = None
+    profile_objects: bool = False
+    write_outputs: bool = True
+    keep_artifacts: bool = False
+    artifacts_max_mb: float = 500
+    mps_compression: bool = False
+    workspace_dir: Optional[str] = None
     cbc_path: Optional[str] = None
     highs_path: Optional[str] = None
 
@@ -71,6 +92,9 @@ class SolverOptions:
         return {
             "team_id": self.team_id,
             "horizon": self.horizon,
+            "rolling_window": self.rolling_window,
+            "rolling_step": self.rolling_step,
+            "lazy_rows": self.lazy_rows,
             "tm": self.tm,
             "solve_time": self.solve_time,
             "preseason": self.preseason,
@@ -90,9 +114,26 @@ class SolverOptions:
             "ft_value": self.ft_value,
             "ft_increment": self.ft_increment,
             "threshold_value": self.threshold_value,
+            "player_filter": self.player_filter,
+            "dominance_filter": self.dominance_filter,
+            "prune_time": self.prune_time,
             "no_sols": self.no_sols,
             "alternative_solution": self.alternative_solution,
             "solver": self.solver,
+            "model_builder": self.model_builder,
+            "portfolio": self.portfolio,
+            "mip_start": self.mip_start,
+            "reuse_model": self.reuse_model,
+            "cache": self.cache,
+            "cache_max_mb": self.cache_max_mb,
+            "cache_max_age_days": self.cache_max_age_days,
+            "profile_log": self.profile_log,
+            "profile_objects": self.profile_objects,
+            "write_outputs": self.write_outputs,
+            "keep_artifacts": self.keep_artifacts,
+            "artifacts_max_mb": self.artifacts_max_mb,
+            "mps_compression": self.mps_compression,
+            "workspace_dir": self.workspace_dir,
             "cbc_path": self.cbc_path,
             "highs_path": self.highs_path,
         }
@@ -111,8 +152,32 @@ class SolverOptions:
         if self.horizon > 30:
             warnings.append(f"Horizon of {self.horizon} is very large and may take a long time.")
 
+        if self.rolling_window < 0:
+            errors.append("Rolling window must be 0 (off) or a number of gamedays.")
+        elif self.rolling_window and self.solver != "highs_inprocess":
+            errors.append("Rolling-horizon solves need solver 'highs_inprocess'.")
+        elif self.rolling_step is not None and not 1 <= self.rolling_step <= max(self.rolling_window, 1):
+            errors.append("Rolling step must be between 1 and the rolling window.")
+
+        if self.lazy_rows and (self.solver != "highs_inprocess" or self.rolling_window):
+            warnings.append("Lazy rows need a full-horizon 'highs_inprocess' solve; every row will be built.")
+
+        if self.player_filter not in ("threshold", "reduced_cost"):
+            errors.append("Player filter must be 'threshold' or 'reduced_cost'.")
+
         if self.no_sols < 1:
             errors.append("Number of solutions must be at least 1.")
+        elif self.no_sols > 1 and self.solver == "heuristic":
+            warnings.append("The heuristic solver finds a single plan; alternatives are skipped.")
+
+        if self.mip_start and self.mip_start != "heuristic" and not os.path.exists(self.mip_start):
+            errors.append(f"MIP start plan '{self.mip_start}' not found; use 'heuristic' or a picks CSV.")
+
+        if self.cache_max_mb <= 0 or self.cache_max_age_days <= 0:
+            errors.append("Cache size and age limits must be positive.")
+
+        if self.artifacts_max_mb <= 0:
+            errors.append("The kept solver artifacts limit must be positive.")
 
         if self.decay_base <= 0 or self.decay_base > 1:
             errors.append("Decay base must be between 0 (exclusive) and 1 (inclusive).")
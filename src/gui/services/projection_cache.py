@@ -8,6 +8,8 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from engine.xmins import back_to_back_pairs
+
 
 @dataclass(slots=True)
 class ProjectionCache:
@@ -58,17 +60,7 @@ class ProjectionCache:
         fixture_code_to_id = dict(zip(fixture_info_df["code"], fixture_info_df["id"]))
         fixture_id_to_code = dict(zip(fixture_info_df["id"], fixture_info_df["code"]))
 
-        deadline_by_id = dict(zip(fixture_info_df["id"], fixture_info_df["deadline"]))
-        b2b_pairs: list[tuple[int, int]] = []
-        for idx in range(len(gameday_columns) - 1):
-            current_id = int(float(gameday_columns[idx]))
-            next_id = int(float(gameday_columns[idx + 1]))
-            current_date = deadline_by_id.get(current_id)
-            next_date = deadline_by_id.get(next_id)
-            if current_date is None or next_date is None or pd.isna(current_date) or pd.isna(next_date):
-                continue
-            if (next_date - current_date).days == 1:
-                b2b_pairs.append((idx, idx + 1))
+        b2b_pairs = back_to_back_pairs(fixture_info_df, gameday_columns)
 
         return cls(
             xmins_base_df=xmins_base_df,
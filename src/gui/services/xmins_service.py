@@ -9,6 +9,7 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from engine.xmins import DEFAULT_B2B_DECAY, decay_back_to_backs, points_from_minutes
 from gui.services.projection_cache import ProjectionCache, get_projection_cache
 from gui.utils.data_utils import (
     canonicalize_mins_changes,
@@ -212,9 +213,9 @@ class XminsService:
 
     def _build_projection_df(self, xmins_df: pd.DataFrame) -> pd.DataFrame:
         projections = self.cache.projections36_df.copy()
-        projections.iloc[:, 5:] = (
-            self.cache.projections36_df.iloc[:, 5:].to_numpy(dtype=float) * xmins_df.iloc[:, 6:].to_numpy(dtype=float)
-        ) / 36.0
+        projections.iloc[:, 5:] = points_from_minutes(
+            self.cache.projections36_df.iloc[:, 5:].to_numpy(dtype=float), xmins_df.iloc[:, 6:].to_numpy(dtype=float)
+        )
         return projections.round(1)
 
     def _rebuild_players(self, player_names: list[str]):
@@ -222,9 +223,9 @@ class XminsService:
             row_idx = self.cache.name_to_idx[player_name]
             rebuilt_row = self._rebuild_player_row(player_name, row_idx)
             self._xmins_df.iloc[row_idx, 5:] = rebuilt_row
-            proj_row = (
-                self.cache.projections36_df.iloc[row_idx, 5:].to_numpy(dtype=float) * rebuilt_row[1:]
-            ) / 36.0
+            proj_row = points_from_minutes(
+                self.cache.projections36_df.iloc[row_idx, 5:].to_numpy(dtype=float), rebuilt_row[1:]
+            )
             self._projections_df.iloc[row_idx, 5:] = np.round(proj_row, 1)
 
     def _rebuild_player_row(self, player_name: str, row_idx: int) -> np.ndarray:
@@ -240,7 +241,11 @@ class XminsService:
             if edit.column == "MIN":
                 current_min = float(edit.value)
                 gameday_values = self.cache.availability_basis[row_idx].astype(float, copy=True) * current_min
-                gameday_values = self._apply_b2b_decay_to_row(gameday_values)
+                gameday_values = decay_back_to_backs(
+                    gameday_values,
+                    self.cache.b2b_pairs,
+                    self.cache.solver_options.get("b2b_decay", DEFAULT_B2B_DECAY),
+                )
             else:
                 try:
                     gd_idx = self.cache.gameday_columns.index(str(edit.column))
@@ -250,14 +255,3 @@ class XminsService:
 
         row = np.concatenate(([current_min], np.round(gameday_values, 2)))
         return row
-
-    def _apply_b2b_decay_to_row(self, values: np.ndarray) -> np.ndarray:
-        decayed = values.astype(float, copy=True)
-        b2b_decay = self.cache.solver_options.get("b2b_decay", [0.975, 0.95])
-        if len(b2b_decay) < 2:
-            return decayed
-        for left_idx, right_idx in self.cache.b2b_pairs:
-            if decayed[left_idx] != 0 and decayed[right_idx] != 0:
-                decayed[left_idx] *= float(b2b_decay[0])
-                decayed[right_idx] *= float(b2b_decay[1])
-        return decayed
@@ -2,15 +2,20 @@
 
 from PySide6.QtCore import QThread, Signal
 
+from engine.cancellation import CancellationToken, SolveCancelled
+
 
 class SolverWorker(QThread):
     """Run solve_multi_period_NBA in a background thread."""
 
     finished = Signal(dict)
     error = Signal(str)
-    progress = Signal(str)
+    # engine.progress.SolverProgress events, emitted from the solver thread
+    progress = Signal(object)
+    # Emitted instead of finished when a cancelled solve had found no plan yet
+    cancelled = Signal()
 
-    def __init__(self, all_data, squad, sell_prices, gd, itb, options, parent=None):
+    def __init__(self, all_data, squad, sell_prices, gd, itb, options, model_templates=None, parent=None):
         super().__init__(parent)
         self.all_data = all_data
         self.squad = squad
@@ -18,12 +23,18 @@ class SolverWorker(QThread):
         self.gd = gd
         self.itb = itb
         self.options = options
+        # engine.model_template.ModelTemplates of earlier solves, or None to always build
+        self.model_templates = model_templates
+        self.cancel_token = CancellationToken()
+
+    def cancel(self):
+        """Ask the solver to stop; the worker then finishes with the best plan found."""
+        self.cancel_token.cancel()
 
     def run(self):
         try:
             from solve import solve_multi_period_NBA
 
-            self.progress.emit("Solver started...")
             result = solve_multi_period_NBA(
                 all_data=self.all_data,
                 squad=self.squad,
@@ -31,7 +42,12 @@ class SolverWorker(QThread):
                 gd=self.gd,
                 itb=self.itb,
                 options=self.options,
+                progress_callback=self.progress.emit,
+                cancel_token=self.cancel_token,
+                model_templates=self.model_templates,
             )
             self.finished.emit(result)
+        except SolveCancelled:
+            self.cancelled.emit()
         except Exception as e:
             self.error.emit(str(e))
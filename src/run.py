@@ -4,6 +4,8 @@ import sys
 
 import pandas as pd
 from solve import solve_multi_period_NBA
+from scenarios import Scenario, fixture_scenarios, run_scenarios
+from sensitivity import parameter_grid, run_sweep
 from retrieve import get_fixtures, get_players, get_team
 
 # Read options from the file
@@ -64,5 +66,53 @@ def run_optimisation():
     )
 
 
+def run_fixture_scenarios(include_base=True):
+    """Solve the current team under every custom fixture ticker and save the comparison."""
+    fantasy_team = get_team(solver_options.get('team_id'))
+    scenarios = fixture_scenarios()
+    if include_base:
+        scenarios.insert(0, Scenario('base'))
+
+    comparison = run_scenarios(
+        scenarios,
+        squad=fantasy_team['initial_squad'],
+        sell_prices=fantasy_team['sell_prices'],
+        gd=fantasy_team['gd'],
+        itb=fantasy_team['itb'],
+        options=solver_options,
+    )
+    os.makedirs('output', exist_ok=True)
+    comparison.to_csv('output/scenario_comparison.csv', index=False)
+    print(comparison.to_string(index=False))
+    return comparison
+
+
+def run_parameter_sweep(values):
+    """Solve the current team for every combination of ``values`` and save the table.
+
+    ``values`` maps option names such as ``decay_base`` or ``ft_value`` to
+    the values to try; other options come from ``solver_settings.json``.
+    """
+    fantasy_team = get_team(solver_options.get('team_id'))
+    if os.path.exists('data/projections_overwrite.csv'):
+        all_data = pd.read_csv('data/projections_overwrite.csv')
+    else:
+        all_data = pd.read_csv('data/projections.csv')
+
+    sweep = run_sweep(
+        parameter_grid(values),
+        all_data=all_data,
+        squad=fantasy_team['initial_squad'],
+        sell_prices=fantasy_team['sell_prices'],
+        gd=fantasy_team['gd'],
+        itb=fantasy_team['itb'],
+        options=solver_options,
+    )
+    os.makedirs('output', exist_ok=True)
+    sweep.to_csv('output/parameter_sweep.csv', index=False)
+    print(sweep.to_string(index=False))
+    return sweep
+
+
 if __name__ == '__main__':
     refresh_data()
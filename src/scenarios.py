@@ -0,0 +1,198 @@
+"""Solve the same squad under alternative fixture tickers and projection variants.
+
+``data/custom_fixtures`` ships alternative schedules as ``fixture_ticker (N).csv``:
+a team column followed by one column per gameday id, holding the opponent
+code where the team plays and empty otherwise. A :class:`Scenario` pairs one
+of these with an optional per-36 projections variant. The projections it
+implies are rebuilt with the xMins editor's helpers in :mod:`engine.xmins`
+(each player's ``MIN`` on the days their team plays, with the back-to-back
+decay, times the per-36 rate), and every scenario is then solved in a
+process pool.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.reference_data import ReferenceData
+from engine.xmins import DEFAULT_B2B_DECAY, back_to_back_pairs, decay_back_to_backs, points_from_minutes
+from solve import solve_multi_period_NBA
+
+CUSTOM_FIXTURES_DIR = 'data/custom_fixtures'
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """A named schedule and projections variant to solve.
+
+    ``fixture_ticker`` and ``projections36`` are CSV paths or frames;
+    ``None`` keeps the schedule of ``xmins.csv`` and the base per-36 rates.
+    """
+
+    name: str
+    fixture_ticker: str | pd.DataFrame | None = None
+    projections36: str | pd.DataFrame | None = None
+
+
+def fixture_scenarios(directory=CUSTOM_FIXTURES_DIR, projections36=None) -> list[Scenario]:
+    """A scenario per ``fixture_ticker (N).csv`` in ``directory``, in order of N."""
+    tickers = []
+    for file_name in os.listdir(directory):
+        match = re.fullmatch(r'fixture_ticker \((\d+)\)\.csv', file_name)
+        if match:
+            tickers.append((int(match.group(1)), file_name))
+    return [
+        Scenario(os.path.splitext(file_name)[0], os.path.join(directory, file_name), projections36)
+        for _, file_name in sorted(tickers)
+    ]
+
+
+def _read(frame):
+    return pd.read_csv(frame) if isinstance(frame, (str, os.PathLike)) else frame
+
+
+def scenario_projections(
+    xmins: pd.DataFrame,
+    projections36: pd.DataFrame,
+    gameday_data: pd.DataFrame,
+    fixture_ticker=None,
+    b2b_decay=DEFAULT_B2B_DECAY,
+) -> pd.DataFrame:
+    """Projections, laid out as ``projections.csv``, for a schedule and per-36 variant.
+
+    Without a ticker the xMins of ``xmins.csv`` are kept. With one, each
+    player plays their ``MIN`` on the days their team has an opponent in the
+    ticker, decayed on back-to-backs; a team missing from the ticker never
+    plays. Per-36 rates are used as given, so a day the base schedule gives
+    no rate projects nothing, as in the xMins editor.
+    """
+    xmins = _read(xmins).sort_values(by='id').reset_index(drop=True)
+    projections36 = _read(projections36).set_index('id').loc[xmins['id']].reset_index()
+    gameday_columns = [str(col) for col in xmins.columns[6:]]
+    rates = projections36[gameday_columns].to_numpy(dtype=float)
+
+    if fixture_ticker is None:
+        minutes = xmins[gameday_columns].to_numpy(dtype=float)
+    else:
+        ticker = _read(fixture_ticker)
+        plays = ticker.iloc[:, 1:].notna()
+        plays.columns = [str(col) for col in plays.columns]
+        plays = plays.reindex(columns=gameday_columns, fill_value=False)
+        plays.index = ticker.iloc[:, 0].astype(str)
+        availability = plays.reindex(xmins['team'].astype(str), fill_value=False).to_numpy(dtype=float)
+        minutes = availability * xmins['MIN'].to_numpy(dtype=float)[:, None]
+        pairs = back_to_back_pairs(gameday_data, gameday_columns)
+        minutes = np.round(decay_back_to_backs(minutes, pairs, b2b_decay), 2)
+
+    projections = xmins[['id', 'name', 'team', 'price', 'position']].copy()
+    projections[gameday_columns] = np.round(points_from_minutes(rates, minutes), 1)
+    return projections
+
+
+def plan_summary(result: dict) -> dict:
+    """Objective, xPTS, transfer count, captains, moves and chips of one solve result."""
+    picks = result['picks']
+    captains = picks[picks['captain'] > 0.5]
+    moves = picks[(picks['transfer_in'] > 0.5) | (picks['transfer_out'] > 0.5)]
+    first_moves = moves[moves['gameday'] == picks['gameday'].min()]
+
+    def describe(rows):
+        return '; '.join(
+            f"{move.gameday} {'in' if move.transfer_in else 'out'} {move.name}" for move in rows.itertuples()
+        )
+
+    return {
+        'objective': round(float(result['objective']), 2),
+        'total_xp': round(float(result['total_xp']), 2),
+        'transfers': int(round(picks['transfer_in'].sum())),
+        'first_moves': describe(first_moves),
+        'moves': describe(moves),
+        'captains': '; '.join(f"{code} {name}" for code, name in zip(captains['gameday'], captains['name'])),
+        'chips': ', '.join(f"{code}{chip}" for code, chip in result['chips_used'].items()),
+    }
+
+
+def solve_summary(projections, squad, sell_prices, gd, itb, options, reference_data, model_templates=None) -> dict:
+    """Solve once and reduce the best plan to :func:`plan_summary`, plus ``error`` and ``seconds``.
+
+    A failed solve fills in ``error`` instead of raising, so one bad
+    scenario or setting does not stop a sweep. ``model_templates`` is
+    passed on to :func:`solve.solve_multi_period_NBA`.
+    """
+    started = time.perf_counter()
+    try:
+        result = solve_multi_period_NBA(
+            projections, squad, sell_prices, gd, itb, options, reference_data=reference_data,
+            model_templates=model_templates,
+        )['results'][0]
+    except Exception as exc:
+        row = {'error': f"{type(exc).__name__}: {exc}"}
+    else:
+        row = {**plan_summary(result), 'error': None}
+    row['seconds'] = round(time.perf_counter() - started, 2)
+    return row
+
+
+def _solve_scenario(name, projections, squad, sell_prices, gd, itb, options, reference_data) -> dict:
+    return {'scenario': name, **solve_summary(projections, squad, sell_prices, gd, itb, options, reference_data)}
+
+
+def run_scenarios(
+    scenarios,
+    squad,
+    sell_prices,
+    gd,
+    itb,
+    options,
+    xmins=None,
+    projections36=None,
+    reference_data: ReferenceData | None = None,
+    max_workers=None,
+) -> pd.DataFrame:
+    """Solve each scenario in a process pool and compare their first plans.
+
+    ``xmins`` and ``projections36`` default to the files in ``data/``, and
+    ``reference_data`` to :meth:`ReferenceData.load`; all are read once and
+    sent to the workers. ``max_workers`` defaults to the number of CPUs.
+    Returns one row per scenario, in the order given, with the
+    :func:`plan_summary` of its best plan and ``vs_best``, the objective
+    lost against the best scenario. A scenario that fails gets its
+    ``error`` filled in instead.
+    """
+    xmins = _read(xmins if xmins is not None else 'data/xmins.csv')
+    projections36 = _read(projections36 if projections36 is not None else 'data/projections36.csv')
+    reference_data = reference_data or ReferenceData.load()
+    b2b_decay = options.get('b2b_decay', DEFAULT_B2B_DECAY)
+    # Workers only report their best plan, and must not race on output files
+    options = {**options, 'write_outputs': False, 'solver_output': False, 'no_sols': 1}
+
+    rows = {}
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        futures = {}
+        for position, scenario in enumerate(scenarios):
+            projections = scenario_projections(
+                xmins,
+                scenario.projections36 if scenario.projections36 is not None else projections36,
+                reference_data.gameday_data,
+                scenario.fixture_ticker,
+                b2b_decay,
+            )
+            future = pool.submit(
+                _solve_scenario, scenario.name, projections, squad, sell_prices, gd, itb, options, reference_data,
+            )
+            futures[future] = position
+        for future in as_completed(futures):
+            row = rows[futures[future]] = future.result()
+            print(f"Scenario {row['scenario']} solved ({len(rows)}/{len(futures)})")
+
+    table = pd.DataFrame([rows[position] for position in range(len(futures))])
+    if 'objective' in table:
+        table.insert(table.columns.get_loc('objective') + 1, 'vs_best', table['objective'] - table['objective'].max())
+    return table
@@ -0,0 +1,150 @@
+"""Sweep objective weights over a grid or random sample, solving in parallel.
+
+``decay_base``, ``bench_weight``, ``ft_value`` and ``ft_increment`` only
+change objective coefficients, and ``threshold_value`` only narrows the
+candidate shortlist. A sweep therefore loads the data once, shortlists the
+candidates once at the lowest threshold of the sweep, and hands every
+worker process a chunk of settings sharing one threshold, so each worker
+builds its model once and updates it in place for the rest of the chunk
+(see :mod:`engine.model_template`).
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from engine.model_template import ModelTemplates
+from engine.reference_data import ReferenceData
+from scenarios import solve_summary
+from solve import prepare_model_data
+
+SWEEP_PARAMETERS = ('decay_base', 'bench_weight', 'ft_value', 'ft_increment', 'threshold_value')
+
+# Set by _init_worker in each worker process: the data every setting shares
+_SHARED = {}
+
+
+def _check_parameters(names):
+    unknown = [name for name in names if name not in SWEEP_PARAMETERS]
+    if unknown:
+        raise ValueError(f"Cannot sweep {unknown}. Use any of {list(SWEEP_PARAMETERS)}.")
+
+
+def parameter_grid(values: dict) -> list[dict]:
+    """Every combination of ``values``, a list of values per parameter."""
+    _check_parameters(values)
+    names = list(values)
+    return [dict(zip(names, combination)) for combination in itertools.product(*values.values())]
+
+
+def random_settings(ranges: dict, samples: int, seed=None) -> list[dict]:
+    """``samples`` settings drawn uniformly from the ``(low, high)`` range of each parameter."""
+    _check_parameters(ranges)
+    rng = np.random.default_rng(seed)
+    return [
+        {name: round(float(rng.uniform(low, high)), 4) for name, (low, high) in ranges.items()}
+        for _ in range(samples)
+    ]
+
+
+def candidate_pool(all_data, squad, sell_prices, gd, itb, options, settings, reference_data=None) -> pd.DataFrame:
+    """Rows of ``all_data`` that pass the threshold filter of at least one of ``settings``.
+
+    The shortlist of a higher threshold is part of that of a lower one, so
+    every setting filters this pool down to the players it would have kept
+    from the full projections. Reduced-cost pruning puts every player in the
+    model, so the projections are then returned whole.
+    """
+    if options.get('player_filter', 'threshold') != 'threshold':
+        return all_data
+    lowest = min(setting.get('threshold_value', options['threshold_value']) for setting in settings)
+    probe = {**options, 'threshold_value': lowest, 'dominance_filter': False, 'write_outputs': False}
+    data = prepare_model_data(all_data, squad, sell_prices, gd, itb, probe, reference_data=reference_data)
+    return all_data[all_data['id'].isin(data.all_data['id'])]
+
+
+def _chunks(settings, options, workers) -> list[list[tuple[int, dict]]]:
+    """Split ``settings`` into chunks of one threshold each, at least ``workers`` of them where possible."""
+    size = max(1, math.ceil(len(settings) / workers))
+    by_threshold = {}
+    for position, setting in enumerate(settings):
+        threshold = setting.get('threshold_value', options['threshold_value'])
+        by_threshold.setdefault(threshold, []).append((position, setting))
+    return [group[i:i + size] for group in by_threshold.values() for i in range(0, len(group), size)]
+
+
+def _init_worker(shared):
+    _SHARED.update(shared)
+
+
+def _solve_chunk(chunk) -> list[tuple[int, dict]]:
+    # A chunk shares one threshold, so its settings share one model
+    model_templates = ModelTemplates(max_models=1)
+    rows = []
+    for position, setting in chunk:
+        row = solve_summary(
+            _SHARED['all_data'], _SHARED['squad'], _SHARED['sell_prices'], _SHARED['gd'], _SHARED['itb'],
+            {**_SHARED['options'], **setting}, _SHARED['reference_data'], model_templates,
+        )
+        rows.append((position, {**setting, **row}))
+    return rows
+
+
+def run_sweep(
+    settings,
+    all_data,
+    squad,
+    sell_prices,
+    gd,
+    itb,
+    options,
+    reference_data: ReferenceData | None = None,
+    max_workers=None,
+) -> pd.DataFrame:
+    """Solve ``options`` overridden by each of ``settings`` in a process pool.
+
+    ``settings`` are dicts of :data:`SWEEP_PARAMETERS`, such as those of
+    :func:`parameter_grid` or :func:`random_settings`. ``max_workers``
+    defaults to the number of CPUs. Returns one row per setting, in the
+    order given: the swept parameters, then the :func:`scenarios.plan_summary`
+    of its best plan, ``error`` and ``seconds``.
+    """
+    settings = list(settings)
+    if not settings:
+        raise ValueError("No settings to sweep.")
+    for setting in settings:
+        _check_parameters(setting)
+    reference_data = reference_data or ReferenceData.load()
+    # Workers only report their best plan, and must not race on output files
+    options = {
+        **options, 'write_outputs': False, 'solver_output': False, 'no_sols': 1,
+        'model_builder': 'matrix',
+    }
+    shared = {
+        'all_data': candidate_pool(all_data, squad, sell_prices, gd, itb, options, settings, reference_data),
+        'squad': squad,
+        'sell_prices': sell_prices,
+        'gd': gd,
+        'itb': itb,
+        'options': options,
+        'reference_data': reference_data,
+    }
+    print(f"Sweeping {len(settings)} settings over {len(shared['all_data'])} candidate players")
+
+    workers = max_workers or os.cpu_count()
+    rows = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(shared,)) as pool:
+        futures = [pool.submit(_solve_chunk, chunk) for chunk in _chunks(settings, options, workers)]
+        for future in as_completed(futures):
+            rows.update(future.result())
+            print(f"Solved {len(rows)}/{len(settings)} settings")
+
+    table = pd.DataFrame([rows[position] for position in range(len(settings))])
+    swept = [name for name in SWEEP_PARAMETERS if name in table]
+    return table[swept + [column for column in table if column not in swept]]
@@ -1,5 +1,6 @@
 """Multi-period NBA Fantasy optimisation solver."""
 
+import gzip
 import json
 import os
 import random
@@ -11,6 +12,33 @@ import time
 import pandas as pd
 import sasoptpy as so
 
+from engine.cancellation import (
+    SolveCancelled,
+    has_fresh_file,
+    is_cancelled,
+    stop_process_tree,
+    write_last_improving_solution,
+)
+from engine.dominance import dominance_filter
+from engine.heuristic import solve_heuristic
+from engine.highs_backend import IncrementalHighs
+from engine.lazy_rows import LazyRows
+from engine.matrix_model import MatrixModel, build_matrix_model
+from engine.mip_start import start_values, write_cbc_start, write_highs_start
+from engine.model_data import ModelData, ModelHandles
+from engine.model_index import ModelIndex
+from engine.portfolio import build_portfolio, race, read_solution_status
+from engine.profiling import PhaseProfiler
+from engine.progress import LogProgressParser
+from engine.pruning import reduced_cost_prune
+from engine.reference_data import ReferenceData
+from engine.result_cache import ResultCache, cache_key
+from engine.rolling_horizon import RollingHorizon
+from engine.solution import PlanArrays, action_summary, picks_frame
+from engine.solution import weekly_summary as build_weekly_summary
+from engine.solution_reader import ColumnOrder, read_solution_values
+from engine.workspace import SolverWorkspace
+
 pd.set_option('future.no_silent_downcasting', True)
 
 
@@ -26,73 +54,378 @@ def _gameday_code_to_ids(gameday_data, code):
     return gameday_data.loc[idx, 'id'].astype(int).tolist()
 
 
-def _parse_solution_cbc(model, location_solution):
-    """Parse a CBC solution file and set variable values on the model."""
-    for v in model.get_variables():
-        v.set_value(0)
+def _read_solution(model, location_solution, solver, column_order=None):
+    """Load a solver's solution file into whichever model type was built.
 
-    with open(location_solution, 'r') as f:
-        for line in f:
-            if 'objective value' in line:
-                continue
-            words = line.split()
-            var = model.get_variable(words[1])
-            if var is not None:
-                var.set_value(float(words[2]))
-            else:
-                print(f"Warning: Variable {words[1]} not found in the model.")
+    ``column_order`` is the sasoptpy model's ``ColumnOrder``; pass it to skip
+    recomputing it on every read. Returns the sasoptpy model's value vector
+    in that order, or None for a matrix model. Raises RuntimeError when the
+    file holds no feasible solution, rather than loading an infeasible or
+    missing one.
+    """
+    status, objective = read_solution_status(location_solution, solver)
+    if objective is None:
+        raise RuntimeError(f"{solver} found no feasible solution ({status or 'no solution file'}).")
+    if isinstance(model, MatrixModel):
+        model.read_solution(location_solution, solver)
+        return None
+    column_order = column_order or ColumnOrder.of(model)
+    values = read_solution_values(location_solution, solver, column_order)
+    for var, value in zip(column_order.variables, values.tolist()):
+        var.set_value(value)
+    return values
+
+
+def _follow_solver_output(process, solver, progress_callback=None):
+    """Echo a solver's output and pass its progress lines to ``progress_callback``.
+
+    The HiGHS executable can hang after its solving report, so it is killed
+    two seconds after printing it.
+    """
+    parser = LogProgressParser(solver)
+    while True:
+        output = process.stdout.readline()
+        if solver == 'highs' and 'Solving report' in output:
+            time.sleep(2)
+            process.kill()
+        elif output == '' and process.poll() is not None:
+            break
+        elif output:
+            print(output.strip())
+            event = parser.feed(output)
+            if event is not None and progress_callback is not None:
+                progress_callback(event)
+
+
+def _run_solver_process(command, solver, progress_callback=None, cancel_token=None):
+    """Run a CBC or HiGHS executable, given as an argument list, to completion while following its log.
+
+    The solver gets its own session so that cancelling stops its whole
+    process tree.
+    """
+    process = subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+        start_new_session=os.name == 'posix',
+    )
+    output_thread = threading.Thread(target=_follow_solver_output, args=(process, solver, progress_callback))
+    output_thread.start()
+    while output_thread.is_alive():
+        output_thread.join(timeout=0.2)
+        if is_cancelled(cancel_token):
+            stop_process_tree(process)
+            output_thread.join()
 
 
-def _parse_solution_highs(model, location_solution):
-    """Parse a HiGHS solution file and set variable values on the model."""
-    for v in model.get_variables():
-        v.set_value(0)
+def _stop_cancelled(results):
+    """End a cancelled solve: keep the plans found so far, or raise when there are none."""
+    if not results:
+        raise SolveCancelled("Solve cancelled before the solver found a plan.")
+    print(f"Solve cancelled; returning the {len(results)} plan(s) found so far")
 
-    with open(location_solution, 'r') as f:
-        cols_started = False
-        for line in f:
-            if not cols_started and "# Columns" not in line:
-                continue
-            elif "# Columns" in line:
-                cols_started = True
-                continue
-            elif cols_started and line[0] != "#":
-                words = line.split()
-                v = model.get_variable(words[0])
-                try:
-                    if v.get_type() in (so.INT, so.BIN):
-                        v.set_value(round(float(words[1])))
-                    elif v.get_type() == so.CONT:
-                        v.set_value(round(float(words[1]), 3))
-                except Exception:
-                    print(f"Error parsing variable: {words[0]}")
-            elif line[0] == "#":
-                break
-
-
-def solve_multi_period_NBA(all_data, squad, sell_prices, gd, itb, options):
+
+def _add_alternative_cutoff(h, data, alternative_solution, it):
+    """Exclude the transfers of the last solution so the next solve finds a different plan.
+
+    ``1gd_buy`` excludes the same buys on the first gameday, ``1week_buy`` and
+    ``2week_buy`` the same buys and sells in the first or second gameweek.
+    When the plan made no such moves, at least one transfer is forced instead.
     """
-    Solve the multi-period NBA Fantasy optimisation problem.
+    if alternative_solution == '1gd_buy':
+        days = [data.next_gd]
+        include_sells = False
+    elif alternative_solution == '1week_buy':
+        gw_range = [data.gameweeks[0]]
+        include_sells = True
+    elif alternative_solution == '2week_buy':
+        gw_range = [data.gameweeks[1]]
+        include_sells = True
+    else:
+        raise ValueError(
+            f"Unknown alternative_solution '{alternative_solution}'. "
+            f"Use '1gd_buy', '1week_buy' or '2week_buy'."
+        )
+    if include_sells:
+        days = [d for w in gw_range for d in data.index.days_by_week.get(w, [])]
+
+    actions = [h.transfer_in[p, d] for p in data.players for d in days if h.transfer_in[p, d].get_value() > 0.5]
+    if include_sells:
+        actions += [h.transfer_out[p, d] for p in data.players for d in days if h.transfer_out[p, d].get_value() > 0.5]
+
+    if actions:
+        h.model.add_constraint(h.expr_sum(a for a in actions) <= len(actions) - 1, name=f'cutoff_{it}')
+    elif include_sells:
+        h.model.add_constraint(h.expr_sum(h.transfer_count[w] for w in gw_range) >= 1, name=f'cutoff_{it}')
+    else:
+        h.model.add_constraint(h.expr_sum(h.number_of_transfers_day[d] for d in days) >= 1, name=f'cutoff_{it}')
 
-    Parameters
-    ----------
-    all_data : pd.DataFrame
-        Player projections data.
-    squad : list
-        Player names in the initial squad.
-    sell_prices : list
-        Sell prices for players in the initial squad.
-    gd : float
-        Current gameday code.
-    itb : float
-        In-the-bank balance.
-    options : dict
-        Solver configuration options.
+
+def _export_mps(model, path):
+    """Write ``model`` as MPS, gzip-compressed when ``path`` ends in ``.gz``."""
+    if isinstance(model, MatrixModel) or not path.endswith('.gz'):
+        model.export_mps(path)
+        return
+    with gzip.open(path, 'wt', compresslevel=1) as f:
+        f.write(model.export_mps(fetch=True))
+
+
+def _with_profile(solution, profiler, data, options, **context):
+    """Attach the solve profile to ``solution`` and log it when ``profile_log`` is set.
+
+    ``data`` is None for a cache hit, which returns before preparing it.
+    """
+    profile = profiler.as_dict()
+    profile_log = options.get('profile_log')
+    if profile_log:
+        horizon = options.get('horizon') if data is None else data.horizon
+        players = None if data is None else len(data.players)
+        profiler.write_jsonl(profile_log, horizon=horizon, players=players, **context)
+    return {**solution, 'profile': profile}
+
+
+def _build_sasoptpy_model(data):
+    """Build the multi-period model with sasoptpy expressions."""
+    all_data = data.all_data
+    players = data.players
+    initial_squad = data.initial_squad
+    element_types = data.element_types
+    teams = data.teams
+    next_gd = data.next_gd
+    gamedays = data.gamedays
+    all_gd = data.all_gd
+    gameweeks = data.gameweeks
+    gameweek_start = data.gameweek_start
+    first_days_of_week = data.first_days_of_week
+    players_by_position = data.index.players_by_position
+    players_by_team = data.index.players_by_team
+    days_by_week = data.index.days_by_week
+    week_of_day = data.index.week_of_day
+    ft_value_dict = data.ft_value_dict
+    horizon = data.horizon
+    tm = data.tm
+    itb = data.itb
+    captain_played = data.captain_played
+    decay_base = data.decay_base
+    bench_weight = data.bench_weight
+    trf_last_gw = data.trf_last_gw
+    banned_players_indices = data.banned_players_indices
+    forced_players_indices = data.forced_players_indices
+    forced_players_days_indices = data.forced_players_days_indices
+    # Chip and captain variables only exist on the gamedays they can be used
+    wc_days = data.wc_allowed_days()
+    as_days = data.all_star_allowed_days()
+    captain_days = data.captain_days()
+    as_day_set = set(as_days)
+    wc_day_set = set(wc_days)
+    captain_day_set = set(captain_days)
+
+    initial_squad_set = set(initial_squad)
+
+    model = so.Model(name='problem_name')
+
+    # Variables
+    squad_var = model.add_variables(players, all_gd, name='squad', vartype=so.binary)
+    squad_all_star = model.add_variables(players, as_days, name='squad_all_star', vartype=so.binary)
+    lineup = model.add_variables(players, gamedays, name='lineup', vartype=so.binary)
+    captain = model.add_variables(players, captain_days, name='captain', vartype=so.binary)
+    transfer_in = model.add_variables(players, gamedays, name='transfer_in', vartype=so.binary)
+    transfer_out_first = model.add_variables(initial_squad, gamedays, name='transfer_out_first', vartype=so.binary)
+    transfer_out_regular = model.add_variables(players, gamedays, name='transfer_out_regular', vartype=so.binary)
+    transfer_out = {
+        (p, d): transfer_out_regular[p, d] + (transfer_out_first[p, d] if p in initial_squad_set else 0)
+        for p in players for d in gamedays
+    }
+    in_the_bank = model.add_variables(all_gd, name='itb', vartype=so.continuous, lb=0)
+    number_of_transfers_day = model.add_variables(gamedays, name='nt', vartype=so.continuous, lb=0)
+    running_transfer_count = model.add_variables(gamedays, name='rtc', vartype=so.continuous, lb=0)
+    penalized_transfers = model.add_variables(gamedays, name='pt', vartype=so.integer, lb=0)
+    auxillary = model.add_variables(all_gd, name='aux', vartype=so.integer, lb=0)
+    use_wc = model.add_variables(wc_days, name='use_wc', vartype=so.binary)
+    use_all_star = model.add_variables(as_days, name='use_all_star', vartype=so.binary)
+
+    # Dictionaries
+    lineup_type_count = {
+        (t, d): so.expr_sum(lineup[p, d] for p in players_by_position.get(t, []))
+        for t in element_types for d in gamedays
+    }
+    squad_type_count = {
+        (t, d): so.expr_sum(squad_var[p, d] for p in players_by_position.get(t, []))
+        for t in element_types for d in gamedays
+    }
+    squad_as_type_count = {
+        (t, d): so.expr_sum(squad_all_star[p, d] for p in players_by_position.get(t, []))
+        for t in element_types for d in as_days
+    }
+    buy_price = all_data['price'].to_dict()
+    sell_price = all_data['sell_price'].to_dict()
+    sold_amount = {
+        d: so.expr_sum(sell_price[p] * transfer_out_first[p, d] for p in initial_squad)
+           + so.expr_sum(buy_price[p] * transfer_out_regular[p, d] for p in players)
+        for d in gamedays
+    }
+    bought_amount = {
+        d: so.expr_sum(buy_price[p] * transfer_in[p, d] for p in players)
+        for d in gamedays
+    }
+    points_block = all_data.loc[players, [str(d) for d in gamedays]].to_numpy()
+    points_player_day = {
+        (p, d): points_block[i, j]
+        for i, p in enumerate(players) for j, d in enumerate(gamedays)
+    }
+    squad_count = {d: so.expr_sum(squad_var[p, d] for p in players) for d in gamedays}
+    squad_as_count = {d: so.expr_sum(squad_all_star[p, d] for p in players) for d in as_days}
+    captains_week = {
+        w: so.expr_sum(captain[p, d] for p in players for d in days_by_week[w] if d in captain_day_set)
+        for w in gameweeks
+    }
+    captain_weeks = [w for w in gameweeks if any(d in captain_day_set for d in days_by_week[w])]
+
+    transfer_count = {
+        w: so.expr_sum(number_of_transfers_day[d] for d in days_by_week[w])
+        for w in gameweeks
+    }
+    transfer_count[gameweeks[0]] = (
+        so.expr_sum(number_of_transfers_day[d] for d in days_by_week[gameweeks[0]])
+        + tm
+    )
+
+    # ===== CONSTRAINTS =====
+
+    # Initial conditions
+    model.add_constraints((squad_var[p, next_gd - 1] == 1 for p in initial_squad), name='initial_squad_players')
+    model.add_constraints((squad_var[p, next_gd - 1] == 0 for p in players if p not in initial_squad_set), name='initial_squad_others')
+    model.add_constraint(in_the_bank[next_gd - 1] == itb, name='initial_itb')
+    if not captain_played:
+        model.add_constraint(captains_week[gameweek_start] == 1, name='initial_captain')
+    initial_aux_value = max(0, tm - 2)
+    model.add_constraint(auxillary[next_gd - 1] == initial_aux_value, name='initial_aux')
+
+    # Squad and lineup
+    model.add_constraints((squad_count[d] == 10 for d in gamedays), name='squad_count')
+    model.add_constraints((squad_as_count[d] == 10 * use_all_star[d] for d in as_days), name='squad_as_count')
+    model.add_constraints((so.expr_sum(lineup[p, d] for p in players) == 5 for d in gamedays), name='lineup_count')
+    model.add_constraints((
+        lineup[p, d] <= squad_var[p, d] + (use_all_star[d] if d in as_day_set else 0)
+        for p in players for d in gamedays
+    ), name='lineup_squad_rel')
+    model.add_constraints((lineup[p, d] <= squad_all_star[p, d] + 1 - use_all_star[d] for p in players for d in as_days), name='lineup_squad_as_rel')
+    model.add_constraints((lineup_type_count[t, d] == [2, 3] for t in element_types for d in gamedays), name='valid_formation')
+    model.add_constraints((squad_type_count[t, d] == 5 for t in element_types for d in gamedays), name='valid_squad')
+    model.add_constraints((squad_as_type_count[t, d] == 5 * use_all_star[d] for t in element_types for d in as_days), name='valid_squad_as')
+    model.add_constraints((so.expr_sum(squad_var[p, d] for p in players_by_team.get(t, [])) <= 2 for t in teams for d in gamedays), name='team_limit')
+    model.add_constraints((so.expr_sum(squad_all_star[p, d] for p in players_by_team.get(t, [])) <= 2 * use_all_star[d] for t in teams for d in as_days), name='team_limit_as')
+
+    # Captain
+    model.add_constraints((so.expr_sum(captain[p, d] for p in players) <= 1 for d in captain_days), name='captain_count_gd')
+    model.add_constraints((captains_week[w] <= 1 for w in captain_weeks), name='captain_count_gw')
+    model.add_constraints((captain[p, d] <= lineup[p, d] for p in players for d in captain_days), name='captain_lineup_rel')
+
+    # Transfers
+    model.add_constraints((squad_var[p, d] == squad_var[p, d - 1] + transfer_in[p, d] - transfer_out[p, d] for p in players for d in gamedays), name='squad_transfer_rel')
+    model.add_constraints((
+        number_of_transfers_day[d] >= so.expr_sum(transfer_out[p, d] for p in players) - (10 * use_wc[d] if d in wc_day_set else 0)
+        for d in gamedays
+    ), 'day_transfer_rel')
+    model.add_constraints((
+        running_transfer_count[d] == (tm if week_of_day[d] == gameweek_start else 0)
+        + so.expr_sum(number_of_transfers_day[dd] for dd in days_by_week[week_of_day[d]] if dd <= d)
+        for d in gamedays
+    ), name='running_transfer_rel')
+    model.add_constraints((auxillary[d] >= running_transfer_count[d] - 2 for d in gamedays), name='aux_transfer_rel')
+    model.add_constraints((penalized_transfers[d] >= auxillary[d] - (0 if d in first_days_of_week else auxillary[d - 1]) for d in gamedays), name='aux_transfer_rel2')
+    model.add_constraints((penalized_transfers[d] <= number_of_transfers_day[d] for d in gamedays), name='penalized_transfers_rel')
+    model.add_constraints((in_the_bank[d] == in_the_bank[d - 1] + sold_amount[d] - bought_amount[d] for d in gamedays), name='cont_budget')
+    model.add_constraints((transfer_out_first[p, d] + transfer_out_regular[p, d] <= 1 for p in initial_squad for d in gamedays), name='multi_sell_1')
+    model.add_constraints((
+        horizon * so.expr_sum(transfer_out_first[p, d] for d in gamedays if d <= dbar)
+        >= so.expr_sum(transfer_out_regular[p, d] for d in gamedays if d >= dbar)
+        for p in initial_squad for dbar in gamedays
+    ), name='multi_sell_2')
+    model.add_constraints((so.expr_sum(transfer_out_first[p, d] for d in gamedays) <= 1 for p in initial_squad), name='multi_sell_3')
+    model.add_constraint(transfer_count[gameweeks[-1]] <= trf_last_gw, name='transfers_last_gw')
+    model.add_constraints((transfer_in[p, d] <= 1 - use_all_star[d] for p in players for d in as_days), name='no_transfer_on_as')
+
+    # Banned/Forced players
+    model.add_constraints((squad_var[p, d] == 0 for p in banned_players_indices for d in gamedays), name='banned_players')
+    model.add_constraints((squad_var[p, d] == 1 for p in forced_players_indices for d in gamedays), name='forced_players')
+    for p, forced_days in forced_players_days_indices.items():
+        for d in forced_days:
+            model.add_constraint(squad_var[p, d] == 1, name=f'forced_player_{p}_{d}')
+
+    # Chips: at most one use when several days are allowed, one chip or captain per gameday
+    if len(wc_days) > 1:
+        model.add_constraint(so.expr_sum(use_wc[d] for d in wc_days) <= 1, name='wc_limit')
+    if len(as_days) > 1:
+        model.add_constraint(so.expr_sum(use_all_star[d] for d in as_days) <= 1, name='as_limit')
+    model.add_constraints((squad_all_star[p, d] <= use_all_star[d] for p in players for d in as_days), name='all_star_logic')
+    model.add_constraints((
+        so.expr_sum(captain[p, d] for p in players if d in captain_day_set)
+        + (use_wc[d] if d in wc_day_set else 0) + (use_all_star[d] if d in as_day_set else 0) <= 1
+        for d in gamedays if d in wc_day_set or d in as_day_set
+    ), name='one_chip_per_gd')
+
+    # ===== OBJECTIVE =====
+    gd_xp = {
+        d: so.expr_sum(points_player_day[p, d] * lineup[p, d] for p in players)
+           + so.expr_sum(points_player_day[p, d] * captain[p, d] for p in players if d in captain_day_set)
+           - 100 * penalized_transfers[d]
+        for d in gamedays
+    }
+
+    gd_total = {
+        d: (
+            gd_xp[d] + 100 * penalized_transfers[d]
+            + so.expr_sum(bench_weight * points_player_day[p, d] * (squad_var[p, d] - lineup[p, d]) for p in players)
+        ) * pow(decay_base, d - next_gd)
+        - ft_value_dict[d] * (number_of_transfers_day[d] - penalized_transfers[d])
+        - 100 * penalized_transfers[d]
+        for d in gamedays
+    }
+
+    gw_xp = {
+        w: so.expr_sum(gd_xp[d] for d in days_by_week[w])
+        for w in gameweeks
+    }
+    gw_total = {
+        w: so.expr_sum(gd_total[d] for d in days_by_week[w])
+        for w in gameweeks
+    }
+
+    decay_objective = so.expr_sum(gw_total[w] for w in gameweeks)
+    model.set_objective(-decay_objective, sense='N', name='tdxp')
+
+    return ModelHandles(
+        model=model,
+        expr_sum=so.expr_sum,
+        squad=squad_var,
+        squad_all_star={(p, d): squad_all_star[p, d] for p in players for d in as_days},
+        lineup=lineup,
+        captain={(p, d): captain[p, d] for p in players for d in captain_days},
+        transfer_in=transfer_in,
+        transfer_out_first=transfer_out_first,
+        transfer_out_regular=transfer_out_regular,
+        transfer_out=transfer_out,
+        in_the_bank=in_the_bank,
+        number_of_transfers_day=number_of_transfers_day,
+        penalized_transfers=penalized_transfers,
+        use_wc={d: use_wc[d] for d in wc_days},
+        use_all_star={d: use_all_star[d] for d in as_days},
+        gd_xp=gd_xp,
+        gw_xp=gw_xp,
+        transfer_count=transfer_count,
+    )
+
+
+def prepare_model_data(all_data, squad, sell_prices, gd, itb, options, profiler=None, reference_data=None):
+    """
+    Resolve options, reference data and player filtering into a ModelData.
+
+    Parameters are the same as for :func:`solve_multi_period_NBA`; a
+    ``PhaseProfiler`` passed as ``profiler`` times the preparation phases.
 
     Returns
     -------
-    dict
-        Dictionary with 'picks' DataFrame and 'results' list.
+    ModelData
+        Filtered players and the sets and parameters of the model.
     """
 
     # --- Validate required options ---
@@ -122,13 +455,13 @@ def solve_multi_period_NBA(all_data, squad, sell_prices, gd, itb, options):
     all_star_day = options.get('all_star_day', 0)
     all_star_days = options.get('all_star_days', [])
     all_star_range = options.get('all_star_range', [])
-    solve_time = options.get('solve_time', 300)
     banned_players = options.get('banned_players', [])
     forced_players = options.get('forced_players', [])
     forced_players_days = options.get('forced_players_days', {})
-    number_solutions = options.get('no_sols', 1)
-    alternative_solution = options.get('alternative_solution', '1week_buy')
     threshold_value = options.get('threshold_value', 0)
+    player_filter = options.get('player_filter', 'threshold')
+    if player_filter not in ('threshold', 'reduced_cost'):
+        raise ValueError(f"Unknown player_filter '{player_filter}'. Use 'threshold' or 'reduced_cost'.")
     trf_last_gw = options.get('trf_last_gw', 2)
     ft_increment = options.get('ft_increment', 3)
 
@@ -151,14 +484,17 @@ def solve_multi_period_NBA(all_data, squad, sell_prices, gd, itb, options):
         squad = []
         sell_prices = []
 
+    profiler = profiler or PhaseProfiler()
+
     # --- Load reference data ---
-    team_data = pd.read_csv('data/teams.csv')
-    gameday_data = pd.read_csv('data/fixture_info.csv')
-    players_data = pd.read_csv('data/players.csv')
+    profiler.start('read_data')
+    reference_data = reference_data or ReferenceData.load()
+    team_data = reference_data.teams
+    gameday_data = reference_data.gameday_data
 
     # Merge current prices onto projections, but preserve projection prices when the
     # reference table is incomplete or names do not match exactly.
-    all_data = all_data.merge(players_data[['name', 'price']].rename(columns={'price': 'live_price'}), on='name', how='left')
+    all_data = all_data.merge(reference_data.live_prices.rename(columns={'price': 'live_price'}), on='name', how='left')
     if 'price' in all_data.columns:
         all_data['price'] = all_data['live_price'].fillna(all_data['price'])
     else:
@@ -166,12 +502,12 @@ def solve_multi_period_NBA(all_data, squad, sell_prices, gd, itb, options):
     all_data.drop(columns=['live_price'], inplace=True)
     all_data['price'] = pd.to_numeric(all_data['price'], errors='coerce')
 
+    profiler.start('filter')
     initial_squad = all_data[all_data['name'].isin(squad)].index.tolist()
 
     print('\nInitialising Problem\n')
 
     gd = float(gd)
-    problem_name = f"mp_h{horizon}_w{wc_day}_{get_random_id(5)}"
     next_gd = _gameday_code_to_ids(gameday_data, gd)[0]
 
     # --- Resolve player indices ---
@@ -248,9 +584,13 @@ def solve_multi_period_NBA(all_data, squad, sell_prices, gd, itb, options):
     )
     keep_players = all_data[keep_mask]
 
-    all_data = all_data[all_data['value'] > threshold_value]
-    all_data = pd.concat([all_data, keep_players]).drop_duplicates(subset='id', keep='first')
-    all_data.sort_values(by='id', ascending=True, inplace=True)
+    shortlist = all_data[all_data['value'] > threshold_value]
+    shortlist = pd.concat([shortlist, keep_players]).drop_duplicates(subset='id', keep='first')
+    if player_filter == 'threshold':
+        all_data = shortlist
+    # With reduced-cost pruning every player enters the model and the
+    # threshold shortlist only provides the incumbent the pruning is measured against
+    all_data = all_data.sort_values(by='id', ascending=True)
 
     players = all_data.index.to_list()
 
@@ -293,387 +633,415 @@ def solve_multi_period_NBA(all_data, squad, sell_prices, gd, itb, options):
         missing_names = ', '.join(missing_sell_prices['name'].astype(str).tolist())
         raise ValueError(f'Missing sell prices for players after sell price assignment: {missing_names}')
 
-    os.makedirs('output', exist_ok=True)
-    all_data.to_csv('output/filtered_player_xpts.csv')
-
-    # ===== MODEL =====
-    model = so.Model(name='problem_name')
-
-    # Variables
-    squad_var = model.add_variables(players, all_gd, name='squad', vartype=so.binary)
-    squad_all_star = model.add_variables(players, gamedays, name='squad_all_star', vartype=so.binary)
-    lineup = model.add_variables(players, gamedays, name='lineup', vartype=so.binary)
-    captain = model.add_variables(players, gamedays, name='captain', vartype=so.binary)
-    transfer_in = model.add_variables(players, gamedays, name='transfer_in', vartype=so.binary)
-    transfer_out_first = model.add_variables(initial_squad, gamedays, name='transfer_out_first', vartype=so.binary)
-    transfer_out_regular = model.add_variables(players, gamedays, name='transfer_out_regular', vartype=so.binary)
-    transfer_out = {
-        (p, d): transfer_out_regular[p, d] + (transfer_out_first[p, d] if p in initial_squad else 0)
-        for p in players for d in gamedays
-    }
-    in_the_bank = model.add_variables(all_gd, name='itb', vartype=so.continuous, lb=0)
-    number_of_transfers_day = model.add_variables(gamedays, name='nt', vartype=so.continuous, lb=0)
-    running_transfer_count = model.add_variables(gamedays, name='rtc', vartype=so.continuous, lb=0)
-    penalized_transfers = model.add_variables(gamedays, name='pt', vartype=so.integer, lb=0)
-    auxillary = model.add_variables(all_gd, name='aux', vartype=so.integer, lb=0)
-    use_wc = model.add_variables(gamedays, name='use_wc', vartype=so.binary)
-    use_all_star = model.add_variables(gamedays, name='use_all_star', vartype=so.binary)
-
-    # Dictionaries
-    lineup_type_count = {
-        (t, d): so.expr_sum(lineup[p, d] for p in players if all_data.loc[p, 'position'] == t)
-        for t in element_types for d in gamedays
-    }
-    squad_type_count = {
-        (t, d): so.expr_sum(squad_var[p, d] for p in players if all_data.loc[p, 'position'] == t)
-        for t in element_types for d in gamedays
-    }
-    squad_as_type_count = {
-        (t, d): so.expr_sum(squad_all_star[p, d] for p in players if all_data.loc[p, 'position'] == t)
-        for t in element_types for d in gamedays
-    }
-    buy_price = all_data['price'].to_dict()
-    sell_price = all_data['sell_price'].to_dict()
-    sold_amount = {
-        d: so.expr_sum(sell_price[p] * transfer_out_first[p, d] for p in initial_squad)
-           + so.expr_sum(buy_price[p] * transfer_out_regular[p, d] for p in players)
-        for d in gamedays
-    }
-    bought_amount = {
-        d: so.expr_sum(buy_price[p] * transfer_in[p, d] for p in players)
-        for d in gamedays
-    }
-    points_player_day = {
-        (p, d): all_data.loc[p, str(d)]
-        for p in players for d in gamedays
-    }
-    squad_count = {d: so.expr_sum(squad_var[p, d] for p in players) for d in gamedays}
-    squad_as_count = {d: so.expr_sum(squad_all_star[p, d] for p in players) for d in gamedays}
-    captains_week = {
-        w: so.expr_sum(captain[p, d] for p in players for d in gamedays if gameday_data.loc[d - 1, 'week'] == w)
-        for w in gameweeks
-    }
-
-    transfer_count = {
-        w: so.expr_sum(number_of_transfers_day[d] for d in gamedays if gameday_data.loc[d - 1, 'week'] == w)
-        for w in gameweeks
-    }
-    transfer_count[gameweeks[0]] = (
-        so.expr_sum(number_of_transfers_day[d] for d in gamedays if gameday_data.loc[d - 1, 'week'] == gameweeks[0])
-        + tm
+    # --- Model inputs ---
+    index = ModelIndex.build(all_data, players, gameday_data, gamedays, gameweeks)
+
+    data = ModelData(
+        all_data=all_data,
+        gameday_data=gameday_data,
+        players=players,
+        initial_squad=initial_squad,
+        element_types=element_types,
+        teams=teams,
+        next_gd=next_gd,
+        gamedays=gamedays,
+        all_gd=all_gd,
+        gameweeks=gameweeks,
+        gameweek_start=gameweek_start,
+        first_days_of_week=index.first_days_of_week,
+        ft_value_dict=ft_value_dict,
+        index=index,
+        horizon=horizon,
+        tm=tm,
+        itb=itb,
+        captain_played=captain_played,
+        decay_base=decay_base,
+        bench_weight=bench_weight,
+        trf_last_gw=trf_last_gw,
+        banned_players_indices=banned_players_indices,
+        forced_players_indices=forced_players_indices,
+        forced_players_days_indices=forced_players_days_indices,
+        wc_day=wc_day,
+        wc_gameday=wc_gameday,
+        wc_days=wc_days,
+        wc_gamedays=wc_gamedays,
+        wc_range=wc_range,
+        all_star_day=all_star_day,
+        all_star_gameday=all_star_gameday,
+        all_star_days=all_star_days,
+        all_star_gamedays=all_star_gamedays,
+        all_star_range=all_star_range,
+        all_star_range_ids=all_star_range_ids,
     )
 
-    first_days_of_week = set()
-    for w in gameweeks:
-        days_in_week = [d for d in gamedays if gameday_data.loc[d - 1, 'week'] == w]
-        if days_in_week:
-            first_days_of_week.add(min(days_in_week))
-
-    # ===== CONSTRAINTS =====
-
-    # Initial conditions
-    model.add_constraints((squad_var[p, next_gd - 1] == 1 for p in initial_squad), name='initial_squad_players')
-    model.add_constraints((squad_var[p, next_gd - 1] == 0 for p in players if p not in initial_squad), name='initial_squad_others')
-    model.add_constraint(in_the_bank[next_gd - 1] == itb, name='initial_itb')
-    model.add_constraint(
-        captains_week[gameweek_start] == (0 if captain_played else 1),
-        name='initial_captain',
-    )
-    initial_aux_value = max(0, tm - 2)
-    model.add_constraint(auxillary[next_gd - 1] == initial_aux_value, name='initial_aux')
-
-    # Squad and lineup
-    model.add_constraints((squad_count[d] == 10 for d in gamedays), name='squad_count')
-    model.add_constraints((squad_as_count[d] == 10 * use_all_star[d] for d in gamedays), name='squad_as_count')
-    model.add_constraints((so.expr_sum(lineup[p, d] for p in players) == 5 for d in gamedays), name='lineup_count')
-    model.add_constraints((lineup[p, d] <= squad_var[p, d] + use_all_star[d] for p in players for d in gamedays), name='lineup_squad_rel')
-    model.add_constraints((lineup[p, d] <= squad_all_star[p, d] + 1 - use_all_star[d] for p in players for d in gamedays), name='lineup_squad_as_rel')
-    model.add_constraints((lineup_type_count[t, d] == [2, 3] for t in element_types for d in gamedays), name='valid_formation')
-    model.add_constraints((squad_type_count[t, d] == 5 for t in element_types for d in gamedays), name='valid_squad')
-    model.add_constraints((squad_as_type_count[t, d] == 5 * use_all_star[d] for t in element_types for d in gamedays), name='valid_squad_as')
-    model.add_constraints((so.expr_sum(squad_var[p, d] for p in players if all_data.loc[p, 'team'] == t) <= 2 for t in teams for d in gamedays), name='team_limit')
-    model.add_constraints((so.expr_sum(squad_all_star[p, d] for p in players if all_data.loc[p, 'team'] == t) <= 2 * use_all_star[d] for t in teams for d in gamedays), name='team_limit_as')
-
-    # Captain
-    model.add_constraints((so.expr_sum(captain[p, d] for p in players) <= 1 for d in gamedays), name='captain_count_gd')
-    model.add_constraints((captains_week[w] <= 1 for w in gameweeks), name='captain_count_gw')
-    model.add_constraints((captain[p, d] <= lineup[p, d] for p in players for d in gamedays), name='captain_lineup_rel')
-
-    # Transfers
-    model.add_constraints((squad_var[p, d] == squad_var[p, d - 1] + transfer_in[p, d] - transfer_out[p, d] for p in players for d in gamedays), name='squad_transfer_rel')
-    model.add_constraints((number_of_transfers_day[d] >= so.expr_sum(transfer_out[p, d] for p in players) - (10 * use_wc[d]) for d in gamedays), 'day_transfer_rel')
-    model.add_constraints((
-        running_transfer_count[d] == (tm if gameday_data.loc[d - 1, 'week'] == gameweek_start else 0)
-        + so.expr_sum(number_of_transfers_day[dd] for dd in gamedays if (dd <= d) and (gameday_data.loc[d - 1, 'week'] == gameday_data.loc[dd - 1, 'week']))
-        for d in gamedays
-    ), name='running_transfer_rel')
-    model.add_constraints((auxillary[d] >= running_transfer_count[d] - 2 for d in gamedays), name='aux_transfer_rel')
-    model.add_constraints((penalized_transfers[d] >= auxillary[d] - (0 if d in first_days_of_week else auxillary[d - 1]) for d in gamedays), name='aux_transfer_rel2')
-    model.add_constraints((penalized_transfers[d] <= number_of_transfers_day[d] for d in gamedays), name='penalized_transfers_rel')
-    model.add_constraints((in_the_bank[d] == in_the_bank[d - 1] + sold_amount[d] - bought_amount[d] for d in gamedays), name='cont_budget')
-    model.add_constraints((transfer_out_first[p, d] + transfer_out_regular[p, d] <= 1 for p in initial_squad for d in gamedays), name='multi_sell_1')
-    model.add_constraints((
-        horizon * so.expr_sum(transfer_out_first[p, d] for d in gamedays if d <= dbar)
-        >= so.expr_sum(transfer_out_regular[p, d] for d in gamedays if d >= dbar)
-        for p in initial_squad for dbar in gamedays
-    ), name='multi_sell_2')
-    model.add_constraints((so.expr_sum(transfer_out_first[p, d] for d in gamedays) <= 1 for p in initial_squad), name='multi_sell_3')
-    model.add_constraint(transfer_count[gameweeks[-1]] <= trf_last_gw, name='transfers_last_gw')
-    model.add_constraints((transfer_in[p, d] <= 1 - use_all_star[d] for p in players for d in gamedays), name='no_transfer_on_as')
-
-    # Banned/Forced players
-    model.add_constraints((squad_var[p, d] == 0 for p in banned_players_indices for d in gamedays), name='banned_players')
-    model.add_constraints((squad_var[p, d] == 1 for p in forced_players_indices for d in gamedays), name='forced_players')
-    for p, forced_days in forced_players_days_indices.items():
-        for d in forced_days:
-            model.add_constraint(squad_var[p, d] == 1, name=f'forced_player_{p}_{d}')
-
-    # Wildcard
-    if wc_day > 0:
-        model.add_constraints((use_wc[d] == 0 for d in gamedays if d != wc_gameday[0]), name='no_wc_day')
-    elif wc_days:
-        model.add_constraints((use_wc[d] == 0 for d in gamedays if d not in wc_gamedays), name='no_wc_days')
-        model.add_constraints((so.expr_sum(use_wc[d] for d in gamedays) <= 1), name='wc_limit')
-    elif wc_range:
-        model.add_constraints((use_wc[d] == 0 for d in gamedays if d not in wc_range), name='no_wc_range')
-        model.add_constraints((so.expr_sum(use_wc[d] for d in gamedays) <= 1), name='wc_limit')
-    else:
-        model.add_constraints((use_wc[d] == 0 for d in gamedays), name='no_wc')
-
-    # All Star
-    if all_star_day > 0:
-        model.add_constraints((use_all_star[d] == 0 for d in gamedays if d != all_star_gameday[0]), name='no_as_day')
-    elif all_star_days:
-        model.add_constraints((use_all_star[d] == 0 for d in gamedays if d not in all_star_gamedays), name='no_as_days')
-        model.add_constraints((so.expr_sum(use_all_star[d] for d in gamedays) <= 1), name='as_limit')
-    elif all_star_range:
-        model.add_constraints((use_all_star[d] == 0 for d in gamedays if d not in all_star_range_ids), name='no_as_range')
-        model.add_constraints((so.expr_sum(use_all_star[d] for d in gamedays) <= 1), name='as_limit')
-    else:
-        model.add_constraints((use_all_star[d] == 0 for d in gamedays), name='no_as')
-
-    # Chip logic
-    model.add_constraints((squad_all_star[p, d] <= use_all_star[d] for p in players for d in gamedays), name='all_star_logic')
-    model.add_constraints((so.expr_sum(captain[p, d] for p in players) + use_wc[d] + use_all_star[d] <= 1 for d in gamedays), name='one_chip_per_gd')
-
-    # ===== OBJECTIVE =====
-    gd_xp = {
-        d: so.expr_sum(points_player_day[p, d] * (lineup[p, d] + captain[p, d]) for p in players)
-           - 100 * penalized_transfers[d]
-        for d in gamedays
-    }
-
-    gd_total = {
-        d: (
-            gd_xp[d] + 100 * penalized_transfers[d]
-            + so.expr_sum(bench_weight * points_player_day[p, d] * (squad_var[p, d] - lineup[p, d]) for p in players)
-        ) * pow(decay_base, d - next_gd)
-        - ft_value_dict[d] * (number_of_transfers_day[d] - penalized_transfers[d])
-        - 100 * penalized_transfers[d]
-        for d in gamedays
-    }
-
-    gw_xp = {
-        w: so.expr_sum(gd_xp[d] for d in gamedays if gameday_data.loc[d - 1, "week"] == w)
-        for w in gameweeks
-    }
-    gw_total = {
-        w: so.expr_sum(gd_total[d] for d in gamedays if gameday_data.loc[d - 1, "week"] == w)
-        for w in gameweeks
-    }
+    if options.get('dominance_filter', False):
+        profiler.start('dominance_filter')
+        dominance = dominance_filter(data, keep_players.index.tolist())
+        before = len(data.players)
+        data = data.restricted_to(dominance.keep)
+        data.reductions['dominance'] = {
+            'before': before,
+            'after': len(data.players),
+            'pruned': dominance.pruned,
+            'by_position': dominance.by_position,
+        }
+        ratios = ', '.join(f"{pos} {stats['ratio']:.0%}" for pos, stats in dominance.by_position.items())
+        print(f"Dominance filter removed {dominance.pruned} of {before} players (kept {ratios})")
+
+    if player_filter == 'reduced_cost':
+        profiler.start('reduced_cost_prune')
+        pruning = reduced_cost_prune(data, shortlist.index.tolist(), keep_players.index.tolist(), options)
+        if pruning is None:
+            print("Reduced-cost pruning skipped: no LP or incumbent solution")
+        else:
+            before = len(data.players)
+            data = data.restricted_to(pruning.keep)
+            data.reductions['reduced_cost'] = {
+                'before': before,
+                'after': len(data.players),
+                'pruned': pruning.pruned,
+                'lp_bound': -round(pruning.lp_bound, 2),
+                'incumbent': -round(pruning.incumbent, 2),
+            }
+            print(f"Reduced-cost pruning removed {pruning.pruned} of {before} players")
+
+    if options.get('write_outputs', True):
+        profiler.start('write_output')
+        os.makedirs('output', exist_ok=True)
+        data.all_data.to_csv('output/filtered_player_xpts.csv')
+
+    return data
+
+
+def solve_multi_period_NBA(all_data, squad, sell_prices, gd, itb, options, progress_callback=None,
+                           cancel_token=None, reference_data=None, initial_plan=None, model_templates=None):
+    """
+    Solve the multi-period NBA Fantasy optimisation problem.
 
-    decay_objective = so.expr_sum(gw_total[w] for w in gameweeks)
-    model.set_objective(-decay_objective, sense='N', name='tdxp')
+    Parameters
+    ----------
+    all_data : pd.DataFrame
+        Player projections data.
+    squad : list
+        Player names in the initial squad.
+    sell_prices : list
+        Sell prices for players in the initial squad.
+    gd : float
+        Current gameday code.
+    itb : float
+        In-the-bank balance.
+    options : dict
+        Solver configuration options. Set ``cache`` to keep finished solves
+        on disk under ``cache_dir``; solves given a MIP start are not cached.
+    progress_callback : callable, optional
+        Called with an ``engine.progress.SolverProgress`` whenever the solver
+        reports nodes, incumbent, bound or gap.
+    cancel_token : engine.cancellation.CancellationToken, optional
+        Cancelling it stops the running solver and returns the plans found so
+        far, including the incumbent of the interrupted search. Raises
+        ``SolveCancelled`` when no plan had been found yet.
+    reference_data : engine.reference_data.ReferenceData, optional
+        Teams, gameday table and live prices. Read from ``data/`` when
+        omitted; pass one in to reuse it across solves. Set the
+        ``write_outputs`` option to False to also skip writing the filtered
+        projections and the plan under ``output/``.
+    initial_plan : pd.DataFrame or str, optional
+        Plan to start the solver from: the ``picks`` of an earlier solve, the
+        path of a saved picks CSV or ``'heuristic'``. Defaults to the
+        ``mip_start`` option. It is replayed from today's squad within the
+        rules, so yesterday's plan can be passed as it is.
+    model_templates : engine.model_template.ModelTemplates, optional
+        Matrix models of earlier solves of the same squad at the same prices.
+        A solve that differs from one of them only in projections, decay,
+        bench weight, FT value or ITB updates that model in place instead of
+        building a new one. Without it every solve builds its model.
 
-    # ===== SOLVE =====
-    os.makedirs('solution_files', exist_ok=True)
+    Returns
+    -------
+    dict
+        Dictionary with 'picks' DataFrame, 'results' list and 'profile', the
+        time and memory of each phase plus the model size. Set
+        ``profile_objects`` to also count objects at the end of each phase, and
+        ``profile_log`` to append the profile to a JSON lines file.
+    """
+    profiler = PhaseProfiler(count_objects=options.get('profile_objects', False))
+    # The cache is looked up on the raw inputs, so a hit skips filtering and pruning too
+    result_cache = ResultCache.from_options(options)
+    if result_cache is not None and (initial_plan is not None or options.get('mip_start')):
+        # The plans then depend on the start, which the key does not cover
+        print("Solves from a MIP start are not cached.")
+        result_cache = None
+    key = None
+    if result_cache is not None:
+        profiler.start('read_data')
+        reference_data = reference_data or ReferenceData.load()
+        profiler.start('cache')
+        key = cache_key(all_data, squad, sell_prices, gd, itb, options, reference_data)
+        cached = result_cache.get(key)
+        if cached is not None:
+            print(f"Loaded cached solve {key[:12]}")
+            if options.get('write_outputs', True):
+                os.makedirs('output', exist_ok=True)
+                cached['picks'].to_csv('output/optimal_plan_decay.csv')
+            return _with_profile(cached, profiler, None, options, cache_hit=True)
+
+    data = prepare_model_data(all_data, squad, sell_prices, gd, itb, options, profiler, reference_data)
+    gameday_data = data.gameday_data
+    gamedays = data.gamedays
 
-    location_problem = f'solution_files/{problem_name}.mps'
-    location_solution = f'solution_files/{problem_name}_sp.txt'
-    opt_file_name = f'solution_files/{problem_name}_opt.txt'
+    solve_time = options.get('solve_time', 300)
+    number_solutions = options.get('no_sols', 1)
+    alternative_solution = options.get('alternative_solution', '1week_buy')
+    problem_name = f"mp_h{data.horizon}_w{data.wc_day}_{get_random_id(5)}"
 
-    results = []
+    # ===== MODEL =====
+    profiler.start('build')
     solver = options.get('solver', 'cbc')
+    model_builder = options.get('model_builder', 'sasoptpy')
+    if initial_plan is None:
+        initial_plan = options.get('mip_start') or None
+    use_start = initial_plan is not None and solver != 'heuristic'
+    if solver in ('highs_inprocess', 'heuristic') or use_start:
+        # The in-process backend passes arrays to HiGHS, and the heuristic and
+        # MIP starts fill in a column vector, so they need the matrix model
+        model_builder = 'matrix'
+    if solver == 'heuristic' and number_solutions > 1:
+        # The heuristic ignores cutoff rows, so every iteration would repeat the first plan
+        print("solver 'heuristic' finds one plan; ignoring no_sols.")
+        number_solutions = 1
+    template = None
+    reused_model = False
+    if model_builder == 'matrix' and model_templates is not None:
+        template, reused_model = model_templates.take(data)
+        h = template.handles
+        if reused_model:
+            print("Reusing the model of an earlier solve with new coefficients")
+    elif model_builder == 'matrix':
+        h = build_matrix_model(data)
+    elif model_builder == 'sasoptpy':
+        h = _build_sasoptpy_model(data)
+    else:
+        raise ValueError(f"Unknown model_builder '{model_builder}'. Use 'sasoptpy' or 'matrix'.")
+    # A template is handed back even when the solve fails or is cancelled:
+    # take() rolls back its rows and resets its coefficients before reuse
+    try:
+        model = h.model
+        profiler.record_model(model)
+        # Solution files are matched to sasoptpy variables by name, so the name order is built once
+        column_order = None if isinstance(model, MatrixModel) else ColumnOrder.of(model)
+        gameday_codes = dict(zip(gameday_data['id'].astype(int), gameday_data['code'].astype(float)))
+
+        start = None
+        if use_start:
+            profiler.start('mip_start')
+            start = start_values(h, data, initial_plan, gameday_codes)
+
+        # ===== SOLVE =====
+        results = []
+        # Alternative plans re-solve the same model plus one cutoff row, so the
+        # in-process backend keeps its Highs instance between iterations
+        incremental_highs = (
+            IncrementalHighs(options, progress_callback, cancel_token) if solver == 'highs_inprocess' else None
+        )
 
-    for it in range(number_solutions):
-        print(f'Solving iteration {it + 1}/{number_solutions}')
-        model.export_mps(location_problem)
-
-        t0 = time.time()
-
-        if solver == 'cbc':
-            cbc_path = options.get('cbc_path')
-            # Initial solve for starting point
-            subprocess.Popen(
-                [cbc_path, location_problem, 'ratio', '1', 'cost', 'column', 'solve', 'solu', location_solution],
-                shell=False,
-            ).wait()
-
-            print(f'Solving iteration {it + 1}/{number_solutions}')
-
-            # Full solve with time limit
-            subprocess.Popen(
-                [cbc_path, location_problem, 'mips', location_solution, 'sec', str(solve_time),
-                 'cost', 'column', 'solve', 'solu', location_solution],
-                shell=False,
-            ).wait()
-
-            _parse_solution_cbc(model, location_solution)
-
-        elif solver == 'highs':
-            highs_path = options.get('highs_path')
-            secs = options.get('solve_time', 20 * 60)
-            presolve = options.get('presolve', 'on')
-            gap = options.get('gap', 0)
-            random_seed = options.get('random_seed', 0)
-
-            with open(opt_file_name, 'w') as f:
-                f.write(f'mip_rel_gap = {gap}')
-
-            command = (
-                f'{highs_path} --parallel on --options_file {opt_file_name} '
-                f'--random_seed {random_seed} --presolve {presolve} '
-                f'--model_file {location_problem} --time_limit {secs} '
-                f'--solution_file {location_solution}'
-            )
-
-            def print_output(process):
-                while True:
-                    output = process.stdout.readline()
-                    if 'Solving report' in output:
-                        time.sleep(2)
-                        process.kill()
-                    elif output == '' and process.poll() is not None:
-                        break
-                    elif output:
-                        print(output.strip())
-
-            process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-            output_thread = threading.Thread(target=print_output, args=(process,))
-            output_thread.start()
-            output_thread.join()
-
-            _parse_solution_highs(model, location_solution)
-
-        t1 = time.time()
-        print(f"\n{round(t1 - t0, 1)} seconds passed")
-
-        # ===== RESULTS =====
-        picks = []
-        for d in gamedays:
-            period_index = list(map(int, gameday_data[gameday_data['id'] == d].index.tolist()))
-            new_gd = gameday_data.loc[period_index, 'code'].astype(float).tolist()[0]
-
-            for p in players:
-                is_in_squad = (
-                    (use_all_star[d].get_value() > 0.5 and squad_all_star[p, d].get_value() > 0.5)
-                    or (use_all_star[d].get_value() <= 0.5 and (squad_var[p, d].get_value() + transfer_out[p, d].get_value() > 0.5))
-                )
-                if is_in_squad:
-                    lp = all_data.loc[p]
-                    picks.append([
-                        new_gd,
-                        lp['name'],
-                        lp['position'],
-                        lp['team'],
-                        buy_price[p],
-                        round(points_player_day[p, d], 2),
-                        1 if lineup[p, d].get_value() > 0.5 else 0,
-                        1 if captain[p, d].get_value() > 0.5 else 0,
-                        1 if transfer_in[p, d].get_value() > 0.5 else 0,
-                        1 if transfer_out[p, d].get_value() > 0.5 else 0,
-                    ])
-
-        total_xp = sum(gw_xp[w].get_value() for w in gameweeks)
-
-        picks_df = pd.DataFrame(
-            picks,
-            columns=['gameday', 'name', 'pos', 'team', 'price', 'xP', 'lineup', 'captain', 'transfer_in', 'transfer_out'],
-        ).sort_values(by=['gameday', 'price', 'xP'], ascending=[True, False, False])
-
-        # Build summary
-        summary_of_actions = ""
-        chip_used = {}
-        for d in gamedays:
-            period_index = gameday_data[gameday_data['id'] == d].index.tolist()
-            new_gd = gameday_data.loc[list(map(int, period_index)), 'code'].astype(float).tolist()[0]
-            summary_of_actions += f"** GD {new_gd}:\n"
-
-            if use_wc[d].get_value() > 0.5:
-                summary_of_actions += "CHIP: WILDCARD\n"
-                chip_used[new_gd] = " - WILDCARD"
-            if use_all_star[d].get_value() > 0.5:
-                summary_of_actions += "CHIP: ALL STAR\n"
-                chip_used[new_gd] = " - ALL STAR"
-
-            summary_of_actions += f"xPTS: {round(gd_xp[d].get_value(), 1)}, ITB: {in_the_bank[d].get_value()}\n"
-
-            for p in players:
-                if transfer_in[p, d].get_value() > 0.5:
-                    summary_of_actions += f"Buy {p} - {all_data['name'][p]}\n"
-                if transfer_out[p, d].get_value() > 0.5:
-                    summary_of_actions += f"Sell {p} - {all_data['name'][p]}\n"
-                if captain[p, d].get_value() > 0.5:
-                    summary_of_actions += f"Captain - {all_data['name'][p]}\n"
-                if squad_all_star[p, d].get_value() > 0.5:
-                    summary_of_actions += f"All-Star - {all_data['name'][p]}\n"
-
-        # Weekly summary
-        weekly_summary = ""
-        for w in gameweeks:
-            pen_tfs = sum(penalized_transfers[d].get_value() for d in gamedays if gameday_data.loc[d - 1, 'week'] == w)
-            weekly_summary += f"GW{w} - xP: {round(gw_xp[w].get_value(), 0)}, "
-            weekly_summary += f"TC: {transfer_count[w].get_value()}, PT: {pen_tfs}\n"
-
-        objective = -round(model.get_objective_value(), 2)
-        weekly_summary += f"Objective: {objective}\n"
-        weekly_summary += f"Total xPoints: {round(sum(gw_xp[w].get_value() for w in gameweeks), 0)}\n"
-
-        print(summary_of_actions)
-        print(weekly_summary)
-
-        results.append({
-            'iter': it + 1,
-            'picks': picks_df,
-            'objective': objective,
-            'chips_used': chip_used,
-            'summary': summary_of_actions,
-            'weekly_summary': weekly_summary,
-            'total_xp': total_xp,
-        })
-
-        # Add cut-off constraint for alternative solutions
-        if it < number_solutions - 1:
-            if alternative_solution == '1gd_buy':
-                actions = so.expr_sum(
-                    transfer_in[p, next_gd] for p in players
-                    if transfer_in[p, next_gd].get_value() > 0.5
-                )
-                gd_range = [next_gd]
-            elif alternative_solution == '1week_buy':
-                gw_range = [gameweeks[0]]
-                actions = (
-                    so.expr_sum(transfer_in[p, d] for p in players for d in gamedays
-                                if transfer_in[p, d].get_value() > 0.5 and gameday_data.loc[d - 1, 'week'] == gw_range)
-                    + so.expr_sum(transfer_out[p, d] for p in players for d in gamedays
-                                  if transfer_out[p, d].get_value() > 0.5 and gameday_data.loc[d - 1, 'week'] == gw_range)
-                )
-            elif alternative_solution == '2week_buy':
-                gw_range = [gameweeks[1]]
-                actions = (
-                    so.expr_sum(transfer_in[p, d] for p in players for d in gamedays
-                                if transfer_in[p, d].get_value() > 0.5 and gameday_data.loc[d + 1, 'week'] == gw_range)
-                    + so.expr_sum(transfer_out[p, d] for p in players for d in gamedays
-                                  if transfer_out[p, d].get_value() > 0.5 and gameday_data.loc[d + 1, 'week'] == gw_range)
-                )
-
-            if actions.get_value() != 0:
-                model.add_constraint(actions <= actions.get_value() - 1, name=f'cutoff_{it}')
-            elif alternative_solution in ('1week_buy', '2week_buy'):
-                model.add_constraint(so.expr_sum(transfer_count[w] for w in gw_range) >= 1, name=f'cutoff_{it}')
+        rolling_window = options.get('rolling_window', 0)
+        rolling_horizon = None
+        if rolling_window and rolling_window < len(gamedays):
+            if incremental_highs is None:
+                raise ValueError("rolling_window needs solver 'highs_inprocess'.")
+            rolling_horizon = RollingHorizon(incremental_highs, gamedays, rolling_window, options.get('rolling_step'))
+
+        lazy_rows = None
+        if options.get('lazy_rows', False):
+            if incremental_highs is None or rolling_horizon is not None:
+                # Other solvers read the whole model from a file, and a rolling
+                # horizon would have to roll again for every row added back
+                print("lazy_rows needs a full-horizon solve with solver 'highs_inprocess'; building every row.")
             else:
-                model.add_constraint(so.expr_sum(number_of_transfers_day[d] for d in gd_range) >= 1, name=f'cutoff_{it}')
-
+                lazy_rows = LazyRows(model)
+
+        # Model, option and solution files live in a per-run scratch directory
+        # that is removed (or kept, with keep_artifacts) when the loop ends
+        with SolverWorkspace(problem_name, options) as workspace:
+            location_problem = workspace.problem_path
+            location_solution = workspace.path('sp.txt')
+            opt_file_name = workspace.path('opt.txt')
+            location_improving = workspace.path('improving.txt')
+
+            for it in range(number_solutions):
+                if is_cancelled(cancel_token):
+                    _stop_cancelled(results)
+                    break
+                print(f'Solving iteration {it + 1}/{number_solutions}')
+                if solver not in ('highs_inprocess', 'heuristic'):
+                    profiler.start('export_mps')
+                    _export_mps(model, location_problem)
+
+                profiler.start('solve')
+                t0 = time.time()
+                # Per-window timings, filled in by rolling-horizon solves only
+                windows = []
+                # Values read from a solution file into a sasoptpy model
+                solution_values = None
+
+                if solver == 'cbc':
+                    cbc_path = options.get('cbc_path')
+                    if it == 0 and start is not None:
+                        write_cbc_start(location_solution, model, start)
+                    elif it == 0:
+                        # Initial solve for starting point; later iterations start from
+                        # the previous plan's solution file instead
+                        _run_solver_process(
+                            [cbc_path, location_problem, 'ratio', '1', 'cost', 'column', 'solve', 'solu', location_solution],
+                            'cbc', progress_callback, cancel_token=cancel_token,
+                        )
+
+                    # Full solve with time limit
+                    if not is_cancelled(cancel_token):
+                        _run_solver_process(
+                            [cbc_path, location_problem, 'mips', location_solution, 'sec', str(solve_time),
+                             'cost', 'column', 'solve', 'solu', location_solution],
+                            'cbc', progress_callback, cancel_token=cancel_token,
+                        )
+
+                    # An interrupted CBC still writes its incumbent; an older file belongs to the previous plan
+                    if is_cancelled(cancel_token) and not has_fresh_file(location_solution, t0):
+                        _stop_cancelled(results)
+                        break
+                    profiler.start('parse')
+                    solution_values = _read_solution(model, location_solution, 'cbc', column_order)
+
+                elif solver == 'highs':
+                    highs_path = options.get('highs_path')
+                    secs = options.get('solve_time', 20 * 60)
+                    presolve = options.get('presolve', 'on')
+                    gap = options.get('gap', 0)
+                    random_seed = options.get('random_seed', 0)
+
+                    with open(opt_file_name, 'w') as f:
+                        f.write(f'mip_rel_gap = {gap}\n')
+                        # Keeps the incumbent on disk in case the solve is cancelled
+                        f.write(f'mip_improving_solution_file = {location_improving}\n')
+                        f.write(f"log_file = {workspace.path('HiGHS.log')}\n")
+                    if os.path.exists(location_improving):
+                        os.remove(location_improving)
+
+                    command = [
+                        highs_path, '--parallel', 'on', '--options_file', opt_file_name,
+                        '--random_seed', str(random_seed), '--presolve', presolve,
+                        '--model_file', location_problem, '--time_limit', str(secs),
+                        '--solution_file', location_solution,
+                    ]
+                    # Only the first solve gets a start: the previous plan breaks
+                    # the cutoff that later iterations add
+                    if it == 0 and start is not None:
+                        write_highs_start(workspace.path('start.txt'), model, start)
+                        command += ['--read_solution_file', workspace.path('start.txt')]
+
+                    _run_solver_process(command, 'highs', progress_callback, cancel_token=cancel_token)
+
+                    if is_cancelled(cancel_token) and not has_fresh_file(location_solution, t0):
+                        if not write_last_improving_solution(location_improving, location_solution):
+                            _stop_cancelled(results)
+                            break
+                    profiler.start('parse')
+                    solution_values = _read_solution(model, location_solution, 'highs', column_order)
+
+                elif rolling_horizon is not None:
+                    solved, timings = rolling_horizon.solve(model)
+                    if not solved:
+                        if is_cancelled(cancel_token):
+                            _stop_cancelled(results)
+                            break
+                        raise RuntimeError("A rolling-horizon window has no feasible solution.")
+                    windows = [
+                        {
+                            'window': w.window,
+                            'first_gameday': gameday_codes[w.first_gameday],
+                            'last_gameday': gameday_codes[w.last_gameday],
+                            'fixed_through': None if w.fixed_through is None else gameday_codes[w.fixed_through],
+                            'seconds': round(w.seconds, 2),
+                        }
+                        for w in timings
+                    ]
+
+                elif solver == 'highs_inprocess':
+                    if lazy_rows is not None:
+                        solved = lazy_rows.solve(incremental_highs, start, cancel_token)
+                        print(lazy_rows.summary())
+                    else:
+                        solved = incremental_highs.solve(model, start)
+                    if not solved:
+                        if is_cancelled(cancel_token):
+                            _stop_cancelled(results)
+                            break
+                        # The model holds no solution, so reading it back would give an empty plan
+                        raise RuntimeError("HiGHS found no feasible solution.")
+
+                elif solver == 'heuristic':
+                    solve_heuristic(h, data)
+
+                elif solver == 'portfolio':
+                    starts = None
+                    if it == 0 and start is not None:
+                        starts = {'cbc': workspace.path('start_cbc.txt'), 'highs': workspace.path('start_highs.txt')}
+                        write_cbc_start(starts['cbc'], model, start)
+                        write_highs_start(starts['highs'], model, start)
+                    winner = race(build_portfolio(options, location_problem, workspace.path(f'it{it}'), starts),
+                                  progress_callback, cancel_token)
+                    if winner is None and is_cancelled(cancel_token):
+                        _stop_cancelled(results)
+                        break
+                    if winner is None:
+                        raise RuntimeError("No solver in the portfolio produced a solution.")
+                    profiler.start('parse')
+                    solution_values = _read_solution(model, winner.solution_path, winner.solver, column_order)
+
+                else:
+                    raise ValueError(f"Unknown solver '{solver}'. Use 'cbc', 'highs', 'highs_inprocess', 'portfolio' or 'heuristic'.")
+
+                t1 = time.time()
+                print(f"\n{round(t1 - t0, 1)} seconds passed")
+
+                # ===== RESULTS =====
+                profiler.start('extract')
+                plan = PlanArrays.read(h, data, column_order, solution_values)
+                picks_df = picks_frame(plan, data, gameday_codes)
+                total_xp = plan.total_xp()
+                summary_of_actions, chip_used = action_summary(plan, data, gameday_codes)
+                objective = -round(model.get_objective_value(), 2)
+                weekly_summary = build_weekly_summary(plan, data, objective)
+
+                print(summary_of_actions)
+                print(weekly_summary)
+
+                results.append({
+                    'iter': it + 1,
+                    'picks': picks_df,
+                    'objective': objective,
+                    'chips_used': chip_used,
+                    'summary': summary_of_actions,
+                    'weekly_summary': weekly_summary,
+                    'total_xp': total_xp,
+                    'windows': windows,
+                    'reductions': data.reductions,
+                    'lazy_rows': None if lazy_rows is None else lazy_rows.report(),
+                })
+
+                # Add cut-off constraint for alternative solutions
+                if it < number_solutions - 1:
+                    _add_alternative_cutoff(h, data, alternative_solution, it)
+    finally:
+        if template is not None:
+            model_templates.put(template)
+
+    if options.get('write_outputs', True):
         picks_df.to_csv('output/optimal_plan_decay.csv')
 
-    return {'picks': picks_df, 'results': results}
+    solution = {'picks': picks_df, 'results': results}
+    # A cancelled run holds only the plans found so far
+    if result_cache is not None and results and not is_cancelled(cancel_token):
+        profiler.start('cache')
+        result_cache.put(key, solution)
+    return _with_profile(solution, profiler, data, options, solver=solver, model_builder=model_builder,
+                         mip_start=start is not None, reused_model=reused_model)
@@ -0,0 +1,104 @@
+"""Synthetic league shared by the solver tests.
+
+The ``league`` fixture writes a league into ``tmp_path/data``, changes into
+``tmp_path`` and returns its projections, squad and sell prices. A module
+changes the league by overriding ``league_options`` with keyword arguments
+of :func:`write_league`, and a test by parametrizing it.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+
+BASE_OPTIONS = {
+    "horizon": 6, "tm": 0, "decay_base": 0.98, "bench_weight": 0.1, "ft_value": 1,
+    "ft_increment": 0.5, "wc_day": 0, "wc_days": [], "wc_range": [], "all_star_day": 0,
+    "all_star_days": [], "all_star_range": [], "solve_time": 60, "banned_players": [],
+    "forced_players": [], "no_sols": 1, "alternative_solution": "1week_buy",
+    "threshold_value": 0, "trf_last_gw": 2, "captain_played": False,
+    "cache": False, "write_outputs": False, "solver_output": False,
+}
+
+
+def write_league(
+    tmp_path: Path,
+    *,
+    seed=7,
+    players=24,
+    teams=6,
+    gamedays=6,
+    deadlines=None,
+    prices=(5, 15),
+    points=(0, 40),
+    position_block=1,
+    extra_players=(),
+    squad_ids=range(10),
+    sell_discount=0.0,
+):
+    """Write teams, gamedays and players to ``tmp_path/data`` and return the projections, squad and sell prices.
+
+    Gamedays come three to a gameweek. Player ``i`` plays for team ``i % teams``
+    and alternates position every ``position_block`` players; prices and
+    per-gameday points are drawn uniformly from ``prices`` and ``points``.
+    ``extra_players`` are appended as given, and the squad sells its players
+    ``sell_discount`` below their price.
+    """
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    rng = np.random.default_rng(seed)
+
+    team_codes = [f"T{i}" for i in range(teams)]
+    pd.DataFrame({"Id": range(1, teams + 1), "Team": team_codes, "Code": team_codes}).to_csv(
+        data_dir / "teams.csv", index=False
+    )
+    deadlines = deadlines or ["2025-01-01T00:00:00Z"] * gamedays
+    pd.DataFrame(
+        [
+            {"id": i + 1, "code": float(f"{i // 3 + 1}.{i % 3 + 1}"), "week": i // 3 + 1, "deadline": deadlines[i]}
+            for i in range(gamedays)
+        ]
+    ).to_csv(data_dir / "fixture_info.csv", index=False)
+
+    rows = []
+    for i in range(players):
+        row = {
+            "id": i + 1,
+            "name": f"Player {i}",
+            "team": team_codes[i % teams],
+            "price": round(float(rng.uniform(*prices)), 1),
+            "position": "FRONT" if i // position_block % 2 else "BACK",
+        }
+        row.update({str(d): round(float(rng.uniform(*points)), 1) for d in range(1, gamedays + 1)})
+        rows.append(row)
+    projections = pd.DataFrame([*rows, *extra_players])
+    projections[["id", "name", "team", "price", "position"]].to_csv(data_dir / "players.csv", index=False)
+
+    squad_ids = list(squad_ids)
+    squad = [f"Player {i}" for i in squad_ids]
+    sell_prices = (projections.loc[squad_ids, "price"] - sell_discount).tolist()
+    return projections, squad, sell_prices
+
+
+@pytest.fixture
+def league_options():
+    """Keyword arguments of :func:`write_league`."""
+    return {}
+
+
+@pytest.fixture
+def league(tmp_path, monkeypatch, league_options):
+    projections, squad, sell_prices = write_league(tmp_path, **league_options)
+    monkeypatch.chdir(tmp_path)
+    return projections, squad, sell_prices
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.cancellation import CancellationToken, SolveCancelled, write_last_improving_solution  # noqa: E402
+from engine.portfolio import read_solution_status  # noqa: E402
+
+
+def test_last_complete_improving_block_becomes_solution_file(tmp_path):
+    improving = tmp_path / "improving.txt"
+    improving.write_text(
+        "Objective -10\n# Columns 2\nx 1\ny 0\n"
+        "Objective -12\n# Columns 2\nx 0\ny 1\n"
+        "Objective -13\n# Columns 2\nx 1\n"  # cut short when the solver was killed
+    )
+    solution = tmp_path / "sp.txt"
+
+    assert write_last_improving_solution(improving, solution)
+    assert read_solution_status(solution, "highs") == ("interrupted by user", pytest.approx(-12))
+    assert "x 0\ny 1\n# Rows" in solution.read_text()
+    assert not write_last_improving_solution(tmp_path / "missing.txt", solution)
+
+
+def test_cancelled_solve_without_a_plan_raises(league):
+    pytest.importorskip("highspy")
+    from solve import solve_multi_period_NBA
+
+    projections, squad, sell_prices = league
+    token = CancellationToken()
+    token.cancel()
+
+    with pytest.raises(SolveCancelled):
+        solve_multi_period_NBA(
+            projections, squad, sell_prices, 1.1, 5.0, {**BASE_OPTIONS, "solver": "highs_inprocess"},
+            cancel_token=token,
+        )
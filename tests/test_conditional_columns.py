@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.highs_backend import solve_highs_inprocess  # noqa: E402
+from engine.matrix_model import build_matrix_model  # noqa: E402
+from engine.solution import PlanArrays  # noqa: E402
+from solve import prepare_model_data  # noqa: E402
+
+pytest.importorskip("highspy")
+
+
+OPTIONS = {**BASE_OPTIONS, "horizon": 4, "ft_value": 10, "ft_increment": 2.5}
+
+
+def test_chip_and_captain_columns_exist_only_where_they_can_be_used(league):
+    projections, squad, sell_prices = league
+    options = {**OPTIONS, "captain_played": True, "all_star_day": 2.2}
+    data = prepare_model_data(projections, squad, sell_prices, 1.2, 5.0, options)
+    h = build_matrix_model(data)
+    as_day = data.all_star_allowed_days()
+
+    assert h.use_wc.size == 0 and h.use_all_star.index[0] == as_day
+    assert h.squad_all_star.shape == (len(data.players), 1)
+    assert all(data.week_of(d) != data.gameweek_start for d in h.captain.index[1])
+    group_sizes = {name: n for name, n, _ in h.model._row_groups}
+    assert "initial_captain" not in group_sizes and "no_wc" not in group_sizes
+    assert group_sizes["one_chip_per_gd"] == 1 and group_sizes["all_star_logic"] == len(data.players)
+
+    solve_highs_inprocess(h.model, {"gap": 0, "solver_output": False})
+    plan = PlanArrays.read(h, data)
+    assert plan.captain.shape == (len(data.players), len(data.gamedays))
+    assert not plan.use_wc.any()
+    assert not plan.captain[:, [data.week_of(d) == data.gameweek_start for d in data.gamedays]].any()
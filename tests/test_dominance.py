@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.dominance import _dominance_matrix, blocking_capacity  # noqa: E402
+from solve import prepare_model_data, solve_multi_period_NBA  # noqa: E402
+
+
+OPTIONS = {**BASE_OPTIONS, "horizon": 5, "ft_value": 10, "ft_increment": 2.5, "dominance_filter": True}
+# Expensive and weak: every other BACK, two on each of the 20 teams, beats them on price and points
+WEAK_PLAYERS = [
+    {"id": i + 1, "name": f"Player {i}", "team": team, "price": 14.0, "position": "BACK",
+     **{str(d): 1.0 for d in range(1, 7)}}
+    for i, team in ((80, "T0"), (82, "T0"), (84, "T1"))
+]
+
+
+@pytest.fixture
+def league_options():
+    return {
+        "seed": 3, "players": 80, "teams": 20, "gamedays": 6, "prices": (6, 12), "points": (15, 40),
+        "position_block": 20, "extra_players": WEAK_PLAYERS, "squad_ids": [0, 1, 2, 3, 4, 20, 21, 22, 23, 24],
+    }
+
+
+def test_identical_players_do_not_dominate_each_other_both_ways():
+    points = np.array([[10.0, 10.0], [10.0, 10.0], [12.0, 9.0]])
+    dominates = _dominance_matrix(points, np.array([8.0, 8.0, 7.0]))
+
+    assert dominates[0, 1] and not dominates[1, 0]
+    assert not dominates[2].any() and not dominates[:, 2].any()
+
+
+def test_blocking_capacity_grows_with_the_horizon():
+    # One squad: four other same-position players plus two teams filled to the limit
+    assert blocking_capacity() == 6
+    # Every later gameday can bring in nine new players, each blocking one more team
+    assert [blocking_capacity(days) for days in (2, 3)] == [15, 24]
+
+
+@pytest.mark.parametrize("horizon", [1, 5])
+def test_dominance_filter_keeps_the_optimum(league, horizon):
+    projections, squad, sell_prices = league
+    options = {**OPTIONS, "horizon": horizon, "solver": "highs_inprocess", "banned_players": ["Player 41", "Player 82"]}
+
+    data = prepare_model_data(projections, squad, sell_prices, 1.1, 5.0, options)
+    names = set(data.all_data["name"])
+    # Both other T0 backs dominate Player 80, so a plan buying it can always take the one not in its squad
+    assert "Player 80" not in names and "Player 82" in names
+    # With Player 41 banned only one T1 back dominates Player 84, which leaves the 20 dominating
+    # teams: more than one gameday's squad can block, fewer than five gamedays' squads
+    assert ("Player 84" not in names) == (horizon == 1)
+    report = data.reductions["dominance"]
+    assert report["by_position"]["BACK"]["after"] < report["by_position"]["BACK"]["before"]
+
+    filtered = solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, options)["results"][0]
+    full = solve_multi_period_NBA(
+        projections, squad, sell_prices, 1.1, 5.0, {**options, "dominance_filter": False}
+    )["results"][0]
+    assert filtered["objective"] == pytest.approx(full["objective"], abs=1e-4)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.heuristic import lineup_points, solve_heuristic  # noqa: E402
+from engine.matrix_model import build_matrix_model  # noqa: E402
+from solve import prepare_model_data, solve_multi_period_NBA  # noqa: E402
+
+
+@pytest.fixture
+def league_options():
+    return {"seed": 11, "players": 40, "teams": 8}
+
+
+def test_lineup_points_takes_two_per_position_and_the_best_third():
+    points = np.array([[9.0], [1.0], [2.0], [8.0], [7.0], [6.0]])
+    position = np.array([0, 0, 0, 1, 1, 1])
+
+    # Top two of each type (9 + 2, 8 + 7) plus the better third (6 over 1)
+    assert lineup_points(points, position, 2)[0] == pytest.approx(32.0)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"tm": 2, "captain_played": True},
+        {"banned_players": ["Player 4"], "forced_players": ["Player 15"]},
+        {"wc_day": 1.3, "all_star_day": 2.2, "trf_last_gw": 0},
+    ],
+)
+def test_heuristic_plan_satisfies_every_model_row(league, overrides):
+    projections, squad, sell_prices = league
+    data = prepare_model_data(projections, squad, sell_prices, 1.1, 5.0, {**BASE_OPTIONS, **overrides})
+    h = build_matrix_model(data)
+
+    values = solve_heuristic(h, data)
+
+    assert h.model.max_violation(values) <= 1e-6
+    assert np.array_equal(h.model.solution, values)
+
+
+def test_heuristic_improves_on_keeping_the_squad(league):
+    projections, squad, sell_prices = league
+    data = prepare_model_data(projections, squad, sell_prices, 1.1, 5.0, BASE_OPTIONS)
+    h = build_matrix_model(data)
+    solve_heuristic(h, data)
+    heuristic = h.model.get_objective_value()
+
+    # The same plan with the transfers undone: the initial squad all horizon
+    no_transfers = {**BASE_OPTIONS, "banned_players": [p for p in projections["name"] if p not in squad]}
+    data = prepare_model_data(projections, squad, sell_prices, 1.1, 5.0, no_transfers)
+    h = build_matrix_model(data)
+    solve_heuristic(h, data)
+
+    assert heuristic < h.model.get_objective_value()
+
+
+def test_heuristic_solver_returns_standard_results_quickly(league):
+    projections, squad, sell_prices = league
+
+    start = time.perf_counter()
+    solution = solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0,
+                                      {**BASE_OPTIONS, "solver": "heuristic", "no_sols": 2})
+    assert time.perf_counter() - start < 1.0
+
+    result, = solution["results"]
+    assert set(result) >= {"picks", "objective", "chips_used", "summary", "weekly_summary", "total_xp"}
+    assert result["chips_used"] == {}
+    # Picks list the players sold on a gameday next to the squad
+    owned = result["picks"][result["picks"]["transfer_out"] == 0]
+    assert (owned.groupby("gameday").size() == 10).all()
+    assert (owned.groupby("gameday")["lineup"].sum() == 5).all()
+    assert "solve" in {phase["name"] for phase in solution["profile"]["phases"]}
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.lazy_rows import LAZY_FAMILIES, LazyRows  # noqa: E402
+from engine.matrix_model import build_matrix_model  # noqa: E402
+from solve import prepare_model_data, solve_multi_period_NBA  # noqa: E402
+
+pytest.importorskip("highspy")
+
+
+OPTIONS = {**BASE_OPTIONS, "tm": 1, "all_star_day": 2.2, "no_sols": 2, "solver": "highs_inprocess"}
+
+
+@pytest.fixture
+def league_options():
+    # Selling below the buy price makes re-selling an initial player tempting
+    return {"seed": 5, "players": 36, "sell_discount": 1.0}
+
+
+def test_taken_rows_added_back_rebuild_the_model(league):
+    projections, squad, sell_prices = league
+    data = prepare_model_data(projections, squad, sell_prices, 1.1, 5.0, OPTIONS)
+    full = build_matrix_model(data).model
+    model = build_matrix_model(data).model
+
+    lazy = LazyRows(model)
+    assert set(lazy.families) == set(LAZY_FAMILIES)
+    assert model.num_rows == full.num_rows - sum(len(f.lower) for f in lazy.families.values())
+    for family in lazy.families.values():
+        model.add_row_subset(family, np.arange(len(family.lower)))
+
+    def rows_by_name(m):
+        matrix = m.matrix.toarray()
+        return {name: (tuple(matrix[i]), m.row_lower[i], m.row_upper[i]) for i, name in enumerate(m.row_names())}
+
+    assert rows_by_name(model) == rows_by_name(full)
+
+
+def test_lazy_solve_keeps_the_full_model_plans(league):
+    projections, squad, sell_prices = league
+
+    full = solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, OPTIONS)["results"]
+    lazy = solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, {**OPTIONS, "lazy_rows": True})["results"]
+
+    assert [r["objective"] for r in lazy] == pytest.approx([r["objective"] for r in full], abs=1e-4)
+    assert full[0]["lazy_rows"] is None
+    report = lazy[-1]["lazy_rows"]
+    assert set(report["families"]) == set(LAZY_FAMILIES) and report["solves"] >= 1
+    assert all(0 <= f["added"] <= f["rows"] for f in report["families"].values())
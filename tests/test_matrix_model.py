@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.highs_backend import IncrementalHighs, solve_highs_inprocess  # noqa: E402
+from engine.matrix_model import build_matrix_model  # noqa: E402
+from solve import _add_alternative_cutoff, _build_sasoptpy_model, prepare_model_data, solve_multi_period_NBA  # noqa: E402
+
+highspy = pytest.importorskip("highspy")
+
+
+OPTIONS = {**BASE_OPTIONS, "horizon": 4, "ft_value": 10, "ft_increment": 2.5}
+
+
+def _solve_mps(path: Path) -> float:
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+    h.setOptionValue("mip_rel_gap", 0)
+    h.readModel(str(path))
+    h.run()
+    return h.getInfo().objective_function_value
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"tm": 2, "captain_played": True},
+        {"wc_days": [1.3, 2.1], "all_star_day": 2.2},
+        {"banned_players": ["Player 11"], "forced_players": ["Player 3"]},
+    ],
+)
+def test_matrix_builder_matches_sasoptpy_objective(league, tmp_path, overrides):
+    projections, squad, sell_prices = league
+
+    data = prepare_model_data(projections, squad, sell_prices, 1.2, 5.0, {**OPTIONS, **overrides})
+    _build_sasoptpy_model(data).model.export_mps(str(tmp_path / "sasoptpy.mps"))
+    build_matrix_model(data).model.export_mps(str(tmp_path / "matrix.mps"))
+
+    expected = _solve_mps(tmp_path / "sasoptpy.mps")
+    assert np.isfinite(expected)
+    assert _solve_mps(tmp_path / "matrix.mps") == pytest.approx(expected, abs=1e-4)
+
+
+def test_highs_inprocess_matches_mps_round_trip(league, tmp_path):
+    projections, squad, sell_prices = league
+
+    data = prepare_model_data(projections, squad, sell_prices, 1.2, 5.0, OPTIONS)
+    h = build_matrix_model(data)
+    h.model.export_mps(str(tmp_path / "matrix.mps"))
+    solve_highs_inprocess(h.model, {"gap": 0, "solver_output": False})
+
+    assert h.model.get_objective_value() == pytest.approx(_solve_mps(tmp_path / "matrix.mps"), abs=1e-4)
+    assert sum(h.squad[p, 2].get_value() for p in data.players) == 10
+
+
+def test_highs_inprocess_raises_instead_of_returning_an_empty_plan(league, tmp_path):
+    projections, squad, sell_prices = league
+    # Four players of one team break the limit of two per team
+    options = {
+        **OPTIONS, "solver": "highs_inprocess", "cache": True,
+        "forced_players": ["Player 0", "Player 6", "Player 12", "Player 18"], "cache_dir": str(tmp_path / "cache"),
+    }
+
+    with pytest.raises(RuntimeError, match="no feasible solution"):
+        solve_multi_period_NBA(projections, squad, sell_prices, 1.2, 5.0, options)
+    assert not list((tmp_path / "cache").glob("*.pkl"))
+
+
+def test_incremental_highs_matches_cold_resolves(league):
+    projections, squad, sell_prices = league
+    options = {**OPTIONS, "gap": 0}
+    data = prepare_model_data(projections, squad, sell_prices, 1.2, 5.0, options)
+
+    objectives = {}
+    for mode in ("cold", "incremental"):
+        h = build_matrix_model(data)
+        incremental = IncrementalHighs(options)
+        objectives[mode] = []
+        for it in range(3):
+            if mode == "cold":
+                solve_highs_inprocess(h.model, options)
+            else:
+                incremental.solve(h.model)
+            objectives[mode].append(h.model.get_objective_value())
+            _add_alternative_cutoff(h, data, "1gd_buy", it)
+
+    assert objectives["incremental"] == pytest.approx(objectives["cold"], abs=1e-4)
+    assert incremental.highs.getNumRow() == h.model.num_rows - 1
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.matrix_model import build_matrix_model  # noqa: E402
+from engine.mip_start import start_values, write_cbc_start, write_highs_start  # noqa: E402
+from engine.solution_reader import ColumnOrder, read_solution_values  # noqa: E402
+from solve import prepare_model_data, solve_multi_period_NBA  # noqa: E402
+
+highspy = pytest.importorskip("highspy")
+
+
+@pytest.fixture
+def league_options():
+    return {"seed": 11, "players": 40, "teams": 8}
+
+
+def _model(projections, squad, sell_prices, gd, options=BASE_OPTIONS):
+    data = prepare_model_data(projections, squad, sell_prices, gd, 5.0, options)
+    codes = dict(zip(data.gameday_data["id"].astype(int), data.gameday_data["code"].astype(float)))
+    return data, build_matrix_model(data), codes
+
+
+def test_replayed_optimal_plan_keeps_its_objective(league):
+    projections, squad, sell_prices = league
+    optimal = solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0,
+                                     {**BASE_OPTIONS, "solver": "highs_inprocess"})["results"][0]
+
+    data, h, codes = _model(projections, squad, sell_prices, 1.1)
+    values = start_values(h, data, optimal["picks"], codes)
+
+    assert values is not None
+    h.model.set_solution(values)
+    assert -h.model.get_objective_value() == pytest.approx(optimal["objective"], abs=0.01)
+
+
+def test_yesterdays_plan_starts_todays_solve(league, tmp_path, capsys):
+    projections, squad, sell_prices = league
+    options = {**BASE_OPTIONS, "solver": "highs_inprocess"}
+    yesterday = solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, options)["picks"]
+    yesterday.to_csv(tmp_path / "yesterday.csv")
+
+    # Today's horizon is one gameday shorter, as the fixture ends on gameday 6
+    options["horizon"] = 5
+    cold = solve_multi_period_NBA(projections, squad, sell_prices, 1.2, 5.0, options)
+    warm = solve_multi_period_NBA(projections, squad, sell_prices, 1.2, 5.0,
+                                  {**options, "mip_start": str(tmp_path / "yesterday.csv")})
+
+    assert "mip_start" in {phase["name"] for phase in warm["profile"]["phases"]}
+    assert "Ignoring the MIP start" not in capsys.readouterr().out
+    assert warm["results"][0]["objective"] == pytest.approx(cold["results"][0]["objective"], abs=1e-4)
+
+
+def test_start_files_are_read_back_by_cbc_and_highs_readers(league, tmp_path):
+    projections, squad, sell_prices = league
+    data, h, codes = _model(projections, squad, sell_prices, 1.1, {**BASE_OPTIONS, "tm": 1})
+    values = start_values(h, data, "heuristic", codes)
+    model = h.model
+
+    write_cbc_start(tmp_path / "start_cbc.txt", model, values)
+    assert np.allclose(read_solution_values(tmp_path / "start_cbc.txt", "cbc", ColumnOrder.of(model)), values)
+
+    model.export_mps(str(tmp_path / "model.mps"))
+    write_highs_start(tmp_path / "start_highs.txt", model, values)
+    highs = highspy.Highs()
+    highs.setOptionValue("output_flag", False)
+    highs.readModel(str(tmp_path / "model.mps"))
+    assert highs.readSolution(str(tmp_path / "start_highs.txt"), 0) == highspy.HighsStatus.kOk
+    assert np.allclose(highs.getSolution().col_value, values)
+
+
+@pytest.mark.skipif(shutil.which("cbc") is None, reason="cbc executable not found")
+def test_cbc_solve_from_a_heuristic_start_skips_the_warm_up_run(league, monkeypatch):
+    projections, squad, sell_prices = league
+    commands = []
+
+    import solve
+
+    run = solve._run_solver_process
+    monkeypatch.setattr(solve, "_run_solver_process", lambda command, *a, **k: commands.append(command) or run(command, *a, **k))
+    options = {**BASE_OPTIONS, "solver": "cbc", "cbc_path": shutil.which("cbc")}
+    result = solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, options, initial_plan="heuristic")
+
+    assert len(commands) == 1 and "mips" in commands[0]
+    assert result["profile"]["phases"] and result["results"][0]["objective"] > 0
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from solve import prepare_model_data  # noqa: E402
+
+
+def test_memberships_match_scans_of_the_frames(league):
+    projections, squad, sell_prices = league
+    # Starting on gameday 1.2 leaves a shorter first gameweek
+    data = prepare_model_data(projections, squad, sell_prices, 1.2, 5.0, {**BASE_OPTIONS, "horizon": 5})
+    index = data.index
+
+    for position, players in index.players_by_position.items():
+        assert players == [p for p in data.players if data.all_data.loc[p, "position"] == position]
+    for team, players in index.players_by_team.items():
+        assert players == [p for p in data.players if data.all_data.loc[p, "team"] == team]
+    assert sum(len(players) for players in index.players_by_team.values()) == len(data.players)
+    assert list(index.position_of_player) == data.all_data.loc[data.players, "position"].tolist()
+
+    weeks = [int(data.gameday_data.loc[d - 1, "week"]) for d in data.gamedays]
+    assert [index.week_of_day[d] for d in data.gamedays] == weeks
+    assert np.array_equal(index.week_array, weeks)
+    assert index.days_by_week == {1: [2, 3], 2: [4, 5, 6]}
+    assert index.first_days_of_week == {2, 4}
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.cancellation import CancellationToken, SolveCancelled  # noqa: E402
+from engine.model_template import ModelTemplates, structure_key  # noqa: E402
+import solve  # noqa: E402
+from solve import prepare_model_data, solve_multi_period_NBA  # noqa: E402
+
+highspy = pytest.importorskip("highspy")
+
+
+OPTIONS = {**BASE_OPTIONS, "no_sols": 2, "solver": "highs_inprocess"}
+
+
+@pytest.fixture
+def league_options():
+    return {"seed": 5, "players": 36}
+
+
+def test_structure_key_ignores_projections_and_itb(league):
+    projections, squad, sell_prices = league
+    key = structure_key(prepare_model_data(projections, squad, sell_prices, 1.1, 5.0, OPTIONS))
+
+    edited = projections.assign(**{"2": projections["2"] * 0.5})
+    assert structure_key(prepare_model_data(edited, squad, sell_prices, 1.1, 7.5, OPTIONS)) == key
+    other_squad = squad[:-1] + ["Player 11"]
+    sell = sell_prices[:-1] + [projections.loc[11, "price"]]
+    assert structure_key(prepare_model_data(projections, other_squad, sell, 1.1, 5.0, OPTIONS)) != key
+    assert structure_key(prepare_model_data(projections, squad, sell_prices, 1.1, 5.0, {**OPTIONS, "tm": 1})) != key
+
+
+def test_reused_model_solves_like_a_fresh_build(league, capsys):
+    projections, squad, sell_prices = league
+    store = ModelTemplates()
+
+    first = solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, OPTIONS, model_templates=store)
+    assert len(store) == 1 and first["results"][1]["objective"] <= first["results"][0]["objective"]
+
+    # Tweak minutes and the bank, then re-solve: the stored model is updated, not rebuilt
+    edited = projections.assign(**{str(d): projections[str(d)] * 1.2 for d in (1, 2)})
+    reused = solve_multi_period_NBA(edited, squad, sell_prices, 1.1, 8.0, OPTIONS, model_templates=store)
+    assert "Reusing the model" in capsys.readouterr().out
+    # Without a store every solve builds its own model
+    fresh = solve_multi_period_NBA(edited, squad, sell_prices, 1.1, 8.0, OPTIONS)
+    assert "Reusing the model" not in capsys.readouterr().out
+
+    assert len(store) == 1
+    assert [r["objective"] for r in reused["results"]] == pytest.approx([r["objective"] for r in fresh["results"]], abs=1e-4)
+    assert reused["profile"]["model"] == fresh["profile"]["model"]
+
+
+def test_model_is_handed_back_when_a_solve_fails(league, monkeypatch, capsys):
+    projections, squad, sell_prices = league
+    store = ModelTemplates()
+    token = CancellationToken()
+    token.cancel()
+
+    with pytest.raises(SolveCancelled):
+        solve_multi_period_NBA(
+            projections, squad, sell_prices, 1.1, 5.0, OPTIONS, cancel_token=token, model_templates=store,
+        )
+    assert len(store) == 1
+
+    # Fail on the second plan, after the first cutoff row was appended
+    action_summary = solve.action_summary
+    calls = []
+
+    def failing_summary(*args):
+        calls.append(args)
+        if len(calls) == 2:
+            raise RuntimeError("summary failed")
+        return action_summary(*args)
+
+    monkeypatch.setattr(solve, "action_summary", failing_summary)
+    with pytest.raises(RuntimeError, match="summary failed"):
+        solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, OPTIONS, model_templates=store)
+    assert len(store) == 1
+    monkeypatch.setattr(solve, "action_summary", action_summary)
+    capsys.readouterr()
+
+    reused = solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, OPTIONS, model_templates=store)
+    fresh = solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, OPTIONS)
+    assert "Reusing the model" in capsys.readouterr().out
+    assert [r["objective"] for r in reused["results"]] == pytest.approx([r["objective"] for r in fresh["results"]], abs=1e-4)
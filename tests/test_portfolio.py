@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from engine.portfolio import DEFAULT_PORTFOLIO, build_portfolio, read_solution_status  # noqa: E402
+
+
+def test_read_solution_status_cbc(tmp_path):
+    path = tmp_path / "sp.txt"
+    path.write_text("Stopped on time - objective value -384.91000000\n      0 squad[1,1] 1 0\n")
+
+    assert read_solution_status(path, "cbc") == ("stopped on time", pytest.approx(-384.91))
+
+    for header in ("Infeasible - objective value 12.50000000",
+                   "Stopped on time (no integer solution - continuous used) - objective value -400.00000000"):
+        path.write_text(f"{header}\n      0 squad[1,1] 0.5 0\n")
+        assert read_solution_status(path, "cbc")[1] is None
+
+
+def test_read_solution_status_highs(tmp_path):
+    path = tmp_path / "sp.txt"
+    path.write_text(
+        "Model status\nOptimal\n\n# Primal solution values\nFeasible\nObjective -384.91\n# Columns 1\nsquad[1,1] 1\n"
+    )
+
+    assert read_solution_status(path, "highs") == ("optimal", pytest.approx(-384.91))
+    assert read_solution_status(tmp_path / "missing.txt", "highs") == ("", None)
+
+    path.write_text("Model status\nInfeasible\n\n# Primal solution values\nInfeasible\nObjective 12.5\n# Columns 1\n")
+    assert read_solution_status(path, "highs") == ("infeasible", None)
+
+
+def test_build_portfolio_defaults_and_rejects_unknown_solver(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "solution_files").mkdir()
+    options = {"cbc_path": "cbc", "highs_path": "highs", "solve_time": 30, "gap": 0.01}
+
+    runs = build_portfolio(options, "solution_files/p.mps", "solution_files/p")
+    assert [run.solver for run in runs] == [config["solver"] for config in DEFAULT_PORTFOLIO]
+    assert len({run.solution_path for run in runs}) == len(runs)
+
+    with pytest.raises(ValueError):
+        build_portfolio({**options, "portfolio": [{"solver": "gurobi"}]}, "solution_files/p.mps", "solution_files/p")
+
+
+def test_build_portfolio_leaves_out_solvers_without_an_executable(monkeypatch, tmp_path, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "solution_files").mkdir()
+    options = {"cbc_path": None, "highs_path": "highs", "solve_time": 30, "gap": 0.01}
+
+    runs = build_portfolio(options, "solution_files/p.mps", "solution_files/p")
+
+    assert [run.solver for run in runs] == ["highs", "highs", "highs"]
+    assert all(run.command[0] == "highs" for run in runs)
+    assert "cbc_path is not set" in capsys.readouterr().out
+    with pytest.raises(ValueError, match="cbc_path or highs_path"):
+        build_portfolio({**options, "highs_path": None}, "solution_files/p.mps", "solution_files/p")
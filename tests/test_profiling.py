@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.matrix_model import build_matrix_model  # noqa: E402
+from engine.profiling import PhaseProfiler, current_rss_mb, peak_rss_mb  # noqa: E402
+from solve import prepare_model_data, solve_multi_period_NBA  # noqa: E402
+
+pytest.importorskip("highspy")
+
+
+OPTIONS = {**BASE_OPTIONS, "horizon": 4, "ft_value": 10, "ft_increment": 2.5}
+
+
+def test_phases_accumulate_and_count_objects_only_when_asked():
+    profiler = PhaseProfiler()
+    for _ in range(2):
+        profiler.start("solve")
+        profiler.start("extract")
+    profile = profiler.as_dict()
+
+    assert [(phase["name"], phase["calls"]) for phase in profile["phases"]] == [("solve", 2), ("extract", 2)]
+    assert all(phase["objects"] is None for phase in profile["phases"])
+    profiler = PhaseProfiler(count_objects=True)
+    profiler.start("solve")
+    assert profiler.as_dict()["phases"][0]["objects"] > 0
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="current RSS is read from /proc")
+def test_peak_growth_is_per_phase():
+    profiler = PhaseProfiler()
+    profiler.start("allocate")
+    # Enough to pass whatever peak earlier tests left behind
+    headroom = peak_rss_mb() - current_rss_mb()
+    block = bytearray(int((headroom + 64) * 1024 * 1024))
+    block[::4096] = b"\x01" * len(block[::4096])
+    profiler.start("idle")
+    del block
+    phases = {phase["name"]: phase for phase in profiler.as_dict()["phases"]}
+
+    assert phases["allocate"]["peak_growth_mb"] >= 60
+    assert phases["idle"]["peak_growth_mb"] == 0
+    assert phases["idle"]["rss_start_mb"] > phases["allocate"]["rss_start_mb"]
+
+
+def test_solve_profile_reports_phases_and_model_size(league, tmp_path):
+    projections, squad, sell_prices = league
+    options = {
+        **OPTIONS, "solver": "highs_inprocess", "no_sols": 2, "cache": True,
+        "profile_log": str(tmp_path / "profile.jsonl"), "profile_objects": True,
+    }
+
+    profile = solve_multi_period_NBA(projections, squad, sell_prices, 1.2, 5.0, options)["profile"]
+
+    phases = {phase["name"]: phase for phase in profile["phases"]}
+    assert {"read_data", "filter", "build", "solve", "extract", "cache"} <= set(phases)
+    assert phases["solve"]["calls"] == 2 and phases["solve"]["objects"] > 0
+    data = prepare_model_data(projections, squad, sell_prices, 1.2, 5.0, options)
+    h = build_matrix_model(data)
+    assert profile["model"] == {"rows": h.model.num_rows, "columns": h.model.num_cols,
+                                "nonzeros": h.model.matrix.nnz}
+
+    logged = pd.read_json(tmp_path / "profile.jsonl", lines=True)
+    assert logged.loc[0, "solver"] == "highs_inprocess" and logged.loc[0, "players"] == len(data.players)
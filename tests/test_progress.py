@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from engine.progress import LogProgressParser  # noqa: E402
+
+
+def test_highs_log_lines_become_events():
+    parser = LogProgressParser("highs")
+
+    assert parser.feed("Solving MIP model with:") is None
+    first = parser.feed("         0       0         0   0.00%   -7361.219971    inf                  inf        0      0      0         0     0.1s")
+    assert first.incumbent is None and first.gap is None and first.best_bound == pytest.approx(-7361.219971)
+
+    event = parser.feed(" L      12       3         4  25.00%   -414.7486344    -279.2591588      48.52%      239     21     92      1821     4.0s")
+    assert (event.nodes, event.elapsed) == (12, 4.0)
+    assert event.incumbent == pytest.approx(-279.2591588)
+    assert event.gap == pytest.approx(0.4852)
+
+
+def test_cbc_events_carry_bound_across_message_types():
+    parser = LogProgressParser("cbc")
+
+    start = parser.feed("Cbc0010I After 0 nodes, 1 on tree, 1e+50 best solution, best possible -390.2 (0.30 seconds)")
+    assert start.incumbent is None and start.best_bound == pytest.approx(-390.2)
+
+    found = parser.feed("Cbc0012I Integer solution of -384.91 found by DiveCoefficient after 123 iterations and 7 nodes (0.52 seconds)")
+    assert (found.nodes, found.elapsed) == (7, 0.52)
+    assert found.best_bound == pytest.approx(-390.2)
+    assert found.gap == pytest.approx(abs(-384.91 + 390.2) / 384.91)
+    assert start.incumbent is None
+
+
+def test_unknown_solver_is_rejected():
+    with pytest.raises(ValueError):
+        LogProgressParser("gurobi")
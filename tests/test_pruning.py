@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from solve import solve_multi_period_NBA  # noqa: E402
+
+pytest.importorskip("highspy")
+
+
+OPTIONS = {**BASE_OPTIONS, "horizon": 4, "ft_value": 10, "ft_increment": 2.5}
+
+
+def test_reduced_cost_pruning_keeps_the_unfiltered_optimum(league):
+    projections, squad, sell_prices = league
+    options = {**OPTIONS, "solver": "highs_inprocess", "gap": 0}
+
+    full = solve_multi_period_NBA(projections, squad, sell_prices, 1.2, 5.0, {**options, "threshold_value": -1})
+    pruned = solve_multi_period_NBA(
+        projections, squad, sell_prices, 1.2, 5.0,
+        {**options, "threshold_value": 2.5, "player_filter": "reduced_cost"},
+    )
+
+    report = pruned["results"][0]["reductions"]["reduced_cost"]
+    assert report["before"] == 24
+    assert report["after"] + report["pruned"] == 24
+    assert pruned["results"][0]["objective"] == pytest.approx(full["results"][0]["objective"], abs=1e-4)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.reference_data import ReferenceData  # noqa: E402
+from solve import prepare_model_data, solve_multi_period_NBA  # noqa: E402
+
+pytest.importorskip("highspy")
+
+
+OPTIONS = {**BASE_OPTIONS, "horizon": 4, "ft_value": 10, "ft_increment": 2.5}
+
+
+def test_reference_data_is_reused_without_reading_or_writing_files(league, monkeypatch, tmp_path):
+    projections, squad, sell_prices = league
+    reference = ReferenceData.load()
+    live_prices = reference.live_prices.assign(price=reference.live_prices["price"] + 0.5)
+    reference = ReferenceData(reference.teams, reference.gameday_data, live_prices)
+
+    def no_reads(*args, **kwargs):
+        raise AssertionError("reference data should not be read again")
+
+    monkeypatch.setattr(pd, "read_csv", no_reads)
+    options = {**OPTIONS, "solver": "highs_inprocess", "write_outputs": False}
+    for _ in range(2):
+        data = prepare_model_data(projections, squad, sell_prices, 1.2, 5.0, options, reference_data=reference)
+        solve_multi_period_NBA(projections, squad, sell_prices, 1.2, 5.0, {**options, "cache": False},
+                               reference_data=reference)
+
+    assert data.all_data["price"].tolist() == (projections["price"] + 0.5).tolist()
+    assert not (tmp_path / "output").exists()
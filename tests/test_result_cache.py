@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+import solve  # noqa: E402
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.result_cache import ResultCache  # noqa: E402
+
+pytest.importorskip("highspy")
+
+
+OPTIONS = {
+    **BASE_OPTIONS, "horizon": 3, "ft_value": 10, "ft_increment": 2.5, "solver": "highs_inprocess",
+    "cache": True, "write_outputs": True,
+}
+
+
+@pytest.fixture
+def league_options():
+    return {"seed": 11, "players": 20, "gamedays": 3}
+
+
+def test_repeat_solve_is_served_from_cache(league, monkeypatch, tmp_path):
+    projections, squad, sell_prices = league
+
+    first = solve.solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, OPTIONS)
+    assert len(list((tmp_path / "cache" / "solves").glob("*.pkl"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache hit should not build a model")
+
+    def no_filtering(*args, **kwargs):
+        raise AssertionError("cache hit should not filter or prune players")
+
+    monkeypatch.setattr(solve, "build_matrix_model", fail)
+    real_prepare = solve.prepare_model_data
+    monkeypatch.setattr(solve, "prepare_model_data", no_filtering)
+    # Options that only change how the solve is run or reported keep the key
+    for overrides in ({}, {"profile_log": str(tmp_path / "profile.jsonl"), "write_outputs": False,
+                           "keep_artifacts": True, "mps_compression": True}):
+        second = solve.solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, {**OPTIONS, **overrides})
+        assert second["results"][0]["objective"] == first["results"][0]["objective"]
+        pd.testing.assert_frame_equal(second["picks"], first["picks"])
+    monkeypatch.setattr(solve, "prepare_model_data", real_prepare)
+
+    with pytest.raises(AssertionError, match="cache hit"):
+        solve.solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, {**OPTIONS, "cache": False})
+    with pytest.raises(AssertionError, match="cache hit"):
+        solve.solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 4.0, OPTIONS)
+
+
+def test_infeasible_solve_is_not_cached(league, tmp_path):
+    cbc_path = shutil.which("cbc")
+    if cbc_path is None:
+        pytest.skip("cbc executable not found")
+    projections, squad, sell_prices = league
+    # Four players of one team break the limit of two per team
+    options = {**OPTIONS, "solver": "cbc", "cbc_path": cbc_path, "model_builder": "matrix",
+               "forced_players": ["Player 0", "Player 6", "Player 12", "Player 18"]}
+
+    with pytest.raises(RuntimeError, match="no feasible solution"):
+        solve.solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, options)
+    assert not list((tmp_path / "cache" / "solves").glob("*.pkl"))
+
+
+def test_cache_is_off_by_default_and_skipped_for_warm_starts(league, tmp_path):
+    projections, squad, sell_prices = league
+    solves = tmp_path / "cache" / "solves"
+
+    defaults = {k: v for k, v in OPTIONS.items() if k != "cache"}
+    solve.solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, defaults)
+    assert not solves.exists()
+
+    first = solve.solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, OPTIONS)
+    solve.solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, OPTIONS, initial_plan=first["picks"])
+    solve.solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, {**OPTIONS, "mip_start": "heuristic"})
+    assert len(list(solves.glob("*.pkl"))) == 1
+
+
+def test_eviction_drops_expired_then_oldest_entries(tmp_path):
+    cache = ResultCache(tmp_path, max_mb=0.25, max_age_days=1)
+    blob = b"x" * 100_000
+    for i, age in enumerate((3 * 86400, 300, 200, 100)):
+        cache.put(f"k{i}", blob)
+        stamp = time.time() - age
+        os.utime(tmp_path / f"k{i}.pkl", (stamp, stamp))
+
+    cache.evict()
+
+    assert sorted(p.stem for p in tmp_path.glob("*.pkl")) == ["k2", "k3"]
+    assert cache.get("k0") is None
+    assert cache.get("k3") == blob
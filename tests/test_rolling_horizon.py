@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from solve import solve_multi_period_NBA  # noqa: E402
+
+pytest.importorskip("highspy")
+
+
+def test_rolling_horizon_stitches_a_full_plan(league):
+    projections, squad, sell_prices = league
+    options = {**BASE_OPTIONS, "tm": 2, "solver": "highs_inprocess"}
+
+    full = solve_multi_period_NBA(projections, squad, sell_prices, 1.1, 5.0, options)["results"][0]
+    rolled = solve_multi_period_NBA(
+        projections, squad, sell_prices, 1.1, 5.0, {**options, "rolling_window": 3, "rolling_step": 2}
+    )["results"][0]
+
+    assert [w["first_gameday"] for w in rolled["windows"]] == [1.1, 1.3, 2.2]
+    assert rolled["windows"][-1]["fixed_through"] is None
+    assert rolled["picks"]["gameday"].nunique() == 6
+    assert rolled["objective"] <= full["objective"] + 1e-6
+    assert full["windows"] == []
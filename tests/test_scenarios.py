@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.reference_data import ReferenceData  # noqa: E402
+from scenarios import Scenario, fixture_scenarios, run_scenarios, scenario_projections  # noqa: E402
+from solve import solve_multi_period_NBA  # noqa: E402
+
+pytest.importorskip("highspy")
+
+
+OPTIONS = {**BASE_OPTIONS, "tm": 1, "solver": "highs_inprocess"}
+DAYS = [str(d) for d in range(1, 7)]
+# Gamedays 1-3 fall on consecutive dates, so 1-2 and 2-3 are back-to-backs
+DEADLINES = ["2025-01-01", "2025-01-02", "2025-01-03", "2025-01-05", "2025-01-07", "2025-01-09"]
+
+
+@pytest.fixture
+def league_options():
+    return {"seed": 11, "players": 36, "deadlines": DEADLINES}
+
+
+def _minutes_and_rates(projections: pd.DataFrame, seed=11):
+    """xMins and per-36 rates of the league's players under a base schedule."""
+    rng = np.random.default_rng(seed)
+    players = projections[["id", "name", "team", "price", "position"]]
+    # Base schedule: even teams play odd gamedays, odd teams even gamedays
+    team = players["team"].str[1:].astype(int).to_numpy()
+    plays = ((team[:, None] + np.arange(len(DAYS))) % 2 == 0).astype(float)
+    minutes = rng.integers(10, 36, len(players)).astype(float)
+
+    xmins = pd.concat(
+        [players.assign(MIN=minutes), pd.DataFrame(plays * minutes[:, None], columns=DAYS)], axis=1
+    )
+    rates = pd.concat(
+        [players, pd.DataFrame(np.round(plays * rng.uniform(20, 60, plays.shape), 2), columns=DAYS)], axis=1
+    )
+    return xmins, rates
+
+
+def _ticker(plays: dict) -> pd.DataFrame:
+    return pd.DataFrame(
+        [{"team": team, **{d: ("OPP" if d in days else None) for d in DAYS}} for team, days in plays.items()]
+    )
+
+
+def test_projections_follow_the_fixture_ticker(league):
+    projections, _, _ = league
+    xmins, projections36 = _minutes_and_rates(projections)
+    gameday_data = ReferenceData.load().gameday_data
+
+    base = scenario_projections(xmins, projections36, gameday_data)
+    expected = np.round(projections36[DAYS].to_numpy() * xmins[DAYS].to_numpy() / 36, 1)
+    assert np.allclose(base[DAYS].to_numpy(), expected)
+
+    # T0 plays gamedays 1-3 back to back and 5; T1 no longer plays at all
+    ticker = _ticker({"T0": {"1", "2", "3", "5"}, **{f"T{t}": {"4", "6"} for t in range(2, 6)}})
+    projections = scenario_projections(xmins, projections36, gameday_data, ticker, b2b_decay=(0.9, 0.8))
+
+    player = xmins.iloc[0]
+    rates = projections36.iloc[0][DAYS].to_numpy(dtype=float)
+    # Gameday 2 closes the 1-2 back-to-back and opens 2-3, so both factors apply
+    minutes = np.round(player["MIN"] * np.array([0.9, 0.8 * 0.9, 0.8, 0, 1, 0]), 2)
+    # Days the base schedule gives no rate stay at zero, as in the xMins editor
+    assert projections.iloc[0][DAYS].to_numpy(dtype=float) == pytest.approx(np.round(rates * minutes / 36, 1))
+    assert (projections.iloc[0][DAYS].to_numpy(dtype=float)[rates == 0] == 0).all()
+    assert (projections.loc[projections["team"] == "T1", DAYS].to_numpy() == 0).all()
+    assert (projections.loc[projections["team"] == "T2", ["1", "2", "3", "5"]].to_numpy() == 0).all()
+
+
+def test_scenarios_are_solved_in_parallel_into_one_table(league, tmp_path):
+    projections, squad, sell_prices = league
+    xmins, projections36 = _minutes_and_rates(projections)
+    fixtures_dir = tmp_path / "data" / "custom_fixtures"
+    fixtures_dir.mkdir()
+    for n in (10, 2):
+        _ticker({f"T{t}": set(DAYS[(t + n) % 3::2]) for t in range(6)}).to_csv(
+            fixtures_dir / f"fixture_ticker ({n}).csv", index=False
+        )
+    scenarios = [Scenario("base"), *fixture_scenarios(str(fixtures_dir))]
+    assert [s.name for s in scenarios] == ["base", "fixture_ticker (2)", "fixture_ticker (10)"]
+
+    table = run_scenarios(
+        scenarios, squad, sell_prices, 1.1, 5.0, OPTIONS, xmins=xmins, projections36=projections36,
+        max_workers=2,
+    )
+
+    assert table["scenario"].tolist() == ["base", "fixture_ticker (2)", "fixture_ticker (10)"]
+    assert table["error"].isna().all()
+    assert table["vs_best"].max() == 0 and (table["vs_best"] <= 0).all()
+    base = solve_multi_period_NBA(
+        scenario_projections(xmins, projections36, ReferenceData.load().gameday_data),
+        squad, sell_prices, 1.1, 5.0, OPTIONS,
+    )["results"][0]
+    assert table.loc[0, "objective"] == pytest.approx(base["objective"], abs=0.01)
+    assert table.loc[0, "transfers"] == base["picks"]["transfer_in"].sum()
+    # One captain per gameweek
+    assert table.loc[0, "captains"].count(";") == 1
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from sensitivity import candidate_pool, parameter_grid, random_settings, run_sweep  # noqa: E402
+from solve import solve_multi_period_NBA  # noqa: E402
+
+pytest.importorskip("highspy")
+
+
+OPTIONS = {**BASE_OPTIONS, "tm": 1, "solver": "highs_inprocess"}
+
+
+@pytest.fixture
+def league_options():
+    return {"seed": 3, "players": 36}
+
+
+def test_settings_come_from_a_grid_or_a_random_sample():
+    grid = parameter_grid({"decay_base": [0.9, 0.98], "ft_value": [1, 2, 3]})
+    assert len(grid) == 6 and {"decay_base": 0.98, "ft_value": 2} in grid
+
+    sample = random_settings({"bench_weight": (0.1, 0.3)}, samples=5, seed=1)
+    assert len(sample) == 5 and all(0.1 <= s["bench_weight"] <= 0.3 for s in sample)
+    assert sample == random_settings({"bench_weight": (0.1, 0.3)}, samples=5, seed=1)
+
+    with pytest.raises(ValueError, match="horizon"):
+        parameter_grid({"horizon": [3, 6]})
+
+
+def test_sweep_matches_separate_solves(league):
+    projections, squad, sell_prices = league
+    settings = parameter_grid({"threshold_value": [2.5, 0], "decay_base": [0.9, 0.98], "ft_value": [1, 4]})
+
+    pool = candidate_pool(projections, squad, sell_prices, 1.1, 5.0, OPTIONS, settings)
+    assert len(pool) == len(projections)
+    pool = candidate_pool(projections, squad, sell_prices, 1.1, 5.0, OPTIONS, settings[:4])
+    assert set(squad) <= set(pool["name"]) and len(pool) < len(projections)
+
+    table = run_sweep(settings, projections, squad, sell_prices, 1.1, 5.0, OPTIONS, max_workers=2)
+
+    assert list(table.columns[:3]) == ["decay_base", "ft_value", "threshold_value"]
+    assert table[["threshold_value", "decay_base", "ft_value"]].to_dict("records") == settings
+    assert table["error"].isna().all()
+    for setting, row in zip(settings, table.itertuples()):
+        result = solve_multi_period_NBA(
+            projections, squad, sell_prices, 1.1, 5.0, {**OPTIONS, **setting},
+        )["results"][0]
+        assert row.objective == pytest.approx(result["objective"], abs=0.01)
+        assert row.total_xp == pytest.approx(result["total_xp"], abs=0.01)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from conftest import BASE_OPTIONS  # noqa: E402
+from engine.highs_backend import solve_highs_inprocess  # noqa: E402
+from engine.matrix_model import build_matrix_model  # noqa: E402
+from engine.solution import PlanArrays, picks_frame  # noqa: E402
+from engine.solution_reader import ColumnOrder  # noqa: E402
+from solve import _build_sasoptpy_model, _read_solution, prepare_model_data  # noqa: E402
+
+highspy = pytest.importorskip("highspy")
+
+
+OPTIONS = {**BASE_OPTIONS, "horizon": 4, "ft_value": 10, "ft_increment": 2.5}
+
+
+def test_plan_arrays_match_per_variable_reads(league):
+    projections, squad, sell_prices = league
+    data = prepare_model_data(projections, squad, sell_prices, 1.2, 5.0, {**OPTIONS, "tm": 2})
+    h = build_matrix_model(data)
+    solve_highs_inprocess(h.model, {"gap": 0, "solver_output": False})
+
+    plan = PlanArrays.read(h, data)
+    for name in ("squad", "lineup", "transfer_in", "transfer_out"):
+        handle = getattr(h, name)
+        expected = [[handle[p, d].get_value() for d in data.gamedays] for p in data.players]
+        assert np.allclose(getattr(plan, name), expected)
+
+    codes = dict(zip(data.gameday_data["id"], data.gameday_data["code"].astype(float)))
+    picks = picks_frame(plan, data, codes)
+    assert (picks.groupby("gameday").size() >= 10).all()
+    assert picks["transfer_in"].sum() == round(plan.transfer_in.sum())
+
+
+def test_sasoptpy_plan_is_filled_from_the_solution_vector(league, tmp_path):
+    projections, squad, sell_prices = league
+    options = {**OPTIONS, "tm": 2, "wc_days": [1.3], "all_star_day": 2.2}
+    data = prepare_model_data(projections, squad, sell_prices, 1.2, 5.0, options)
+    h = _build_sasoptpy_model(data)
+    h.model.export_mps(str(tmp_path / "model.mps"))
+    solver = highspy.Highs()
+    solver.setOptionValue("output_flag", False)
+    solver.readModel(str(tmp_path / "model.mps"))
+    solver.run()
+    solver.writeSolution(str(tmp_path / "solution.txt"), 0)
+
+    order = ColumnOrder.of(h.model)
+    values = _read_solution(h.model, str(tmp_path / "solution.txt"), "highs", order)
+
+    from_vector = PlanArrays.read(h, data, order, values)
+    per_cell = PlanArrays.read(h, data)
+    for name in PlanArrays.__slots__:
+        assert np.allclose(getattr(from_vector, name), getattr(per_cell, name)), name
+    assert from_vector.squad.sum() == 10 * len(data.gamedays)
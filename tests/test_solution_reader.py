@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import gzip
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from engine.solution_reader import ColumnOrder, read_solution_values  # noqa: E402
+
+ORDER = ColumnOrder(pd.Index(["x[1]", "x[2]", "itb[1]"]), np.array([True, True, False]))
+
+
+def test_cbc_file_maps_names_to_column_order(tmp_path):
+    path = tmp_path / "sp.txt"
+    path.write_text(
+        "Stopped on time - objective value -12.5\n"
+        "      2 itb[1] 3.25 0\n"
+        "**    1 x[2] 1 0\n"
+        "      7 unknown 1 0\n"
+    )
+
+    assert read_solution_values(path, "cbc", ORDER).tolist() == [0.0, 1.0, 3.25]
+
+
+def test_gzipped_highs_file_is_read_and_rounded(tmp_path):
+    path = tmp_path / "sp.txt.gz"
+    with gzip.open(path, "wt") as f:
+        f.write(
+            "Model status\nOptimal\n\n# Primal solution values\nFeasible\nObjective -12.5\n"
+            "# Columns 3\nx[1] 0.9999999\nx[2] 1e-9\nitb[1] 3.14159\n# Rows 1\nc 1\n"
+        )
+
+    assert read_solution_values(path, "highs", ORDER).tolist() == [1.0, 0.0, 3.142]
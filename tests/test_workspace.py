@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from engine.matrix_model import MatrixModel  # noqa: E402
+from engine.workspace import SolverWorkspace, prune_artifacts  # noqa: E402
+
+
+def test_workspace_is_removed_unless_artifacts_are_kept(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    scratch = tmp_path / "scratch"
+
+    with SolverWorkspace("run", {"workspace_dir": str(scratch)}) as workspace:
+        Path(workspace.path("sp.txt")).write_text("x")
+        assert workspace.problem_path.endswith(".mps")
+    assert list(scratch.iterdir()) == []
+
+    with SolverWorkspace("run", {"workspace_dir": str(scratch), "keep_artifacts": True}) as workspace:
+        Path(workspace.path("sp.txt")).write_text("x")
+    kept = list((tmp_path / "solution_files").iterdir())
+    assert len(kept) == 1 and (kept[0] / "sp.txt").read_text() == "x"
+
+
+def test_prune_artifacts_drops_oldest_runs_over_the_cap(tmp_path):
+    for i, age in enumerate((300, 200, 100)):
+        run = tmp_path / f"run{i}"
+        run.mkdir()
+        (run / "model.mps").write_bytes(b"x" * 400_000)
+        os.utime(run, (1e9 - age, 1e9 - age))
+
+    prune_artifacts(tmp_path, max_mb=1)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["run1", "run2"]
+
+
+def test_compressed_mps_matches_plain_export(tmp_path):
+    highspy = pytest.importorskip("highspy")
+    model = MatrixModel("t")
+    x = model.add_variables(range(3), name="x", vartype="binary")
+    model.add_rows("pick_two", 1, [(0, x.cols(), 1.0)], upper=2)
+    model.set_objective(x.cols(), [-3.0, -1.0, -2.0])
+
+    objectives = []
+    for name in ("m.mps", "m.mps.gz"):
+        model.export_mps(str(tmp_path / name))
+        h = highspy.Highs()
+        h.setOptionValue("output_flag", False)
+        h.readModel(str(tmp_path / name))
+        h.run()
+        objectives.append(h.getInfo().objective_function_value)
+
+    assert objectives == [-5.0, -5.0]
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOLVER_SRC = REPO_ROOT / "public_solver" / "src"
+if str(SOLVER_SRC) not in sys.path:
+    sys.path.insert(0, str(SOLVER_SRC))
+
+from engine.xmins import back_to_back_pairs, decay_back_to_backs, points_from_minutes  # noqa: E402
+
+
+def test_back_to_backs_decay_rows_and_matrices_alike():
+    fixture_info = pd.DataFrame({
+        "id": [1, 2, 3, 4],
+        "deadline": ["2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z", "2025-01-03T00:00:00Z", "2025-01-05T00:00:00Z"],
+    })
+    pairs = back_to_back_pairs(fixture_info, ["1", "2", "3", "4"])
+    assert pairs == [(0, 1), (1, 2)]
+
+    minutes = np.array([[30.0, 30.0, 30.0, 30.0], [30.0, 0.0, 30.0, 30.0]])
+    decayed = decay_back_to_backs(minutes, pairs, (0.9, 0.8))
+    assert np.allclose(decayed[0], [27.0, 30 * 0.8 * 0.9, 24.0, 30.0])
+    assert np.allclose(decayed[1], minutes[1])
+    assert np.allclose(decay_back_to_backs(minutes[0], pairs, (0.9, 0.8)), decayed[0])
+    assert minutes[0, 0] == 30.0
+    assert np.allclose(points_from_minutes([36.0, 0.0], [18.0, 30.0]), [18.0, 0.0])